@@ -10,6 +10,8 @@ from pydantic import BaseModel
 from pyquotex.stable_api import Quotex
 from pyquotex.config import credentials as pq_credentials
 from pyquotex.utils.processor import process_candles, get_color
+from pyquotex.utils.store import CandleStore
+from pyquotex.utils.executor import create_executor
 
 logger = logging.getLogger("api")
 logging.basicConfig(
@@ -57,7 +59,16 @@ class QuotexService:
         if not email or not password:
             raise RuntimeError("Credentials not provided. Set PYQUOTEX_EMAIL and PYQUOTEX_PASSWORD or configure credentials().")
 
-        self.client = Quotex(email=email, password=password, lang="pt")
+        self.client = Quotex(
+            email=email,
+            password=password,
+            lang="pt",
+            candle_store=CandleStore(os.getenv("PYQUOTEX_CANDLE_STORE", "candles")),
+            executor=create_executor(
+                os.getenv("PYQUOTEX_ANALYTICS_EXECUTOR"),
+                os.getenv("PYQUOTEX_ANALYTICS_WORKERS")
+            )
+        )
         ok, reason = await self.client.connect()
         if not ok:
             # try once more after cleaning session if file exists
@@ -88,7 +99,7 @@ class QuotexService:
         if not candles:
             return []
         if not candles[0].get("open"):
-            candles = process_candles(candles, period)
+            candles = await self.client.run_analytics(process_candles, candles, period)
         # enrich with color and human-readable date/time
         for c in candles:
             c["asset"] = asset
@@ -0,0 +1,320 @@
+# benchmarks/indicators.py
+"""Benchmark the vectorized indicators against the former Python loops.
+
+Runs every indicator of :class:`TechnicalIndicators` and of the former
+loop-based implementation on 1k, 10k and 100k random-walk candles, and
+prints the best of ``--repeat`` timings and the speedup. It then times
+one 2-D (assets × time) pass of every registered kernel against a loop
+over ``--assets`` assets of ``--window`` candles.
+
+    PYTHONPATH=. python benchmarks/indicators.py
+"""
+import time
+import argparse
+import numpy as np
+from typing import List, Dict
+from pyquotex.utils.indicators import TechnicalIndicators, INDICATORS
+
+
+class NaiveIndicators:
+    """The former pure-Python loops, kept as the benchmark reference."""
+
+    @staticmethod
+    def calculate_sma(prices: List[float], period: int) -> List[float]:
+        """Calcula la Media Móvil Simple (SMA)"""
+        if len(prices) < period:
+            return []
+
+        sma_values = []
+        for i in range(len(prices) - period + 1):
+            sma = sum(prices[i:(i + period)]) / period
+            sma_values.append(round(sma, 2))
+        return sma_values
+
+    @staticmethod
+    def calculate_ema(prices: List[float], period: int) -> List[float]:
+        """Calcula la Media Móvil Exponencial (EMA)"""
+        if len(prices) < period:
+            return []
+
+        multiplier = 2 / (period + 1)
+        ema_values = [sum(prices[:period]) / period]
+
+        for price in prices[period:]:
+            ema = (price * multiplier) + (ema_values[-1] * (1 - multiplier))
+            ema_values.append(round(ema, 2))
+        return ema_values
+
+    @staticmethod
+    def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
+        """Calcula el Índice de Fuerza Relativa (RSI)"""
+        if len(prices) < period + 1:
+            return []
+
+        deltas = np.diff(prices)
+        gain = np.where(deltas > 0, deltas, 0)
+        loss = np.where(deltas < 0, -deltas, 0)
+
+        avg_gain = np.concatenate(([np.mean(gain[:period])], gain[period:]))
+        avg_loss = np.concatenate(([np.mean(loss[:period])], loss[period:]))
+
+        for i in range(1, len(avg_gain)):
+            avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[period + i - 1]) / period
+            avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[period + i - 1]) / period
+
+        rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
+        rsi = 100 - (100 / (1 + rs))
+        return [round(x, 2) for x in rsi.tolist()]
+
+    @staticmethod
+    def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> \
+    Dict[str, List[float]]:
+        """Calcula el MACD (Moving Average Convergence Divergence)"""
+        if len(prices) < slow_period:
+            return {"macd": [], "signal": [], "histogram": []}
+
+        fast_ema = NaiveIndicators.calculate_ema(prices, fast_period)
+        slow_ema = NaiveIndicators.calculate_ema(prices, slow_period)
+
+        macd_line = []
+        for i in range(len(slow_ema)):
+            macd = fast_ema[i + (len(fast_ema) - len(slow_ema))] - slow_ema[i]
+            macd_line.append(round(macd, 2))
+
+        signal_line = NaiveIndicators.calculate_ema(macd_line, signal_period)
+
+        histogram = []
+        for i in range(len(signal_line)):
+            hist = macd_line[i + (len(macd_line) - len(signal_line))] - signal_line[i]
+            histogram.append(round(hist, 2))
+
+        return {
+            "macd": macd_line,
+            "signal": signal_line,
+            "histogram": histogram,
+            "current": {
+                "macd": macd_line[-1] if macd_line else None,
+                "signal": signal_line[-1] if signal_line else None,
+                "histogram": histogram[-1] if histogram else None
+            }
+        }
+
+    @staticmethod
+    def calculate_bollinger_bands(prices: List[float], period: int = 20, num_std: float = 2) -> Dict[str, List[float]]:
+        """Calcula las Bandas de Bollinger"""
+        if len(prices) < period:
+            return {"upper": [], "middle": [], "lower": []}
+
+        sma = NaiveIndicators.calculate_sma(prices, period)
+        std = []
+
+        for i in range(len(prices) - period + 1):
+            window = prices[i:(i + period)]
+            std.append(np.std(window))
+
+        upper_band = [sma[i] + (std[i] * num_std) for i in range(len(sma))]
+        lower_band = [sma[i] - (std[i] * num_std) for i in range(len(sma))]
+
+        return {
+            "upper": [round(x, 2) for x in upper_band],
+            "middle": [round(x, 2) for x in sma],
+            "lower": [round(x, 2) for x in lower_band],
+            "current": {
+                "upper": upper_band[-1] if upper_band else None,
+                "middle": sma[-1] if sma else None,
+                "lower": lower_band[-1] if lower_band else None
+            }
+        }
+
+    @staticmethod
+    def calculate_stochastic(prices: List[float], highs: List[float], lows: List[float], k_period: int = 14,
+                             d_period: int = 3) -> Dict[str, List[float]]:
+        """Calcula el Oscilador Estocástico"""
+        if len(prices) < k_period:
+            return {"k": [], "d": []}
+
+        k_values = []
+
+        for i in range(len(prices) - k_period + 1):
+            window_high = max(highs[i:i + k_period])
+            window_low = min(lows[i:i + k_period])
+
+            if window_high == window_low:
+                k = 100
+            else:
+                k = ((prices[i + k_period - 1] - window_low) / (window_high - window_low)) * 100
+            k_values.append(round(k, 2))
+
+        d_values = NaiveIndicators.calculate_sma(k_values, d_period)
+
+        return {
+            "k": k_values,
+            "d": d_values,
+            "current": {
+                "k": k_values[-1] if k_values else None,
+                "d": d_values[-1] if d_values else None
+            }
+        }
+
+    @staticmethod
+    def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> List[float]:
+        """Calcula el Average True Range (ATR)"""
+        if len(highs) < period:
+            return []
+
+        true_ranges = []
+        for i in range(1, len(highs)):
+            high = highs[i]
+            low = lows[i]
+            prev_close = closes[i - 1]
+
+            tr1 = high - low
+            tr2 = abs(high - prev_close)
+            tr3 = abs(low - prev_close)
+
+            true_range = max(tr1, tr2, tr3)
+            true_ranges.append(true_range)
+
+        atr_values = [sum(true_ranges[:period]) / period]
+
+        for i in range(period, len(true_ranges)):
+            atr = (atr_values[-1] * (period - 1) + true_ranges[i]) / period
+            atr_values.append(round(atr, 2))
+
+        return atr_values
+
+    @staticmethod
+    def calculate_ichimoku(highs: List[float], lows: List[float],
+                           tenkan_period: int = 9,
+                           kijun_period: int = 26,
+                           senkou_b_period: int = 52) -> Dict[str, List[float]]:
+        """Calcula el Ichimoku Cloud"""
+        if len(highs) < senkou_b_period:
+            return {
+                "tenkan": [],
+                "kijun": [],
+                "senkou_a": [],
+                "senkou_b": [],
+                "chikou": []
+            }
+
+        def donchian(high_prices: List[float], low_prices: List[float], period: int) -> List[float]:
+            result = []
+            for i in range(len(high_prices) - period + 1):
+                highest = max(high_prices[i:i + period])
+                lowest = min(low_prices[i:i + period])
+                result.append((highest + lowest) / 2)
+            return result
+
+        # Cálculo de las líneas
+        tenkan = donchian(highs, lows, tenkan_period)
+        kijun = donchian(highs, lows, kijun_period)
+        senkou_b = donchian(highs, lows, senkou_b_period)
+
+        # Senkou Span A (Promedio de Tenkan y Kijun)
+        senkou_a = []
+        for i in range(min(len(tenkan), len(kijun))):
+            senkou_a.append((tenkan[i] + kijun[i]) / 2)
+
+        # Chikou Span (Precio de cierre desplazado 26 períodos hacia atrás)
+        chikou = lows[kijun_period:]
+
+        return {
+            "tenkan": [round(x, 2) for x in tenkan],
+            "kijun": [round(x, 2) for x in kijun],
+            "senkou_a": [round(x, 2) for x in senkou_a],
+            "senkou_b": [round(x, 2) for x in senkou_b],
+            "chikou": [round(x, 2) for x in chikou],
+            "current": {
+                "tenkan": tenkan[-1] if tenkan else None,
+                "kijun": kijun[-1] if kijun else None,
+                "senkou_a": senkou_a[-1] if senkou_a else None,
+                "senkou_b": senkou_b[-1] if senkou_b else None,
+                "chikou": chikou[-1] if chikou else None
+            }
+        }
+
+
+def make_candles(size, seed=1):
+    rng = np.random.default_rng(seed)
+    closes = 1.08 + np.cumsum(rng.normal(0, 0.0002, size))
+    highs = closes + rng.random(size) * 0.0003
+    lows = closes - rng.random(size) * 0.0003
+    return closes.tolist(), highs.tolist(), lows.tolist()
+
+
+def cases(impl, closes, highs, lows):
+    return {
+        "SMA": lambda: impl.calculate_sma(closes, 20),
+        "EMA": lambda: impl.calculate_ema(closes, 20),
+        "RSI": lambda: impl.calculate_rsi(closes, 14),
+        "MACD": lambda: impl.calculate_macd(closes),
+        "BOLLINGER": lambda: impl.calculate_bollinger_bands(closes, 20, 2),
+        "STOCHASTIC": lambda: impl.calculate_stochastic(closes, highs, lows),
+        "ATR": lambda: impl.calculate_atr(highs, lows, closes),
+        "ICHIMOKU": lambda: impl.calculate_ichimoku(highs, lows),
+    }
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def matrix_cases(assets, window):
+    rows = [make_candles(window, seed) for seed in range(assets)]
+    arrays = [
+        {"close": np.array(closes), "high": np.array(highs), "low": np.array(lows)}
+        for closes, highs, lows in rows
+    ]
+    matrix = {field: np.stack([data[field] for data in arrays]) for field in ("close", "high", "low")}
+
+    def loop():
+        for data in arrays:
+            for kernel, _, _ in INDICATORS.values():
+                kernel(data)
+
+    def vectorized():
+        for kernel, _, _ in INDICATORS.values():
+            kernel(matrix)
+
+    return loop, vectorized
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--assets", type=int, default=30)
+    parser.add_argument("--window", type=int, default=250)
+    args = parser.parse_args()
+
+    print(f"{'indicator':<12}{'candles':>9}{'loops ms':>12}{'numpy ms':>12}{'speedup':>10}")
+    for size in args.sizes:
+        closes, highs, lows = make_candles(size)
+        naive = cases(NaiveIndicators, closes, highs, lows)
+        fast = cases(TechnicalIndicators, closes, highs, lows)
+        for name in naive:
+            naive_time = best_of(naive[name], args.repeat)
+            fast_time = best_of(fast[name], args.repeat)
+            print(
+                f"{name:<12}{size:>9}{naive_time * 1e3:>12.2f}"
+                f"{fast_time * 1e3:>12.2f}{naive_time / fast_time:>9.1f}x"
+            )
+
+    loop, vectorized = matrix_cases(args.assets, args.window)
+    loop_time = best_of(loop, args.repeat)
+    matrix_time = best_of(vectorized, args.repeat)
+    print(
+        f"\nall indicators, {args.assets} assets x {args.window} candles: "
+        f"per-asset {loop_time * 1e3:.2f} ms, matrix {matrix_time * 1e3:.2f} ms "
+        f"({loop_time / matrix_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/loop_lag.py
+"""Measure event loop lag while analytics run inline or on a worker pool.
+
+Repeatedly builds candles from raw ticks with ``process_candles`` (pure
+Python) and evaluates every registered indicator on the result, first
+inline on the event loop and then through an :class:`AnalyticsExecutor`
+of threads and of processes. A :class:`LoopLagMonitor` probes the loop
+meanwhile; its lag is what websocket keepalives and order acks would see.
+
+    PYTHONPATH=. python benchmarks/loop_lag.py
+"""
+import time
+import asyncio
+import argparse
+import numpy as np
+from pyquotex.utils.processor import process_candles
+from pyquotex.utils.indicators import INDICATORS, candles_to_arrays, calculate_indicators
+from pyquotex.utils.executor import AnalyticsExecutor, LoopLagMonitor
+
+
+def make_ticks(size, seed=1):
+    rng = np.random.default_rng(seed)
+    prices = 1.08 + np.cumsum(rng.normal(0, 0.0002, size))
+    times = 1_700_000_000 + np.cumsum(rng.random(size) * 0.5)
+    return [[t, p, 0] for t, p in zip(times.tolist(), prices.tolist())]
+
+
+def analyze(ticks, period):
+    candles = process_candles(ticks, period)
+    for candle in candles:
+        candle["time"] = candle["start_time"]
+    return calculate_indicators(candles_to_arrays(candles), list(INDICATORS))
+
+
+async def run(mode, ticks, rounds, workers):
+    executor = None if mode == "inline" else AnalyticsExecutor(mode, workers)
+    monitor = LoopLagMonitor(interval=0.005)
+    monitor.start()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if executor is None:
+            analyze(ticks, 5)
+        else:
+            await executor.run(analyze, ticks, 5)
+        # Give the monitor a turn between rounds, as real order traffic would.
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    monitor.stop()
+    if executor is not None:
+        executor.shutdown()
+    return elapsed, monitor.get_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    ticks = make_ticks(args.ticks)
+    print(f"{'mode':<10}{'total s':>9}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for mode in ("inline", "thread", "process"):
+        elapsed, stats = asyncio.run(run(mode, ticks, args.rounds, args.workers))
+        print(
+            f"{mode:<10}{elapsed:>9.2f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/transport_latency.py
+"""Compare request/response latency of the thread and asyncio transports.
+
+Starts a local socket.io-like websocket server that answers every
+``42["bench"]`` frame with a binary ``bench`` event, the same two-part
+framing Quotex uses for ``quotes/stream``. Each round trip goes through
+the outbound send queue, the frame dispatcher and the request tracker,
+and is timed until the awaiting coroutine wakes up.
+
+Requires the optional ``websockets`` package (``pip install pyquotex[async]``).
+
+    PYTHONPATH=. python benchmarks/transport_latency.py --rounds 2000
+"""
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from websockets.asyncio.server import serve
+from pyquotex.api import QuotexAPI
+
+
+async def bench_server(wss):
+    async for message in wss:
+        if message.startswith('42["bench"'):
+            await wss.send('451-["bench",{"_placeholder":true,"num":0}]')
+            await wss.send(b"\x04" + json.dumps({"time": time.time()}).encode())
+
+
+async def run_transport(transport, port, rounds):
+    api = QuotexAPI("127.0.0.1", "bench", "bench", "en", transport=transport)
+    api.wss_url = f"ws://127.0.0.1:{port}/socket.io/?EIO=3&transport=websocket"
+    api.session_data = {"user_agent": "Quotex/1.0"}
+    api.state.ssid = "bench"
+    api.current_asset = "EURUSD"
+    api.current_period = 60
+    check, reason = await api.start_websocket()
+    if not check:
+        raise RuntimeError(reason)
+    api.websocket_client.dispatcher.register(
+        "bench",
+        lambda payload: api.pending_requests.resolve("bench", payload)
+    )
+
+    samples = []
+    for _ in range(rounds):
+        future = api.pending_requests.register("bench")
+        start = time.perf_counter_ns()
+        api.send_websocket_request('42["bench"]')
+        await api.pending_requests.wait("bench", future, 5)
+        samples.append((time.perf_counter_ns() - start) / 1e3)
+    await api.close()
+    return samples
+
+
+def report(transport, samples):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(
+        f"{transport:>8}: mean {statistics.mean(samples):8.1f} us  "
+        f"p50 {statistics.median(samples):8.1f} us  "
+        f"p99 {p99:8.1f} us  max {samples[-1]:8.1f} us"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    async with serve(bench_server, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        for transport in ("thread", "asyncio"):
+            samples = await run_transport(transport, port, args.rounds)
+            report(transport, samples)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -39,26 +39,19 @@ async def get_client():
     return client
 
 
-async def wait_for_signal_window(period: int = 60):
-    while True:
-        current_time = time_module.time()
-        seconds_into_candle = int(current_time % period)
-        
-        if SIGNAL_WINDOW_START <= seconds_into_candle <= SIGNAL_WINDOW_END:
-            return
-        
-        if seconds_into_candle < SIGNAL_WINDOW_START:
-            wait_time = SIGNAL_WINDOW_START - seconds_into_candle
-            await asyncio.sleep(wait_time)
-        else:
-            wait_time = period - seconds_into_candle + SIGNAL_WINDOW_START
-            await asyncio.sleep(wait_time)
+def seconds_into_candle(c, period: int = 60) -> int:
+    return int(c.get_server_timestamp() % period)
 
 
-async def is_in_signal_window(period: int = 60) -> bool:
-    current_time = time_module.time()
-    seconds_into_candle = int(current_time % period)
-    return SIGNAL_WINDOW_START <= seconds_into_candle <= SIGNAL_WINDOW_END
+async def wait_for_signal_window(c, asset: str, period: int = 60):
+    if await is_in_signal_window(c, period):
+        return
+    # Woken by the scheduler at SIGNAL_WINDOW_START on the server clock
+    await c.wait_bar(asset, period, offset=period - SIGNAL_WINDOW_START)
+
+
+async def is_in_signal_window(c, period: int = 60) -> bool:
+    return SIGNAL_WINDOW_START <= seconds_into_candle(c, period) <= SIGNAL_WINDOW_END
 
 
 async def get_running_candle_analysis(asset: str, period: int = 60):
@@ -118,7 +111,7 @@ async def get_running_candle_analysis(asset: str, period: int = 60):
             "is_indecision": is_indecision,
             "has_momentum": has_momentum,
             "body_strength": body_strength,
-            "seconds_into_candle": int(time_module.time() % period)
+            "seconds_into_candle": seconds_into_candle(client, period)
         }
         
     except Exception as e:
@@ -129,13 +122,14 @@ async def get_running_candle_analysis(asset: str, period: int = 60):
 async def analyze_running_candle(asset: str, timeframe: str = "M1"):
     try:
         period = TIMEFRAMES.get(timeframe.upper(), 60)
-        in_window = await is_in_signal_window(period)
+        c = await get_client()
+        in_window = await is_in_signal_window(c, period)
         
         if not in_window:
             return {
                 "status": "waiting",
                 "message": "Not in signal window (50-55 seconds)",
-                "seconds_into_candle": int(time_module.time() % period)
+                "seconds_into_candle": seconds_into_candle(c, period)
             }
         
         analysis = await get_running_candle_analysis(asset, period)
@@ -236,7 +230,7 @@ async def get_live_candle(asset: str, timeframe: str = "M1", wait_near_close: bo
         await asyncio.sleep(2)  # Wait for initial data
         
         if wait_near_close:
-            await wait_for_signal_window(period)
+            await wait_for_signal_window(c, asset_name, period)
         
         candle_price_data = await c.get_realtime_price(asset_name)
         
@@ -247,8 +241,7 @@ async def get_live_candle(asset: str, timeframe: str = "M1", wait_near_close: bo
             bd_time = datetime.fromtimestamp(timestamp, tz=BD_TZ)
             formatted_time = bd_time.strftime('%H:%M:%S')
             
-            current_time = time_module.time()
-            seconds_into_candle = int(current_time % period)
+            seconds = seconds_into_candle(c, period)
             
             return {
                 "asset": asset_name,
@@ -257,8 +250,8 @@ async def get_live_candle(asset: str, timeframe: str = "M1", wait_near_close: bo
                 "time": formatted_time,
                 "time_bd": bd_time.strftime('%Y-%m-%d %H:%M:%S %Z'),
                 "price": price,
-                "seconds_into_candle": seconds_into_candle,
-                "is_near_close": seconds_into_candle >= SIGNAL_WINDOW_START
+                "seconds_into_candle": seconds,
+                "is_near_close": seconds >= SIGNAL_WINDOW_START
             }
         
         return JSONResponse({"error": "No data available"}, status_code=404)
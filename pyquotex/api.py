@@ -11,12 +11,11 @@ import certifi
 import logging
 import platform
 import threading
-from . import global_value
 from .http.login import Login
 from .http.logout import Logout
 from .http.settings import Settings
 from .http.history import GetHistory
-from .http.navigator import Browser
+from .http.async_navigator import AsyncBrowser, HttpPool
 from .ws.channels.ssid import Ssid
 from .ws.channels.buy import Buy
 from .ws.channels.candles import GetCandles
@@ -25,7 +24,14 @@ from .ws.objects.timesync import TimeSync
 from .ws.objects.candles import Candles
 from .ws.objects.profile import Profile
 from .ws.objects.listinfodata import ListInfoData
+from .ws.objects.connection import ConnectionState
 from .ws.client import WebsocketClient
+from .ws.async_client import AsyncWebsocketClient
+from .ws.sender import SendQueue, AsyncSendQueue, ORDER_FRAME_TTL
+from .ws.correlation import RequestTracker
+from . import expiration
+from .utils.buffers import RingBuffer, TICK_DTYPE
+from .utils.instruments import InstrumentCatalog
 from collections import defaultdict
 
 urllib3.disable_warnings()
@@ -52,26 +58,6 @@ def nested_dict(n, type):
 
 class QuotexAPI(object):
     """Class for communication with Quotex API."""
-    socket_option_opened = {}
-    buy_id = None
-    pending_id = None
-    trace_ws = False
-    buy_expiration = None
-    current_asset = None
-    current_period = None
-    buy_successful = None
-    pending_successful = None
-    account_balance = None
-    account_type = None
-    instruments = None
-    training_balance_edit_request = None
-    profit_in_operation = None
-    sold_options_respond = None
-    sold_digital_options_respond = None
-    listinfodata = ListInfoData()
-    timesync = TimeSync()
-    candles = Candles()
-    profile = Profile()
 
     def __init__(
             self,
@@ -81,7 +67,11 @@ class QuotexAPI(object):
             lang,
             proxies=None,
             resource_path=None,
-            user_data_dir="."
+            user_data_dir=".",
+            transport="thread",
+            http_limit=100,
+            http_limit_per_host=10,
+            http_pool=None
     ):
         """
         :param str host: The hostname or ip address of a Quotex server.
@@ -90,6 +80,15 @@ class QuotexAPI(object):
         :param str lang: The lang of a Quotex platform.
         :param proxies: The proxies of a Quotex server.
         :param user_data_dir: The path browser user data dir.
+        :param str transport: ``"thread"`` runs websocket-client in a daemon
+            thread, ``"asyncio"`` runs the connection inside the event loop
+            (requires the ``websockets`` package).
+        :param int http_limit: Connections kept by the shared http pool.
+        :param int http_limit_per_host: Concurrent http requests and
+            connections per broker host.
+        :param http_pool: (optional) The :class:`HttpPool
+            <pyquotex.http.async_navigator.HttpPool>` of a previous session,
+            to keep its connections across a reconnect.
         """
         self.host = host
         self.https_url = f"https://{host}"
@@ -108,20 +107,71 @@ class QuotexAPI(object):
         self.user_data_dir = user_data_dir
         self.proxies = proxies
         self.lang = lang
+        self.state = ConnectionState()
+        self.socket_option_opened = {}
+        self.buy_id = None
+        self.pending_id = None
+        self.trace_ws = False
+        self.buy_expiration = None
+        self.current_asset = None
+        self.current_period = None
+        self.buy_successful = None
+        self.pending_successful = None
+        self.account_balance = None
+        self.account_type = None
+        self.instruments = None
+        self.instrument_catalog = InstrumentCatalog()
+        self.training_balance_edit_request = None
+        self.profit_in_operation = None
+        self.sold_options_respond = None
+        self.sold_digital_options_respond = None
+        self.listinfodata = ListInfoData()
+        self.timesync = TimeSync()
+        self.candles = Candles()
+        self.profile = Profile()
+        self.profile_ttl = 300
+        self.profile_time = None
+        self.time_offset = None
         self.settings_list = {}
         self.signal_data = {}
         self.get_candle_data = {}
         self.historical_candles = {}
         self.candle_v2_data = {}
         self.realtime_price = {}
-        self.realtime_price_data = []
+        self.buffer_capacity = 1000
+        self.asset_buffer_capacity = {}
+        self.sentiment_history = {}
+        self.aggregator = None
         self.realtime_candles = {}
         self.realtime_sentiment = {}
+        # Streams to restore after a reconnect: asset -> period, followed assets.
+        self.subscriptions = {}
+        self.followed_assets = set()
+        self.signals_subscribed = False
         self.top_list_leader = {}
         self.session_data = {}
-        self.browser = Browser()
+        # Every http resource of the client sends over this one pool.
+        self.http_pool = http_pool or HttpPool(limit=http_limit, limit_per_host=http_limit_per_host)
+        self.browser = AsyncBrowser(pool=self.http_pool)
         self.browser.set_headers()
         self.settings = Settings(self)
+        if transport not in ("thread", "asyncio"):
+            raise ValueError(f"Unknown websocket transport: {transport}")
+        self.transport = transport
+        if transport == "asyncio":
+            self.send_queue = AsyncSendQueue(self.write_websocket_async)
+        else:
+            self.send_queue = SendQueue(self.write_websocket)
+        self.pending_requests = RequestTracker()
+        self.last_request_id = 0
+
+    def next_request_id(self):
+        """Get a unique request id based on the current timestamp.
+
+        :returns: A timestamp-like integer that is never reused by this client.
+        """
+        self.last_request_id = max(expiration.get_timestamp(), self.last_request_id + 1)
+        return self.last_request_id
 
     @property
     def websocket(self):
@@ -131,9 +181,33 @@ class QuotexAPI(object):
         """
         return self.websocket_client.wss
 
+    def set_buffer_capacity(self, capacity, asset=None):
+        """Set how many stream rows are kept per asset.
+
+        Buffers already in use are resized and keep their newest rows.
+
+        :param int capacity: Rows kept in each ring buffer.
+        :param str asset: (optional) Only apply to this asset.
+        """
+        if asset is None:
+            self.buffer_capacity = capacity
+        else:
+            self.asset_buffer_capacity[asset] = capacity
+        for buffers in (self.realtime_price, self.sentiment_history):
+            for name, buffer in list(buffers.items()):
+                size = self.asset_buffer_capacity.get(name, self.buffer_capacity)
+                if buffer.capacity != size:
+                    buffers[name] = buffer.resized(size)
+
+    def create_buffer(self, asset, dtype=TICK_DTYPE):
+        """Create a ring buffer with the capacity configured for an asset."""
+        return RingBuffer(self.asset_buffer_capacity.get(asset, self.buffer_capacity), dtype)
+
     def subscribe_realtime_candle(self, asset, period):
-        self.realtime_price[asset] = []
+        if asset not in self.realtime_price:
+            self.realtime_price[asset] = self.create_buffer(asset)
         self.realtime_candles[asset] = {}
+        self.subscriptions[asset] = period
         payload = {
             "asset": asset,
             "period": period
@@ -150,10 +224,12 @@ class QuotexAPI(object):
         return self.send_websocket_request(data)
 
     def follow_candle(self, asset):
+        self.followed_assets.add(asset)
         data = f'42["depth/follow", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
     def unfollow_candle(self, asset):
+        self.followed_assets.discard(asset)
         data = f'42["depth/unfollow", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
@@ -197,6 +273,7 @@ class QuotexAPI(object):
         self.send_websocket_request(data)
 
     def unsubscribe_realtime_candle(self, asset):
+        self.subscriptions.pop(asset, None)
         data = f'42["subfor", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
@@ -205,11 +282,27 @@ class QuotexAPI(object):
         self.send_websocket_request(data)
 
     def signals_subscribe(self):
+        self.signals_subscribed = True
         data = f'42["signal/subscribe"]'
         self.send_websocket_request(data)
 
+    def resubscribe(self):
+        """Send the subscriptions of the previous connection again.
+
+        Called by the websocket clients on every open; the server forgets
+        the streams of a dropped connection.
+        """
+        for asset, period in list(self.subscriptions.items()):
+            self.subscribe_realtime_candle(asset, period)
+            self.chart_notification(asset)
+        for asset in list(self.followed_assets):
+            self.follow_candle(asset)
+        if self.signals_subscribed:
+            self.signals_subscribe()
+
     def change_account(self, account_type):
         self.account_type = account_type
+        self.invalidate_profile()
         payload = {
             "demo": self.account_type,
             "tournamentId": 0
@@ -240,7 +333,7 @@ class QuotexAPI(object):
         print(data)
         # 42["pending/create",{"openType":0,"asset":"AUDCAD_otc","openTime":"2025-04-01T20:09:00.000Z","timeframe":60,"command":"call","amount":50}]
         # 42["pending/create",{"openType":0,"asset":"EURUSD_otc","openTime":"2025-04-01T20:11:00.000Z","timeframe":60,"command":"call","amount":5}]
-        self.send_websocket_request(data)
+        self.send_websocket_request(data, ttl=ORDER_FRAME_TTL)
 
     def instruments_follow(
             self,
@@ -342,7 +435,7 @@ class QuotexAPI(object):
         """
         return GetHistory(self)
 
-    def send_http_request_v1(
+    async def send_http_request_v1(
             self,
             resource,
             method,
@@ -358,7 +451,9 @@ class QuotexAPI(object):
         :param dict data: (optional) The http request data.
         :param dict params: (optional) The http request params.
         :param dict headers: (optional) The http request headers.
-        :returns: The instance of :class:`Response <requests.Response>`.
+        :returns: The instance of :class:`AsyncResponse
+            <pyquotex.http.async_navigator.AsyncResponse>`, ``None`` on an
+            http error.
         """
         url = resource.url
         logger.debug(url)
@@ -384,7 +479,7 @@ class QuotexAPI(object):
         self.browser.headers["Sec-Fetch-Dest"] = "document"
         self.browser.headers["Sec-Fetch-Mode"] = "navigate"
         self.browser.headers["Dnt"] = "1"
-        response = self.browser.send_request(
+        response = await self.browser.send_request(
             method=method,
             url=url,
             data=data,
@@ -396,8 +491,20 @@ class QuotexAPI(object):
             return None
         return response
 
-    async def get_profile(self):
-        user_settings = self.settings.get_settings()
+    async def get_profile(self, max_age=None):
+        """Get the trader profile, cached for ``profile_ttl`` seconds.
+
+        The cache is invalidated by balance and account websocket events,
+        so balances are fresh after a trade without a request per order.
+
+        :param max_age: (optional) Seconds a cached profile may be old,
+            ``0`` always fetches it.
+        :returns: The :class:`Profile <pyquotex.ws.objects.profile.Profile>`.
+        """
+        max_age = self.profile_ttl if max_age is None else max_age
+        if self.profile_time is not None and time.monotonic() - self.profile_time < max_age:
+            return self.profile
+        user_settings = await self.settings.get_settings()
         self.profile.nick_name = user_settings.get("data")["nickname"]
         self.profile.profile_id = user_settings.get("data")["id"]
         self.profile.demo_balance = float(user_settings.get("data").get("demoBalance", 0))
@@ -408,29 +515,63 @@ class QuotexAPI(object):
         self.profile.country_name = user_settings.get("data")["countryName"]
         self.profile.currency_symbol = user_settings.get("data")["currencySymbol"]
         self.profile.offset = user_settings.get("data").get("timeOffset")
+        self.time_offset = self.profile.offset
+        self.profile_time = time.monotonic()
         return self.profile
 
+    def invalidate_profile(self):
+        """Fetch the profile again on the next :meth:`get_profile`."""
+        self.profile_time = None
+
+    async def get_time_offset(self):
+        """Get the trader time offset in seconds.
+
+        It only changes through :meth:`change_time_offset`, so it is fetched
+        once with the profile and then served from memory.
+        """
+        if self.time_offset is None:
+            await self.get_profile()
+        return self.time_offset
+
     async def get_trader_history(self, account_type, page_number):
         history = await self.get_history(account_type, page_number)
         return history.get("data", {})
 
-    def change_time_offset(self, time_offset):
-        user_settings = self.settings.set_time_offset(time_offset)
+    async def change_time_offset(self, time_offset):
+        user_settings = await self.settings.set_time_offset(time_offset)
         self.profile.offset = user_settings.get("data").get("timeOffset")
+        self.time_offset = self.profile.offset
         return self.profile
 
-    def send_websocket_request(self, data, no_force_send=True):
+    def send_websocket_request(self, data, no_force_send=True, ttl=None):
         """Send websocket request to Quotex server.
+
+        The frame is appended to the outbound queue and written by its
+        single writer thread, so callers never wait on the socket.
+
         :param str data: The websocket request data.
-        :param bool no_force_send: Default None.
+        :param bool no_force_send: Kept for compatibility, frames are
+            always queued.
+        :param ttl: (optional) Seconds the frame may wait for the
+            connection before it is dropped.
+        """
+        self.send_queue.put(data, ttl=ttl)
+
+    def write_websocket(self, data):
+        """Write a frame to the current websocket connection.
+        :param str data: The websocket frame.
         """
-        while (global_value.ssl_Mutual_exclusion
-               or global_value.ssl_Mutual_exclusion_write) and no_force_send:
-            pass
-        global_value.ssl_Mutual_exclusion_write = True
         self.websocket.send(data)
-        logger.debug(data)
-        global_value.ssl_Mutual_exclusion_write = False
+
+    async def write_websocket_async(self, data):
+        """Write a frame to the current asyncio websocket connection.
+        :param str data: The websocket frame.
+        """
+        await self.websocket_client.send(data)
+
+    def get_send_stats(self):
+        """Get enqueue latency and time-to-wire of outbound frames."""
+        return self.send_queue.get_stats()
 
     async def authenticate(self):
         print("Connecting User Account ...")
@@ -446,17 +587,25 @@ class QuotexAPI(object):
         if not status:
             sys.exit(1)
 
-        global_value.SSID = self.session_data.get("token")
+        self.state.ssid = self.session_data.get("token")
 
         self.is_logged = True
 
     async def start_websocket(self):
-        global_value.check_websocket_if_connect = None
-        global_value.check_websocket_if_error = False
-        global_value.websocket_error_reason = None
-        if not global_value.SSID:
+        self.state.reset()
+        if not self.state.ssid:
             await self.authenticate()
-        self.websocket_client = WebsocketClient(self)
+        if self.transport == "asyncio":
+            self.websocket_client = AsyncWebsocketClient(self)
+            self.send_queue.start()
+            self.websocket_client.start(ssl_context, ping_interval=24, reconnect=5)
+        else:
+            self.websocket_client = WebsocketClient(self)
+            self.send_queue.start()
+            self.start_websocket_thread()
+        return await self.wait_websocket()
+
+    def start_websocket_thread(self):
         payload = {
             "suppress_origin": True,    # CloudFlare handshake status 403 forbidden fix
             "ping_interval": 24,
@@ -480,54 +629,56 @@ class QuotexAPI(object):
         )
         self.websocket_thread.daemon = True
         self.websocket_thread.start()
+
+    async def wait_websocket(self):
+        state = self.state
         while True:
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-            elif global_value.check_websocket_if_connect == 0:
+            if state.check_websocket_if_error:
+                return False, state.websocket_error_reason
+            elif state.check_websocket_if_connect == 0:
                 logger.debug("Websocket connection closed.")
                 return False, "Websocket connection closed."
-            elif global_value.check_websocket_if_connect == 1:
+            elif state.check_websocket_if_connect == 1:
                 logger.debug("Websocket connected successfully!!!")
                 return True, "Websocket connected successfully!!!"
-            elif global_value.check_rejected_connection == 1:
-                global_value.SSID = None
+            elif state.check_rejected_connection == 1:
+                state.ssid = None
                 logger.debug("Websocket Token Rejected.")
                 return True, "Websocket Token Rejected."
+            await asyncio.sleep(0.05)
 
-    def send_ssid(self, timeout=10):
+    async def send_ssid(self, timeout=10):
         self.wss_message = None
-        if not global_value.SSID:
+        if not self.state.ssid:
             return False
 
-        self.ssid(global_value.SSID)
+        self.ssid(self.state.ssid)
         start_time = time.time()
 
         while self.wss_message is None:
             if time.time() - start_time > timeout:
                 return False
-            time.sleep(0.5)
+            await asyncio.sleep(0.2)
 
         return True
 
     async def connect(self, is_demo):
         """Method for connection to Quotex API."""
         self.account_type = is_demo
-        global_value.ssl_Mutual_exclusion = False
-        global_value.ssl_Mutual_exclusion_write = False
-        if global_value.check_websocket_if_connect:
+        if self.state.check_websocket_if_connect:
             logger.info("Closing websocket connection...")
-            await self.close()
+            await self.disconnect()
 
         check_websocket, websocket_reason = await self.start_websocket()
 
         if not check_websocket:
             return check_websocket, websocket_reason
-        check_ssid = self.send_ssid()
+        check_ssid = await self.send_ssid()
 
         if not check_ssid:
             await self.authenticate()
             if self.is_logged:
-                self.send_ssid()
+                await self.send_ssid()
 
         return check_websocket, websocket_reason
 
@@ -536,12 +687,24 @@ class QuotexAPI(object):
         logger.info("Websocket Reconnection...")
         await self.start_websocket()
 
-    async def close(self):
-        if self.websocket_client:
+    async def disconnect(self):
+        """Close the websocket and its send queue, keeping the http pool."""
+        if self.transport == "asyncio":
+            if self.websocket_client:
+                await self.websocket_client.close()
+        elif self.websocket_client:
             self.websocket.close()
             await asyncio.sleep(1)
             self.websocket_thread.join()
+        self.send_queue.stop()
+        return True
+
+    async def close(self):
+        await self.disconnect()
+        await self.http_pool.close()
         return True
 
     def websocket_alive(self):
+        if self.transport == "asyncio":
+            return self.websocket_client.task is not None and not self.websocket_client.task.done()
         return self.websocket_thread.is_alive()
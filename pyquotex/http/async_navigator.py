@@ -0,0 +1,329 @@
+"""Module for the asyncio Quotex http client."""
+import ssl
+import json
+import asyncio
+import logging
+from urllib.parse import urlsplit
+from requests.exceptions import HTTPError
+from requests.structures import CaseInsensitiveDict
+from bs4 import BeautifulSoup
+from .navigator import Browser, retry_strategy
+
+logger = logging.getLogger(__name__)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def create_ssl_context(cipher_suite, ecdh_curve="prime256v1"):
+    """The TLS settings of :class:`CipherSuiteAdapter
+    <pyquotex.http.navigator.CipherSuiteAdapter>`, for aiohttp connectors."""
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    context.set_ciphers(cipher_suite)
+    context.set_ecdh_curve(ecdh_curve)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.maximum_version = ssl.TLSVersion.TLSv1_3
+    return context
+
+
+class AsyncResponse(object):
+    """A fully read response with the parts of :class:`requests.Response`
+    the http resources use."""
+
+    def __init__(self, method, url, status_code, headers, content, encoding=None):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    def __bool__(self):
+        return self.ok
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class HttpPool(object):
+    """One pooled http transport shared by the resources of a client.
+
+    Holds a single SSL context with the cipher suite, ECDH curve and TLS
+    version bounds of :class:`CipherSuiteAdapter
+    <pyquotex.http.navigator.CipherSuiteAdapter>` and keeps connections to
+    the broker hosts alive between requests. With the optional ``aiohttp``
+    package requests run on the event loop over a pooled keep-alive
+    connector; without it they run on a :class:`Browser
+    <pyquotex.http.navigator.Browser>` in a worker thread, so the loop never
+    blocks either way. Concurrent requests are limited per host and both
+    backends retry like :data:`retry_strategy <pyquotex.http.navigator.retry_strategy>`.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Accepts the keyword arguments of :class:`Browser
+        <pyquotex.http.navigator.Browser>`, plus:
+
+        :param int limit: Connections in the pool.
+        :param int limit_per_host: Concurrent requests and connections per host.
+        :param float keepalive_timeout: Seconds an idle connection is kept.
+        """
+        self.ecdhCurve = kwargs.pop('ecdhCurve', 'prime256v1')
+        self.cipherSuite = kwargs.pop('cipherSuite', 'DEFAULT@SECLEVEL=1')
+        self.source_address = kwargs.pop('source_address', None)
+        self.server_hostname = kwargs.pop('server_hostname', None)
+        self.ssl_context = kwargs.pop('ssl_context', None)
+        self.proxies = kwargs.pop('proxies', None)
+        self.debug = kwargs.pop('debug', False)
+        self.limit = kwargs.pop('limit', 100)
+        self.limit_per_host = kwargs.pop('limit_per_host', 10)
+        self.keepalive_timeout = kwargs.pop('keepalive_timeout', 30)
+        self.session = None
+        self.browser = None
+        self.host_limits = {}
+        self.requests = 0
+        self.connections = 0
+        self.reused = 0
+        if aiohttp is not None:
+            if self.ssl_context is None:
+                self.ssl_context = create_ssl_context(self.cipherSuite, self.ecdhCurve)
+        else:
+            self.browser = Browser(
+                ecdhCurve=self.ecdhCurve,
+                cipherSuite=self.cipherSuite,
+                source_address=self.source_address,
+                server_hostname=self.server_hostname,
+                ssl_context=self.ssl_context,
+                proxies=self.proxies,
+                debug=self.debug,
+                pool_connections=self.limit,
+                pool_maxsize=self.limit_per_host
+            )
+
+    @property
+    def backend(self):
+        return "requests" if self.browser is not None else "aiohttp"
+
+    def get_session(self):
+        if self.session is None or self.session.closed:
+            source_address = self.source_address
+            if isinstance(source_address, str):
+                source_address = (source_address, 0)
+            connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                local_addr=source_address
+            )
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self.on_connection_create)
+            trace.on_connection_reuseconn.append(self.on_connection_reuse)
+            self.session = aiohttp.ClientSession(connector=connector, trace_configs=[trace])
+        return self.session
+
+    async def on_connection_create(self, session, context, params):
+        self.connections += 1
+
+    async def on_connection_reuse(self, session, context, params):
+        self.reused += 1
+
+    def get_cookies(self):
+        if self.browser is not None:
+            return self.browser.get_cookies()
+        if self.session is None:
+            return ""
+        return '; '.join(f'{i.key}={i.value}' for i in self.session.cookie_jar)
+
+    def clear_cookies(self):
+        if self.browser is not None:
+            self.browser.cookies.clear()
+        elif self.session is not None:
+            self.session.cookie_jar.clear()
+
+    def host_limit(self, url):
+        host = urlsplit(url).netloc
+        limit = self.host_limits.get(host)
+        if limit is None:
+            limit = self.host_limits[host] = asyncio.Semaphore(self.limit_per_host)
+        return limit
+
+    async def send(self, method, url, headers, **kwargs):
+        """Send a request.
+
+        :returns: The response, read in full.
+        """
+        self.requests += 1
+        async with self.host_limit(url):
+            if self.browser is not None:
+                return await asyncio.to_thread(
+                    self.browser.send_request,
+                    method,
+                    url,
+                    headers=headers,
+                    **kwargs
+                )
+            return await self.request(method, url, headers, **kwargs)
+
+    async def request(self, method, url, headers, **kwargs):
+        session = self.get_session()
+        proxies = kwargs.pop('proxies', None) or self.proxies
+        if proxies:
+            kwargs['proxy'] = proxies.get(urlsplit(url).scheme)
+        if self.server_hostname:
+            kwargs['server_hostname'] = self.server_hostname
+        attempt = 0
+        while True:
+            try:
+                async with session.request(method, url, headers=dict(headers), **kwargs) as response:
+                    content = await response.read()
+                    if response.status in retry_strategy.status_forcelist and attempt < retry_strategy.total:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status
+                        )
+                    return AsyncResponse(
+                        method,
+                        str(response.url),
+                        response.status,
+                        CaseInsensitiveDict(response.headers),
+                        content,
+                        response.charset
+                    )
+            except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError):
+                if attempt >= retry_strategy.total:
+                    raise
+                attempt += 1
+                await asyncio.sleep(retry_strategy.backoff_factor * 2 ** (attempt - 1))
+
+    def get_stats(self):
+        """Get the requests sent and how often a connection was reused.
+
+        :returns: A dict with the ``backend``, ``requests``, new
+            ``connections``, ``reused`` connections and ``reuse_rate``, the
+            share of connection checkouts served by a kept-alive connection.
+        """
+        if self.browser is not None:
+            # urllib3 counts connections and requests per host pool.
+            self.connections = 0
+            requests_sent = 0
+            for adapter in self.browser.adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools[key]
+                    self.connections += pool.num_connections
+                    requests_sent += pool.num_requests
+            self.reused = max(requests_sent - self.connections, 0)
+        checkouts = self.connections + self.reused
+        return {
+            "backend": self.backend,
+            "requests": self.requests,
+            "connections": self.connections,
+            "reused": self.reused,
+            "reuse_rate": self.reused / checkouts if checkouts else 0.0
+        }
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.browser is not None:
+            self.browser.close()
+
+
+class AsyncBrowser(object):
+    """Awaitable counterpart of :class:`Browser <pyquotex.http.navigator.Browser>`.
+
+    Keeps its own headers and last response, like the requests client, and
+    sends over an :class:`HttpPool`. Resources of a client pass the pool of
+    their :class:`QuotexAPI <pyquotex.api.QuotexAPI>`, so they share one SSL
+    context and its kept-alive connections; without a pool the browser
+    creates and owns one.
+    """
+
+    def __init__(self, *args, pool=None, **kwargs):
+        """
+        :param pool: (optional) The shared :class:`HttpPool`; when omitted
+            the keyword arguments create one.
+        """
+        self.response = None
+        self.default_headers = None
+        self.owns_pool = pool is None
+        self.pool = pool if pool is not None else HttpPool(**kwargs)
+        self.debug = self.pool.debug
+        self.headers = CaseInsensitiveDict(self.get_headers())
+        if self.debug:
+            logger.setLevel(logging.DEBUG)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def get_headers(self):
+        self.default_headers = {
+            "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) "
+                          "Gecko/20100101 Firefox/119.0"
+        }
+        return self.default_headers
+
+    def set_headers(self, headers=None):
+        self.headers.update(self.default_headers)
+        if headers:
+            self.headers.update(headers)
+
+    def get_cookies(self):
+        return self.pool.get_cookies()
+
+    def get_soup(self):
+        if not self.response:
+            raise RuntimeError("No response stored. Use send_request() first.")
+        return BeautifulSoup(self.response.content, "html.parser")
+
+    def get_json(self):
+        if not self.response:
+            raise RuntimeError("No response stored.")
+        try:
+            return self.response.json()
+        except Exception:
+            return None
+
+    async def send_request(self, method, url, headers=None, **kwargs):
+        # Resources assign plain dicts, so names may repeat in another case.
+        merged_headers = CaseInsensitiveDict(self.headers)
+        if headers:
+            merged_headers.update(headers)
+
+        self.response = await self.pool.send(method, url, merged_headers, **kwargs)
+
+        if self.debug:
+            logger.debug(f"→ {method} {url}")
+            logger.debug(f"Status: {self.response.status_code}")
+            logger.debug(f"Headers enviados: {dict(merged_headers)}")
+            logger.debug(f"Headers recebidos: {dict(self.response.headers)}")
+            logger.debug(f"Cookies: {self.get_cookies()}")
+            content_preview = self.response.text[:250].strip().replace('\n', '')
+            logger.debug(f"Body (preview): {content_preview} [...]")
+
+        return self.response
+
+    async def close(self):
+        """Close the pool, unless it is shared."""
+        if self.owns_pool:
+            await self.pool.close()
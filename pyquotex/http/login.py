@@ -3,10 +3,10 @@ import json
 import sys
 import asyncio
 from pathlib import Path
-from pyquotex.http.navigator import Browser
+from pyquotex.http.async_navigator import AsyncBrowser
 
 
-class Login(Browser):
+class Login(AsyncBrowser):
     """Class for Quotex login resource."""
 
     url = ""
@@ -17,13 +17,13 @@ class Login(Browser):
     https_base_url = f'https://{base_url}'
 
     def __init__(self, api, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, pool=api.http_pool, **kwargs)
         self.api = api
         self.html = None
         self.headers = self.get_headers()
         self.full_url = f"{self.https_base_url}/{api.lang}"
 
-    def get_token(self):
+    async def get_token(self):
         self.headers["Connection"] = "keep-alive"
         self.headers["Accept-Encoding"] = "gzip, deflate, br"
         self.headers["Accept-Language"] = "pt-BR,pt;q=0.8,en-US;q=0.5,en;q=0.3"
@@ -40,7 +40,7 @@ class Login(Browser):
         self.headers["Sec-Fetch-Dest"] = "document"
         self.headers["Sec-Fetch-Mode"] = "navigate"
         self.headers["Dnt"] = "1"
-        self.send_request(
+        await self.send_request(
             "GET",
             f"{self.full_url}/sign-in/modal/"
         )
@@ -66,14 +66,14 @@ class Login(Browser):
             sys.exit()
 
         await asyncio.sleep(1)
-        self.send_request(
+        await self.send_request(
             method="POST",
             url=f"{self.full_url}/sign-in/modal",
             data=data
         )
 
-    def get_profile(self):
-        self.response = self.send_request(
+    async def get_profile(self):
+        self.response = await self.send_request(
             method="GET",
             url=f"{self.full_url}/trade"
         )
@@ -169,17 +169,18 @@ class Login(Browser):
 
         return None, None
 
-    def _get(self):
-        return self.send_request(
+    async def _get(self):
+        return await self.send_request(
             method="GET",
             url=f"f{self.full_url}/trade"
         )
 
     async def _post(self, data):
         """Send get request for Quotex API login http resource.
-        :returns: The instance of :class:`requests.Response`.
+        :returns: The instance of :class:`AsyncResponse
+            <pyquotex.http.async_navigator.AsyncResponse>`.
         """
-        self.response = self.send_request(
+        self.response = await self.send_request(
             method="POST",
             url=f"{self.full_url}/sign-in/",
             data=data
@@ -220,8 +221,10 @@ class Login(Browser):
         :param str user_data_dir: The optional value for path userdata.
         :returns: The instance of :class:`requests.Response`.
         """
+        # The pool outlives reconnects; start from a clean session.
+        self.pool.clear_cookies()
         data = {
-            "_token": self.get_token(),
+            "_token": await self.get_token(),
             "email": username,
             "password": password,
             "remember": 1,
@@ -232,6 +235,6 @@ class Login(Browser):
             print(msg)
             exit(0)
 
-        self.get_profile()
+        await self.get_profile()
 
         return status, msg
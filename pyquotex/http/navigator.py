@@ -89,6 +89,8 @@ class Browser(Session):
         self.ssl_context = kwargs.pop('ssl_context', None)
         self.proxies = kwargs.pop('proxies', None)
         self.debug = kwargs.pop('debug', False)
+        self.pool_connections = kwargs.pop('pool_connections', 10)
+        self.pool_maxsize = kwargs.pop('pool_maxsize', 10)
 
         super().__init__(*args, **kwargs)
 
@@ -102,7 +104,9 @@ class Browser(Session):
                 server_hostname=self.server_hostname,
                 source_address=self.source_address,
                 ssl_context=self.ssl_context,
-                max_retries=retry_strategy
+                max_retries=retry_strategy,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize
             )
         )
 
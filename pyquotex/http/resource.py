@@ -13,15 +13,16 @@ class Resource(object):
         """
         self.api = api
 
-    def send_http_request(self, method, data=None, params=None, headers=None):
+    async def send_http_request(self, method, data=None, params=None, headers=None):
         """Send http request to Quotex API.
         :param str method: The http request method.
         :param dict data: (optional) The http request data.
         :param dict params: (optional) The http request params.
         :param dict headers: (optional) The http request headers.
-        :returns: The instance of :class:`requests.Response`.
+        :returns: The instance of :class:`AsyncResponse
+            <pyquotex.http.async_navigator.AsyncResponse>`.
         """
-        return self.api.send_http_request_v1(
+        return await self.api.send_http_request_v1(
             self,
             method,
             data=data,
@@ -1,17 +1,19 @@
+import os
 import time
 import logging
 import asyncio
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from . import expiration
-from . import global_value
 from .api import QuotexAPI
 from .utils.services import truncate
 from .utils.processor import (
     calculate_candles,
     process_candles_v2,
     merge_candles,
-    process_tick,
-    aggregate_candle
+    aggregate_candle,
+    build_candles,
+    build_history_candles
 )
 from .config import (
     load_session,
@@ -19,7 +21,13 @@ from .config import (
     resource_path,
     credentials
 )
-from .utils.indicators import TechnicalIndicators
+from .utils.indicators import candles_to_arrays, candles_to_matrix, calculate_indicators, parse_spec
+from .utils.cache import IndicatorCache
+from .utils.streaming import create_streaming_indicator, seed_streaming_indicator
+from .utils.backfill import Backfill, find_gaps
+from .utils.aggregator import CandleAggregator
+from .utils.executor import LoopLagMonitor
+from .utils.scheduler import BarScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +43,12 @@ class Quotex:
             root_path=".",
             user_data_dir="browser",
             asset_default="EURUSD",
-            period_default=60
+            period_default=60,
+            transport="thread",
+            candle_store=None,
+            executor=None,
+            http_limit=100,
+            http_limit_per_host=10
     ):
         self.size = [
             5,
@@ -60,6 +73,24 @@ class Quotex:
         self.user_data_dir = user_data_dir
         self.asset_default = asset_default
         self.period_default = period_default
+        self.transport = transport
+        self.http_limit = http_limit
+        self.http_limit_per_host = http_limit_per_host
+        self.candle_store = candle_store
+        # One writer thread keeps candle store appends in order and off
+        # the websocket thread and the event loop.
+        self.store_writer = None
+        if candle_store is not None:
+            self.store_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyquotex-candle-store")
+        self.aggregator = CandleAggregator(self.size)
+        self.indicator_cache = IndicatorCache()
+        self.executor = executor
+        self.loop_lag = LoopLagMonitor()
+        self.scheduler = BarScheduler(clock=self.get_server_timestamp)
+        self.aggregator.add_callback(self.indicator_cache.invalidate)
+        self.aggregator.add_callback(self.scheduler.on_candle_close)
+        if candle_store is not None:
+            self.aggregator.add_callback(self.store_closed_candle)
         self.subscribe_candle = []
         self.subscribe_candle_all_size = []
         self.subscribe_mood = []
@@ -84,10 +115,9 @@ class Quotex:
         """
         return self.websocket_client.wss
 
-    @staticmethod
-    async def check_connect():
+    async def check_connect(self):
         await asyncio.sleep(2)
-        if global_value.check_accepted_connection == 1:
+        if self.api and self.api.state.check_accepted_connection == 1:
             return True
 
         return False
@@ -118,14 +148,18 @@ class Quotex:
         except:
             pass
 
-    async def get_instruments(self):
-        while self.check_connect and self.api.instruments is None:
-            await asyncio.sleep(0.2)
+    async def get_instruments(self, timeout: float = 30):
+        if self.api.instruments is None:
+            future = self.api.pending_requests.register("instruments")
+            try:
+                await self.api.pending_requests.wait("instruments", future, timeout)
+            except asyncio.TimeoutError:
+                logger.debug("Timed out waiting for instruments/list.")
         return self.api.instruments or []
 
     def get_all_asset_name(self):
-        if self.api.instruments:
-            return [[i[1], i[2].replace("\n", "")] for i in self.api.instruments]
+        if self.api.instrument_catalog:
+            return [[i.symbol, i.name] for i in self.api.instrument_catalog]
 
     async def get_available_asset(self, asset_name: str, force_open: bool = False):
         _, asset_open = await self.check_asset_open(asset_name)
@@ -138,97 +172,285 @@ class Quotex:
         return asset_name, asset_open
 
     async def check_asset_open(self, asset_name: str):
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if asset_name == i[1]:
-                self.api.current_asset = asset_name
-                return i, (i[0], i[2].replace("\n", ""), i[14])
+        await self.get_instruments()
+        i = self.api.instrument_catalog.get(asset_name)
+        if i is not None:
+            self.api.current_asset = asset_name
+            return i.raw, (i.id, i.name, i.is_open)
 
         return [None, [None, None, None]]
 
+    def add_instrument_callback(self, callback):
+        """Call ``callback(change)`` whenever an instrument is added, removed,
+        opens, closes or changes its payout.
+
+        The callback gets an :class:`InstrumentChange <pyquotex.utils.instruments.InstrumentChange>`,
+        runs on the websocket thread and must not block.
+        """
+        self.api.instrument_catalog.add_callback(callback)
+
+    def remove_instrument_callback(self, callback):
+        self.api.instrument_catalog.remove_callback(callback)
+
+    async def wait_instrument_change(self, asset_name: str = None, timeout: float = None):
+        """Wait for the next instrument change.
+
+        Args:
+            asset_name (str, optional): Only changes of this asset.
+            timeout (float, optional): Seconds to wait. Defaults to forever.
+
+        Returns:
+            InstrumentChange: ``kind`` is ``"added"``, ``"removed"``, ``"opened"``,
+            ``"closed"`` or ``"payout_changed"``, with the ``old`` and ``new`` instrument.
+        """
+        return await self.api.instrument_catalog.wait_change(asset_name, timeout)
+
     async def get_all_assets(self):
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if i[0] != "":
-                self.codes_asset[i[1]] = i[0]
+        await self.get_instruments()
+        for i in self.api.instrument_catalog:
+            if i.id != "":
+                self.codes_asset[i.symbol] = i.id
 
         return self.codes_asset
 
-    async def get_candles(self, asset, end_from_time, offset, period, progressive=False):
+    async def get_open_assets(self):
+        """Get the assets open for trading.
+
+        Returns:
+            list: :class:`Instrument <pyquotex.utils.instruments.Instrument>` tuples.
+        """
+        await self.get_instruments()
+        return self.api.instrument_catalog.get_open()
+
+    async def get_assets_by_payout(self, timeframe: str = "1", open_only: bool = True, n: int = None):
+        """Get assets sorted by payout, highest first.
+
+        Args:
+            timeframe (str, optional): ``"1"``, ``"5"`` (minutes) or ``"24H"``. Defaults to "1".
+            open_only (bool, optional): Skip assets closed for trading. Defaults to True.
+            n (int, optional): Only the first ``n`` assets.
+
+        Returns:
+            list: :class:`Instrument <pyquotex.utils.instruments.Instrument>` tuples.
+        """
+        await self.get_instruments()
+        return self.api.instrument_catalog.get_by_payout(timeframe, open_only, n)
+
+    async def get_candles(self, asset, end_from_time, offset, period, progressive=False, timeout=20):
         if end_from_time is None:
             end_from_time = time.time()
-        index = expiration.get_timestamp()
-        self.api.candles.candles_data = None
+        if self.candle_store is not None and not progressive:
+            return await self.get_stored_candles(asset, end_from_time, offset, period, timeout)
+        return await self.fetch_candles(asset, end_from_time, offset, period, progressive, timeout)
+
+    async def fetch_candles(self, asset, end_from_time, offset, period, progressive=False, timeout=20):
+        """Fetch candles from the server, bypassing the candle store."""
+        index = self.api.next_request_id()
+        pending = self.api.pending_requests
+        if progressive:
+            kind, future = "history", pending.register("history", index)
+        else:
+            kind, future = "candles", pending.register("candles", (asset, period))
         self.start_candles_stream(asset, period)
         self.api.get_candles(asset, index, end_from_time, offset, period)
-        while True:
-            while self.check_connect and self.api.candles.candles_data is None:
-                await asyncio.sleep(0.1)
-            if self.api.candles.candles_data is not None:
-                break
-
-        candles = self.prepare_candles(asset, period)
+        try:
+            response = await pending.wait(kind, future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out waiting for {asset} candles.")
+            return []
 
         if progressive:
-            return self.api.historical_candles.get("data", {})
+            return response.get("data", {})
 
-        return candles
+        return await self.run_analytics(build_candles, asset, period, response)
+
+    async def load_candles(self, asset, end_from_time, offset, period, timeout=20):
+        """Load one window of candles with a ``history/load`` request.
 
-    async def get_history_line(self, asset, end_from_time, offset):
+        The reply is matched to this request by its ``index``, so any
+        number of windows of the same asset and period can be in flight.
+
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End timestamp of the window.
+            offset (int): Length of the window in seconds.
+            period (int): Candle period in seconds.
+            timeout (float, optional): Seconds to wait for the reply.
+
+        Returns:
+            list: Candles of the reply, oldest first, ``[]`` on a timeout.
+        """
+        index = self.api.next_request_id()
+        pending = self.api.pending_requests
+        future = pending.register("history", index)
+        self.api.get_candles(asset, index, end_from_time, offset, period)
+        try:
+            response = await pending.wait("history", future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out waiting for {asset} history window.")
+            return []
+        return await self.run_analytics(build_history_candles, response, period)
+
+    async def get_stored_candles(self, asset, end_from_time, offset, period, timeout=20):
+        """Serve candles from the candle store, fetching only what is missing.
+
+        Missing ranges are the head, holes between stored candles and the
+        tail of the range. The live tail is fetched with the recent
+        candles of :meth:`fetch_candles`, older ranges with ``history/load``
+        windows through :class:`Backfill <pyquotex.utils.backfill.Backfill>`.
+        Only candles closed on the server clock are stored.
+
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End timestamp of the range.
+            offset (int): Length of the range in seconds.
+            period (int): Candle period in seconds.
+            timeout (float, optional): Seconds to wait for each server response.
+
+        Returns:
+            list: Closed candles of the range, oldest first.
+        """
+        store = self.candle_store
+        start = int(end_from_time - offset)
+        closed = int(min(end_from_time, self.get_server_timestamp()))
+        # Start of the first bar that has not closed yet.
+        live = closed // period * period
+        backfill = Backfill(
+            self,
+            timeout=timeout,
+            checkpoint_dir=os.path.join(store.root, "checkpoints")
+        )
+        self.start_candles_stream(asset, period)
+        stored = store.get(asset, period, start, end_from_time)
+        for missing_start, missing_end in find_gaps(stored, period, start, closed):
+            if missing_end - missing_start < period:
+                continue
+            recent = missing_start >= live - period * backfill.window_candles
+            if missing_end == live and recent:
+                candles = await self.fetch_candles(
+                    asset,
+                    missing_end,
+                    missing_end - missing_start,
+                    period,
+                    timeout=timeout
+                )
+            else:
+                result = await backfill.fetch(asset, missing_start, missing_end, period)
+                candles = result["candles"]
+            await asyncio.get_running_loop().run_in_executor(
+                self.store_writer,
+                store.append,
+                asset,
+                period,
+                [c for c in candles if missing_start <= c["time"] and c["time"] + period <= closed]
+            )
+        return store.get(asset, period, start, end_from_time)
+
+    async def get_candles_many(
+            self,
+            assets: list,
+            period: int,
+            offset: int,
+            end_from_time: float = None,
+            concurrency: int = 10,
+            timeout: float = 20
+    ):
+        """Fetch historical candles of several assets concurrently.
+
+        Args:
+            assets (list): Asset names to fetch.
+            period (int): Candle period in seconds.
+            offset (int): Time interval in seconds to fetch for each asset.
+            end_from_time (float, optional): End timestamp. Defaults to now.
+            concurrency (int, optional): Maximum requests in flight. Defaults to 10.
+            timeout (float, optional): Seconds to wait for each response. Defaults to 20.
+
+        Returns:
+            dict: Candles keyed by asset name, ``[]`` for assets that timed out.
+        """
         if end_from_time is None:
             end_from_time = time.time()
-        index = expiration.get_timestamp()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(asset):
+            async with semaphore:
+                return await self.get_candles(asset, end_from_time, offset, period, timeout=timeout)
+
+        results = await asyncio.gather(*(fetch(asset) for asset in assets))
+        return dict(zip(assets, results))
+
+    async def get_history_line(self, asset, end_from_time, offset, timeout=20):
+        if end_from_time is None:
+            end_from_time = time.time()
+        index = self.api.next_request_id()
         self.api.current_asset = asset
-        self.api.historical_candles = None
+        future = self.api.pending_requests.register("history", index)
         self.start_candles_stream(asset)
         self.api.get_history_line(self.codes_asset[asset], index, end_from_time, offset)
-        while True:
-            while self.check_connect and self.api.historical_candles is None:
-                await asyncio.sleep(0.2)
-            if self.api.historical_candles is not None:
-                break
-        return self.api.historical_candles
+        try:
+            return await self.api.pending_requests.wait("history", future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out waiting for {asset} history line.")
+            return None
 
-    async def get_candle_v2(self, asset, period):
-        self.api.candle_v2_data[asset] = None
+    async def get_candle_v2(self, asset, period, timeout=20):
+        future = self.api.pending_requests.register("candles", (asset, period))
         self.start_candles_stream(asset, period)
-        while self.api.candle_v2_data[asset] is None:
-            await asyncio.sleep(0.2)
-        candles = self.prepare_candles(asset, period)
+        try:
+            response = await self.api.pending_requests.wait("candles", future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out waiting for {asset} candles.")
+            return []
+        candles = self.prepare_candles(asset, period, response)
         return candles
 
-    def prepare_candles(self, asset: str, period: int):
+    def prepare_candles(self, asset: str, period: int, response: dict = None):
         """
         Prepare candles data for a specified asset.
 
         Args:
             asset (str): Asset name.
             period (int): Period for fetching candles.
+            response (dict, optional): The ``history/list/v2`` response to
+                build from. Defaults to the last response received.
 
         Returns:
             list: List of prepared candles data.
         """
-        candles_data = calculate_candles(self.api.candles.candles_data, period)
-        candles_v2_data = process_candles_v2(self.api.candle_v2_data, asset, candles_data)
+        if response is not None:
+            return build_candles(asset, period, response)
+        history = self.api.candles.candles_data
+        candles_v2 = self.api.candle_v2_data
+        candles_data = calculate_candles(history, period)
+        candles_v2_data = process_candles_v2(candles_v2, asset, candles_data)
         new_candles = merge_candles(candles_v2_data)
 
         return new_candles
 
     async def connect(self):
+        previous = self.api
         self.api = QuotexAPI(
             "qxbroker.com",
             self.email,
             self.password,
             self.lang,
             resource_path=self.resource_path,
-            user_data_dir=self.user_data_dir
+            user_data_dir=self.user_data_dir,
+            transport=self.transport,
+            http_limit=self.http_limit,
+            http_limit_per_host=self.http_limit_per_host,
+            http_pool=previous.http_pool if previous else None
         )
-        await self.close()
+        # Only the transport: the scheduler and the http pool are kept
+        # across reconnects and closed by close().
+        if previous is not None:
+            await previous.disconnect()
         self.api.trace_ws = self.debug_ws_enable
         self.api.session_data = self.session_data
         self.api.current_asset = self.asset_default
         self.api.current_period = self.period_default
-        global_value.SSID = self.session_data.get("token")
+        self.api.aggregator = self.aggregator
+        self.api.state.ssid = self.session_data.get("token")
 
         if not self.session_data.get("token"):
             await self.api.authenticate()
@@ -259,21 +481,33 @@ class Quotex:
         self.account_is_demo = 0 if balance_mode.upper() == "REAL" else 1
         self.api.change_account(self.account_is_demo)
 
-    def change_time_offset(self, time_offset):
-        return self.api.change_time_offset(time_offset)
+    async def change_time_offset(self, time_offset):
+        return await self.api.change_time_offset(time_offset)
 
-    async def edit_practice_balance(self, amount=None):
-        self.api.training_balance_edit_request = None
+    async def edit_practice_balance(self, amount=None, timeout=10):
+        future = self.api.pending_requests.register("demo/refill")
         self.api.edit_training_balance(amount)
-        while self.api.training_balance_edit_request is None:
-            await asyncio.sleep(0.2)
-        return self.api.training_balance_edit_request
-
-    async def get_balance(self):
-        while self.api.account_balance is None:
-            await asyncio.sleep(0.2)
-        balance = self.api.account_balance.get("demoBalance") \
-            if self.api.account_type > 0 else self.api.account_balance.get("liveBalance")
+        try:
+            return await self.api.pending_requests.wait("demo/refill", future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out waiting for the practice balance refill.")
+            return None
+
+    async def get_balance(self, timeout=20):
+        if self.api.account_balance is None:
+            future = self.api.pending_requests.register("balance")
+            try:
+                await self.api.pending_requests.wait("balance", future, timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out waiting for the balance, using the last known one.")
+        if self.api.account_balance is not None:
+            balance = self.api.account_balance.get("demoBalance") \
+                if self.api.account_type > 0 else self.api.account_balance.get("liveBalance")
+        else:
+            profile = self.api.profile
+            balance = profile.demo_balance if self.api.account_type > 0 else profile.live_balance
+        if balance is None:
+            return None
         return float(f"{truncate(balance + self.get_profit(), 2):.2f}")
 
     # Agregar al archivo stable_api.py dentro de la clase Quotex
@@ -303,6 +537,38 @@ class Quotex:
                 - 14400: 4 horas
                 - 86400: 1 día
         """
+        spec = {"indicator": indicator, "params": params, "key": "result"}
+        results = await self.calculate_indicators(asset, timeframe, [spec], history_size)
+        return results.get("result", results)
+
+    async def calculate_indicators(
+            self, asset: str,
+            timeframe: int = 60,
+            specs: list = None,
+            history_size: int = 3600,
+            use_cache: bool = True
+    ) -> dict:
+        """
+        Calcula varios indicadores con una sola descarga de velas
+
+        Las velas se piden una vez y se convierten a arrays una vez; todos
+        los indicadores se calculan sobre esos arrays. Los resultados se
+        guardan en ``self.indicator_cache`` hasta que cierra la siguiente
+        vela, y solo los indicadores que no están en caché piden velas.
+
+        Args:
+            asset (str): Nombre del activo (ej: "EURUSD")
+            timeframe (int): Temporalidad en segundos, como en calculate_indicator
+            specs (list): Indicadores a calcular. Cada uno es un nombre
+                ("RSI") o un dict {"indicator": "RSI", "params": {...},
+                "key": "rsi_7"}; "key" es opcional y por defecto es el nombre.
+            history_size (int): Tamaño del histórico en segundos
+            use_cache (bool): Usar la caché de resultados
+
+        Returns:
+            dict: Resultado de cada indicador por su clave, o {"error": ...}.
+            Los resultados en caché se comparten; no modificar sus listas.
+        """
         # Validar timeframe
         valid_timeframes = [60, 300, 900, 1800, 3600, 7200, 14400, 86400]
         if timeframe not in valid_timeframes:
@@ -311,121 +577,98 @@ class Quotex:
         # Ajustar history_size para asegurar suficientes velas según el timeframe
         adjusted_history = max(history_size, timeframe * 50)  # Asegurar al menos 50 velas
 
-        candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe)
-
-        if not candles:
-            return {"error": f"No hay datos disponibles para el activo {asset}"}
-
-        prices = [float(candle["close"]) for candle in candles]
-        highs = [float(candle["high"]) for candle in candles]
-        lows = [float(candle["low"]) for candle in candles]
-        timestamps = [candle["time"] for candle in candles]
+        # Última vela cerrada en el reloj del servidor: los resultados valen
+        # hasta que cierre la siguiente
+        now = self.get_server_timestamp()
+        candle_time = int(now // timeframe * timeframe) - timeframe
+        cache = self.indicator_cache
+        results = {}
+        pending = []
+        for spec in specs or []:
+            name, key, params = parse_spec(spec)
+            if key in results:
+                return {"error": f"Clave de indicador duplicada: '{key}'"}
+            cache_key = cache.make_key(asset, timeframe, name, params, adjusted_history, candle_time)
+            cached = cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                results[key] = dict(cached)
+            else:
+                results[key] = None
+                pending.append((spec, key, cache_key))
 
-        indicators = TechnicalIndicators()
-        indicator = indicator.upper()
+        if pending:
+            candles = await self.get_candles(asset, now, adjusted_history, timeframe)
 
-        try:
-            # RSI
-            if indicator == "RSI":
-                period = params.get("period", 14)
-                values = indicators.calculate_rsi(prices, period)
-                return {
-                    "rsi": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
+            if not candles:
+                return {"error": f"No hay datos disponibles para el activo {asset}"}
 
-            # MACD
-            elif indicator == "MACD":
-                fast_period = params.get("fast_period", 12)
-                slow_period = params.get("slow_period", 26)
-                signal_period = params.get("signal_period", 9)
-                macd_data = indicators.calculate_macd(prices, fast_period, slow_period, signal_period)
-                macd_data["timeframe"] = timeframe
-                macd_data["timestamps"] = timestamps[-len(macd_data["macd"]):] if macd_data["macd"] else []
-                return macd_data
-
-            # SMA
-            elif indicator == "SMA":
-                period = params.get("period", 20)
-                values = indicators.calculate_sma(prices, period)
-                return {
-                    "sma": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
+            try:
+                computed = await self.run_analytics(
+                    calculate_indicators,
+                    candles_to_arrays(candles),
+                    [spec for spec, _, _ in pending]
+                )
+            except Exception as e:
+                return {"error": f"Error calculando el indicador: {str(e)}"}
+
+            for _, key, cache_key in pending:
+                result = computed[key]
+                if "error" not in result:
+                    result["timeframe"] = timeframe
+                    if use_cache:
+                        cache.put(cache_key, result)
+                        result = dict(result)
+                results[key] = result
+        return results
+
+    async def calculate_indicators_many(
+            self, assets: list,
+            timeframe: int = 60,
+            specs: list = None,
+            history_size: int = 3600
+    ) -> dict:
+        """
+        Calcula los mismos indicadores para varios activos en una pasada
 
-            # EMA
-            elif indicator == "EMA":
-                period = params.get("period", 20)
-                values = indicators.calculate_ema(prices, period)
-                return {
-                    "ema": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
+        Las velas se piden en paralelo y se apilan en una matriz activos ×
+        tiempo, así cada indicador es una sola llamada vectorizada para
+        todos los activos.
 
-            # BOLLINGER
-            elif indicator == "BOLLINGER":
-                period = params.get("period", 20)
-                num_std = params.get("std", 2)
-                bb_data = indicators.calculate_bollinger_bands(prices, period, num_std)
-                bb_data["timeframe"] = timeframe
-                bb_data["timestamps"] = timestamps[-len(bb_data["middle"]):] if bb_data["middle"] else []
-                return bb_data
-
-            # STOCHASTIC
-            elif indicator == "STOCHASTIC":
-                k_period = params.get("k_period", 14)
-                d_period = params.get("d_period", 3)
-                stoch_data = indicators.calculate_stochastic(prices, highs, lows, k_period, d_period)
-                stoch_data["timeframe"] = timeframe
-                stoch_data["timestamps"] = timestamps[-len(stoch_data["k"]):] if stoch_data["k"] else []
-                return stoch_data
-
-            # ATR
-            elif indicator == "ATR":
-                period = params.get("period", 14)
-                values = indicators.calculate_atr(highs, lows, prices, period)
-                return {
-                    "atr": values,
-                    "current": values[-1] if values else None,
-                    "history_size": len(values),
-                    "timeframe": timeframe,
-                    "timestamps": timestamps[-len(values):] if values else []
-                }
+        Args:
+            assets (list): Nombres de los activos
+            timeframe (int): Temporalidad en segundos, como en calculate_indicator
+            specs (list): Indicadores a calcular, como en calculate_indicators
+            history_size (int): Tamaño del histórico en segundos
 
-            # ADX
-            elif indicator == "ADX":
-                period = params.get("period", 14)
-                adx_data = indicators.calculate_adx(highs, lows, prices, period)
-                adx_data["timeframe"] = timeframe
-                adx_data["timestamps"] = timestamps[-len(adx_data["adx"]):] if adx_data["adx"] else []
-                return adx_data
-
-            # ICHIMOKU
-            elif indicator == "ICHIMOKU":
-                tenkan_period = params.get("tenkan_period", 9)
-                kijun_period = params.get("kijun_period", 26)
-                senkou_b_period = params.get("senkou_b_period", 52)
-                ichimoku_data = indicators.calculate_ichimoku(highs, lows, tenkan_period, kijun_period, senkou_b_period)
-                ichimoku_data["timeframe"] = timeframe
-                ichimoku_data["timestamps"] = timestamps[-len(ichimoku_data["tenkan"]):] if ichimoku_data[
-                    "tenkan"] else []
-                return ichimoku_data
+        Returns:
+            dict: {activo: {clave: resultado}}. Los activos sin velas, o con
+            menos velas que la mediana del resto, devuelven {"error": ...}.
+        """
+        valid_timeframes = [60, 300, 900, 1800, 3600, 7200, 14400, 86400]
+        if timeframe not in valid_timeframes:
+            return {"error": f"Timeframe no válido. Valores permitidos: {valid_timeframes}"}
 
-            else:
-                return {"error": f"Indicador '{indicator}' no soportado"}
+        adjusted_history = max(history_size, timeframe * 50)
+        candles = await self.get_candles_many(assets, timeframe, adjusted_history)
 
+        names, data = candles_to_matrix(candles)
+        try:
+            results = await self.run_analytics(calculate_indicators, data, specs or [], names)
         except Exception as e:
             return {"error": f"Error calculando el indicador: {str(e)}"}
 
+        for asset in assets:
+            if asset not in results:
+                if candles.get(asset):
+                    results[asset] = {"error": f"Histórico insuficiente para el activo {asset}"}
+                else:
+                    results[asset] = {"error": f"No hay datos disponibles para el activo {asset}"}
+                continue
+            for result in results[asset].values():
+                if "error" not in result:
+                    result["timeframe"] = timeframe
+        return results
+
     async def subscribe_indicator(
             self, asset: str,
             indicator: str,
@@ -436,11 +679,14 @@ class Quotex:
         """
         Suscribe a actualizaciones en tiempo real de un indicador
 
+        El indicador se inicializa una sola vez con el histórico y luego se
+        actualiza en O(1) con cada vela cerrada del stream de ticks.
+
         Args:
             asset (str): Nombre del activo
             indicator (str): Nombre del indicador
             params (dict): Parámetros del indicador
-            callback (callable): Función que se llamará con cada actualización
+            callback (callable): Función que se llamará con cada vela cerrada
             timeframe (int): Temporalidad en segundos
         """
         if not callback:
@@ -451,131 +697,58 @@ class Quotex:
         if timeframe not in valid_timeframes:
             raise ValueError(f"Timeframe no válido. Valores permitidos: {valid_timeframes}")
 
+        stream = create_streaming_indicator(indicator, params)
+
         try:
-            # Iniciar stream de velas
-            self.start_candles_stream(asset, timeframe)
+            # Inicializar el indicador con el histórico
+            history = await self.get_candles(
+                asset,
+                time.time(),
+                timeframe * stream.warmup * 3,
+                timeframe
+            )
+            # La última vela puede estar aún abierta: su cierre llega del stream.
+            now = self.get_server_timestamp()
+            history = [candle for candle in history or [] if candle["time"] + timeframe <= now]
+            stream = await self.run_analytics(seed_streaming_indicator, stream, history)
+            last_time = history[-1]["time"] if history else 0
+
+            # Las velas cerradas llegan desde el agregador de ticks
+            self.subscribe_realtime_candles(asset)
 
             while True:
                 try:
-                    # Obtener velas en tiempo real
-                    real_time_candles = await self.get_realtime_candles(asset, timeframe)
-
-                    if real_time_candles:
-                        # Convertir el diccionario a lista ordenada por tiempo
-                        candles_list = sorted(real_time_candles.items(), key=lambda x: x[0])
-
-                        # Extraer datos de las velas
-                        prices = [float(candle[1]["close"]) for candle in candles_list]
-                        highs = [float(candle[1]["high"]) for candle in candles_list]
-                        lows = [float(candle[1]["low"]) for candle in candles_list]
-
-                        # Asegurar que tenemos suficientes datos
-                        min_periods = {
-                            "RSI": 14,
-                            "MACD": 26,
-                            "BOLLINGER": 20,
-                            "STOCHASTIC": 14,
-                            "ADX": 14,
-                            "ATR": 14,
-                            "SMA": 20,
-                            "EMA": 20,
-                            "ICHIMOKU": 52
-                        }
-
-                        required_periods = min_periods.get(indicator.upper(), 14)
-                        if len(prices) < required_periods:
-                            # Si no hay suficientes datos, obtener histórico
-                            historical_candles = await self.get_candles(
-                                asset,
-                                time.time(),
-                                timeframe * required_periods * 2,  # Doble del período requerido
-                                timeframe
-                            )
-                            if historical_candles:
-                                # Combinar datos históricos con tiempo real
-                                prices = [float(candle["close"]) for candle in historical_candles] + prices
-                                highs = [float(candle["high"]) for candle in historical_candles] + highs
-                                lows = [float(candle["low"]) for candle in historical_candles] + lows
-
-                        indicators = TechnicalIndicators()
-                        indicator = indicator.upper()
-
-                        # Calcular el indicador con los datos actualizados
-                        result = {
-                            "time": candles_list[-1][0],
-                            "timeframe": timeframe,
-                            "asset": asset
-                        }
-
-                        if indicator == "RSI":
-                            period = params.get("period", 14)
-                            values = indicators.calculate_rsi(prices, period)
-                            result["value"] = values[-1] if values else None
-                            result["all_values"] = values
-                            result["indicator"] = "RSI"
-
-                        elif indicator == "MACD":
-                            fast_period = params.get("fast_period", 12)
-                            slow_period = params.get("slow_period", 26)
-                            signal_period = params.get("signal_period", 9)
-                            macd_data = indicators.calculate_macd(prices, fast_period, slow_period, signal_period)
-                            result["value"] = macd_data["current"]
-                            result["all_values"] = macd_data
-                            result["indicator"] = "MACD"
-
-                        # BOLLINGER
-                        elif indicator == "BOLLINGER":
-                            period = params.get("period", 20)
-                            num_std = params.get("std", 2)
-                            bb_data = indicators.calculate_bollinger_bands(prices, period, num_std)
-                            result["value"] = bb_data["current"]
-                            result["all_values"] = bb_data
-
-                        # STOCHASTIC
-                        elif indicator == "STOCHASTIC":
-                            k_period = params.get("k_period", 14)
-                            d_period = params.get("d_period", 3)
-                            stoch_data = indicators.calculate_stochastic(prices, highs, lows, k_period, d_period)
-                            result["value"] = stoch_data["current"]
-                            result["all_values"] = stoch_data
-
-                        # ADX
-                        elif indicator == "ADX":
-                            period = params.get("period", 14)
-                            adx_data = indicators.calculate_adx(highs, lows, prices, period)
-                            result["value"] = adx_data["current"]
-                            result["all_values"] = adx_data
-
-                        # ATR
-                        elif indicator == "ATR":
-                            period = params.get("period", 14)
-                            values = indicators.calculate_atr(highs, lows, prices, period)
-                            result["value"] = values[-1] if values else None
-                            result["all_values"] = values
-
-                        # ICHIMOKU
-                        elif indicator == "ICHIMOKU":
-                            tenkan_period = params.get("tenkan_period", 9)
-                            kijun_period = params.get("kijun_period", 26)
-                            senkou_b_period = params.get("senkou_b_period", 52)
-                            ichimoku_data = indicators.calculate_ichimoku(highs, lows, tenkan_period, kijun_period,
-                                                                          senkou_b_period)
-                            result["value"] = ichimoku_data["current"]
-                            result["all_values"] = ichimoku_data
-
-                        else:
-                            result["error"] = f"Indicador '{indicator}' no soportado para tiempo real"
-
-                        # Llamar al callback con el resultado
-                        await callback(result)
-
-                    await asyncio.sleep(1)  # Esperar 1 segundo entre actualizaciones
-
+                    bar = await self.wait_candle_close(asset, timeframe)
+                    if bar["time"] <= last_time:
+                        continue
+
+                    if last_time and bar["time"] > last_time + timeframe:
+                        # Recuperar las velas perdidas (p. ej. tras una reconexión)
+                        missing = await self.get_candles(
+                            asset,
+                            bar["time"],
+                            bar["time"] - last_time,
+                            timeframe
+                        )
+                        for candle in missing or []:
+                            if last_time < candle["time"] < bar["time"]:
+                                stream.update(candle)
+
+                    value = stream.update(bar)
+                    last_time = bar["time"]
+
+                    await callback({
+                        "time": bar["time"],
+                        "timeframe": timeframe,
+                        "asset": asset,
+                        "indicator": stream.name,
+                        "value": value
+                    })
+
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
-                    print(f"Error en la suscripción: {str(e)}")
-                    await asyncio.sleep(1)
-        except Exception as e:
-            logger.error(f"Error en la suscripción: {str(e)}")
+                    logger.error(f"Error en la suscripción: {str(e)}")
         finally:
             # Limpiar suscripciones al salir
             try:
@@ -583,15 +756,33 @@ class Quotex:
             except:
                 pass
 
-    async def get_profile(self):
-        return await self.api.get_profile()
+    async def get_profile(self, max_age: float = None):
+        """Get the trader profile, cached until a balance or account change.
+
+        Args:
+            max_age (float, optional): Seconds a cached profile may be old,
+                ``0`` always fetches it. Defaults to ``api.profile_ttl``.
+        """
+        return await self.api.get_profile(max_age)
 
     async def get_server_time(self):
-        user_settings = await self.get_profile()
-        offset_zone = user_settings.offset
-        self.api.timesync.server_timestamp = expiration.get_server_timer(offset_zone)
+        offset_zone = await self.api.get_time_offset()
+        self.api.timesync.server_timestamp = int(self.get_server_timestamp() - offset_zone)
         return self.api.timesync.server_timestamp
 
+    def get_server_timestamp(self):
+        """Get the current server time from the clock synchronized with the websocket.
+
+        Unlike :meth:`get_server_time` it needs no request, so it is cheap
+        enough for schedulers and order timing.
+
+        Returns:
+            float: The server timestamp in seconds, the local one before connecting.
+        """
+        if self.api is None:
+            return time.time()
+        return self.api.timesync.now()
+
     async def get_history(self):
         """Get the trader's history based on account type.
 
@@ -601,7 +792,15 @@ class Quotex:
         account_type = "demo" if self.account_is_demo else "live"
         return await self.api.get_trader_history(account_type, page_number=1)
 
-    async def buy(self, amount: float, asset: str, direction: str, duration: int, time_mode: str = "TIME"):
+    async def buy(
+            self,
+            amount: float,
+            asset: str,
+            direction: str,
+            duration: int,
+            time_mode: str = "TIME",
+            timeout: float = None
+    ):
         """
         Buy Binary option
 
@@ -611,78 +810,87 @@ class Quotex:
             direction (str): Direction to buy.
             duration (int): Duration to buy.
             time_mode (str): Time mode to buy.
+            timeout (float, optional): Seconds to wait for the order
+                confirmation. Defaults to the duration.
 
         Returns:
             The buy result.
 
         """
-        self.api.buy_id = None
-        request_id = expiration.get_timestamp()
+        request_id = self.api.next_request_id()
         is_fast_option = time_mode.upper() == "TIME"
+        future = self.api.pending_requests.register("buy", request_id)
         self.start_candles_stream(asset, duration)
-        await self.get_server_time()
         self.api.buy(amount, asset, direction, duration, request_id, is_fast_option)
 
-        count = 0.1
-        while self.api.buy_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
+        try:
+            result = await self.api.pending_requests.wait("buy", future, timeout or duration)
+        except asyncio.TimeoutError:
+            return False, None
+        if result.get("error"):
+            return False, result.get("error")
 
-        return status_buy, self.api.buy_successful
+        return True, result
 
-    async def open_pending(self, amount: float, asset: str, direction: str, duration: int, open_time: str = None):
-        self.api.pending_id = None
-        user_settings = await self.get_profile()
-        offset_zone = user_settings.offset
+    async def open_pending(
+            self,
+            amount: float,
+            asset: str,
+            direction: str,
+            duration: int,
+            open_time: str = None,
+            timeout: float = None
+    ):
+        offset_zone = await self.api.get_time_offset()
         open_time = expiration.get_next_timeframe(
-            int(time.time()),
+            int(self.get_server_timestamp()),
             offset_zone,
             duration,
             open_time
         )
+        future = self.api.pending_requests.register("pending")
         self.api.open_pending(amount, asset, direction, duration, open_time)
-        count = 0.1
-        while self.api.pending_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
-            self.api.instruments_follow(amount, asset, direction, duration, open_time)
+        try:
+            result = await self.api.pending_requests.wait("pending", future, timeout or duration)
+        except asyncio.TimeoutError:
+            return False, None
+        if result.get("error"):
+            return False, result.get("error")
 
-        return status_buy, self.api.pending_successful
+        self.api.instruments_follow(amount, asset, direction, duration, open_time)
+        return True, result
 
-    async def sell_option(self, options_ids):
+    async def sell_option(self, options_ids, timeout=10):
         """Sell asset Quotex"""
+        tickets = options_ids if isinstance(options_ids, list) else [options_ids]
+        pending = self.api.pending_requests
+        futures = [pending.register("sell", ticket) for ticket in tickets]
         self.api.sell_option(options_ids)
-        self.api.sold_options_respond = None
-        while self.api.sold_options_respond is None:
-            await asyncio.sleep(0.2)
-        return self.api.sold_options_respond
+        done, not_done = await asyncio.wait(
+            futures,
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        for future in not_done:
+            future.cancel()
+            pending.discard("sell", future)
+        if not done:
+            logger.warning("Timed out waiting for the sell confirmation.")
+            return None
+        return done.pop().result()
 
     def get_payment(self):
         """Payment Quotex server"""
         assets_data = {}
-        for i in self.api.instruments:
-            assets_data[i[2].replace("\n", "")] = {
-                "turbo_payment": i[18],
-                "payment": i[5],
+        for i in self.api.instrument_catalog:
+            assets_data[i.name] = {
+                "turbo_payment": i.turbo_payment,
+                "payment": i.payment,
                 "profit": {
-                    "1M": i[-9],
-                    "5M": i[-8]
+                    "1M": i.profit_1m,
+                    "5M": i.profit_5m
                 },
-                "open": i[14]
+                "open": i.is_open
             }
 
         return assets_data
@@ -690,26 +898,16 @@ class Quotex:
     # Function suggested by https://t.me/Suppor_Mk in the message on telegram https://t.me/c/2215782682/1/2990
     def get_payout_by_asset(self, asset_name: str, timeframe: str = "1"):
         """Payout Quotex server"""
-        assets_data = {}
-        for i in self.api.instruments:
-            if asset_name == i[1]:
-                assets_data[i[1].replace("\n", "")] = {
-                    "turbo_payment": i[18],
-                    "payment": i[5],
-                    "profit": {
-                        "24H": i[-10],
-                        "1M": i[-9],
-                        "5M": i[-8]
-                    },
-                    "open": i[14]
-                }
-                break
-
-        data = assets_data.get(asset_name)
+        i = self.api.instrument_catalog.get(asset_name)
+        profit = {
+            "24H": i.profit_24h,
+            "1M": i.profit_1m,
+            "5M": i.profit_5m
+        }
         if timeframe == "all":
-            return data.get("profit")
+            return profit
 
-        return data.get("profit").get(f"{timeframe}M")
+        return profit.get(f"{timeframe}M")
 
     async def start_remaing_time(self):
         now_stamp = datetime.fromtimestamp(expiration.get_timestamp())
@@ -720,17 +918,21 @@ class Quotex:
             print(f"\rRemaining {remaing_time if remaing_time > 0 else 0} seconds...", end="")
             await asyncio.sleep(1)
 
-    async def check_win(self, id_number: int):
+    async def check_win(self, id_number: int, timeout: float = None):
         """Check win based id"""
         task = asyncio.create_task(
             self.start_remaing_time()
         )
-        while True:
-            data_dict = self.api.listinfodata.get(id_number)
-            if data_dict and data_dict.get("game_state") == 1:
-                break
-            await asyncio.sleep(0.2)
-        task.cancel()
+        future = self.api.pending_requests.register("deal", id_number)
+        data_dict = self.api.listinfodata.get(id_number)
+        try:
+            if not data_dict or data_dict.get("game_state") != 1:
+                await self.api.pending_requests.wait("deal", future, timeout)
+                data_dict = self.api.listinfodata.get(id_number)
+            else:
+                self.api.pending_requests.discard("deal", future)
+        finally:
+            task.cancel()
         self.api.listinfodata.delete(id_number)
         return data_dict["win"]
 
@@ -753,7 +955,8 @@ class Quotex:
             time_mode: str = "TIMER",
             deal: int = 5,
             percent_mode: bool = False,
-            percent_deal: int = 1
+            percent_deal: int = 1,
+            timeout: float = 10
     ):
         """
         Applies trading settings for a specific asset and retrieves the updated investment settings.
@@ -769,19 +972,20 @@ class Quotex:
             deal (float, optional): The fixed amount for each deal. Defaults to 5.
             percent_mode (bool, optional): Whether to enable percentage-based deals. Defaults to False.
             percent_deal (float, optional): The percentage value for percentage-based deals. Defaults to 1.
+            timeout (float, optional): Seconds to wait for the settings. Defaults to 10.
 
         Returns:
             dict: The updated investment settings for the specified asset.
 
         Raises:
-            ValueError: If the investment settings cannot be retrieved after multiple attempts.
+            ValueError: If the investment settings are not received before the timeout.
 
         Notes:
-            - This function continuously refreshes the settings until they are available.
-            - A sleep interval is used to prevent excessive API calls.
+            - The call wakes as soon as the ``settings/list`` response arrives.
         """
         is_fast_option = False if time_mode.upper() == "TIMER" else True
         self.api.current_asset = asset
+        future = self.api.pending_requests.register("settings")
         self.api.settings_apply(
             asset,
             period,
@@ -790,13 +994,10 @@ class Quotex:
             percent_mode=percent_mode,
             percent_deal=percent_deal
         )
-        await asyncio.sleep(0.2)
-        while True:
-            self.api.refresh_settings()
-            if self.api.settings_list:
-                investments_settings = self.api.settings_list
-                break
-            await asyncio.sleep(0.2)
+        try:
+            investments_settings = await self.api.pending_requests.wait("settings", future, timeout)
+        except asyncio.TimeoutError:
+            raise ValueError("Investment settings were not received in time.")
 
         return investments_settings
 
@@ -834,16 +1035,87 @@ class Quotex:
                 return self.api.realtime_sentiment[asset]
             await asyncio.sleep(0.2)
 
-    async def start_realtime_candle(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
-        data = {}
+    async def start_realtime_candle(self, asset: str, period: int = 60):
+        """Start building candles of an asset and get the one in progress.
+
+        Args:
+            asset (str): The asset name.
+            period (int, optional): One of ``self.size``. Defaults to 60.
+
+        Returns:
+            dict: The open candle keyed by its start time.
+        """
+        self.subscribe_realtime_candles(asset)
         while True:
-            print("Tá agarrado....")
-            if self.api.realtime_candles.get(asset):
-                tick = self.api.realtime_candles
-                return process_tick(tick, period, data)
+            bar = self.aggregator.get_open(asset, period)
+            if bar:
+                return {
+                    bar["time"]: {
+                        "symbol": asset,
+                        "open": bar["open"],
+                        "close": bar["close"],
+                        "high": bar["high"],
+                        "low": bar["low"],
+                        "timestamp": bar["time"]
+                    }
+                }
             await asyncio.sleep(0.2)
 
+    def subscribe_realtime_candles(self, asset: str):
+        """Build candles of every period in ``self.size`` from the tick stream.
+
+        Args:
+            asset (str): The asset name.
+        """
+        self.aggregator.subscribe(asset)
+        self.start_candles_stream(asset, self.api.current_period or self.period_default)
+
+    def get_realtime_bars(self, asset: str, period: int, n: int = None):
+        """Get candles closed since the asset was subscribed.
+
+        Args:
+            asset (str): The asset name.
+            period (int): The candle period.
+            n (int, optional): Only the last ``n`` candles.
+
+        Returns:
+            list: Closed candles, oldest first.
+        """
+        return self.aggregator.get_closed(asset, period, n)
+
+    async def wait_candle_close(self, asset: str = None, period: int = None, timeout: float = None):
+        """Wait until a realtime candle closes.
+
+        Args:
+            asset (str, optional): With ``period``, wait for this asset and period only.
+            period (int, optional): The candle period.
+            timeout (float, optional): Seconds to wait. Defaults to forever.
+
+        Returns:
+            The closed candle, or ``(asset, period, candle)`` when no asset is given.
+        """
+        return await self.aggregator.wait_close(asset, period, timeout)
+
+    def add_candle_close_callback(self, callback):
+        """Call ``callback(asset, period, candle)`` whenever a realtime candle closes.
+
+        The callback runs on the websocket thread and must not block.
+        """
+        self.aggregator.add_callback(callback)
+
+    def store_closed_candle(self, asset, period, candle):
+        # Runs on the websocket thread: hand the file write to the store writer.
+        self.store_writer.submit(self.append_closed_candle, asset, period, dict(candle))
+
+    def append_closed_candle(self, asset, period, candle):
+        # Only extend the stored history when it stays contiguous; older
+        # gaps are filled by get_stored_candles from the server.
+        store = self.candle_store
+        with store.lock(asset, period):
+            first, last = store.bounds(asset, period)
+            if last is not None and candle["time"] == last + period:
+                store.append(asset, period, [candle])
+
     async def get_realtime_candles(self, asset: str):
         """Retrieve real-time candle data for a specified asset.
 
@@ -861,12 +1133,144 @@ class Quotex:
     async def get_realtime_price(self, asset: str):
         return self.api.realtime_price.get(asset, {})
 
+    async def get_sentiment_history(self, asset: str):
+        """Get the retained buy sentiment samples of an asset.
+
+        Args:
+            asset (str): The asset name.
+
+        Returns:
+            RingBuffer: Rows of ``time`` and ``buy`` percentage, or ``None``.
+        """
+        return self.api.sentiment_history.get(asset)
+
+    def set_buffer_capacity(self, capacity: int, asset: str = None):
+        """Set how many realtime ticks and sentiment samples are kept.
+
+        Args:
+            capacity (int): Rows kept per asset.
+            asset (str, optional): Only apply to this asset. Defaults to all assets.
+        """
+        self.api.set_buffer_capacity(capacity, asset)
+
     def get_signal_data(self):
         return self.api.signal_data
 
     def get_profit(self):
         return self.api.profit_in_operation or 0
 
+    def get_event_stats(self):
+        """Get per-event counters and handler timings of the websocket dispatcher.
+
+        Returns:
+            dict: Stats keyed by event name with ``count``, ``total_ms``,
+            ``avg_us`` and ``max_us``.
+        """
+        return self.api.websocket_client.dispatcher.get_stats()
+
+    def get_indicator_cache_stats(self):
+        """Get hit/miss counters and memory use of the indicator cache.
+
+        Returns:
+            dict: See :meth:`IndicatorCache.get_stats <pyquotex.utils.cache.IndicatorCache.get_stats>`.
+        """
+        return self.indicator_cache.get_stats()
+
+    async def run_analytics(self, func, *args, **kwargs):
+        """Run CPU-heavy analytics on ``self.executor``, or inline without one.
+
+        Args:
+            func (callable): The function; with a process pool it must be
+                picklable, like a module-level function.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            The result of ``func``.
+        """
+        if self.executor is None:
+            return func(*args, **kwargs)
+        return await self.executor.run(func, *args, **kwargs)
+
+    def start_loop_lag_monitor(self, interval: float = 0.05):
+        """Start measuring event loop lag, see :meth:`get_loop_lag_stats`.
+
+        Args:
+            interval (float, optional): Seconds between probes. Defaults to 0.05.
+        """
+        self.loop_lag.interval = interval
+        self.loop_lag.start()
+
+    def get_loop_lag_stats(self):
+        """Get the event loop lag measured since the monitor started.
+
+        Returns:
+            dict: ``count``, ``mean_ms``, ``p50_ms``, ``p99_ms`` and ``max_ms``.
+        """
+        return self.loop_lag.get_stats()
+
+    def schedule_strategy(self, asset, period: int, callback, offset: float = 0, stream: bool = True):
+        """Run a strategy once per candle of an asset, aligned to the server clock.
+
+        Args:
+            asset (str): The asset name, or ``None`` for a job driven by the clock alone.
+            period (int): The candle period in seconds.
+            callback: ``callback(event)``, a function or coroutine function;
+                ``event`` has ``asset``, ``period``, the candle ``time``, its
+                ``close_time`` and the closed ``candle`` when the realtime
+                stream closed it.
+            offset (float, optional): Seconds before the close to fire, e.g. a
+                signal window. Defaults to 0, at the close.
+            stream (bool, optional): Subscribe realtime candles, so jobs at the
+                close fire on the closing tick. Defaults to True.
+
+        Returns:
+            ScheduledJob: The job, to pass to :meth:`unschedule_strategy`.
+        """
+        if stream and asset is not None:
+            self.subscribe_realtime_candles(asset)
+        job = self.scheduler.register(asset, period, callback, offset)
+        self.scheduler.start()
+        return job
+
+    def unschedule_strategy(self, job):
+        self.scheduler.unregister(job)
+
+    async def wait_bar(self, asset, period: int, offset: float = 0, timeout: float = None):
+        """Wait for the close of the current candle, or ``offset`` seconds before it.
+
+        Returns:
+            dict: The event a scheduled strategy would get.
+        """
+        if asset is not None:
+            self.subscribe_realtime_candles(asset)
+        return await self.scheduler.wait(asset, period, offset, timeout)
+
+    def get_http_stats(self):
+        """Get the requests of the shared http pool and its connection reuse.
+
+        Returns:
+            dict: ``backend``, ``requests``, ``connections``, ``reused`` and
+            ``reuse_rate``; zeroed, with no backend, before connecting.
+        """
+        if self.api is None:
+            return {
+                "backend": None,
+                "requests": 0,
+                "connections": 0,
+                "reused": 0,
+                "reuse_rate": 0.0
+            }
+        return self.api.http_pool.get_stats()
+
+    def get_send_stats(self):
+        """Get enqueue latency and time-to-wire of outbound websocket frames.
+
+        Returns:
+            dict: Counters and latencies of the outbound send queue.
+        """
+        return self.api.get_send_stats()
+
     async def get_result(self, operation_id: str):
         """Check if the trade is a win based on its ID.
 
@@ -942,4 +1346,5 @@ class Quotex:
                 await asyncio.sleep(0.2)
 
     async def close(self):
+        self.scheduler.stop()
         return await self.api.close()
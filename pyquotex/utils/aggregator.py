@@ -0,0 +1,168 @@
+"""Module for building candles from the live tick stream."""
+import logging
+from collections import deque
+from pyquotex.ws.correlation import RequestTracker
+
+logger = logging.getLogger(__name__)
+
+
+def resample_candles(candles, period, source_period=None):
+    """Group closed candles into a higher timeframe.
+
+    :param candles: Candle dicts sorted by ``time``.
+    :param int period: Target period in seconds.
+    :param source_period: (optional) Period of ``candles``; when given a
+        leading bucket with missing candles is dropped.
+    :returns: A list of candle dicts of ``period``.
+    """
+    result = []
+    counts = []
+    for candle in candles:
+        start = int(candle["time"] // period * period)
+        if result and result[-1]["time"] == start:
+            bar = result[-1]
+            bar["close"] = candle["close"]
+            bar["high"] = max(bar["high"], candle["high"])
+            bar["low"] = min(bar["low"], candle["low"])
+            bar["ticks"] += candle.get("ticks") or 0
+            counts[-1] += 1
+        else:
+            result.append({
+                "time": start,
+                "open": candle["open"],
+                "close": candle["close"],
+                "high": candle["high"],
+                "low": candle["low"],
+                "ticks": candle.get("ticks") or 0
+            })
+            counts.append(1)
+    if source_period and result and counts[0] < period // source_period:
+        result.pop(0)
+    return result
+
+
+class CandleAggregator(object):
+    """Build OHLC bars of several periods from one pass over each tick.
+
+    Each tracked asset keeps one open bar per period and a bounded history
+    of closed bars. When a tick starts a new interval the open bar is
+    closed, the close callbacks are called and waiters from
+    :meth:`wait_close` are resolved. The first bar of every asset and
+    period started mid-interval, so it is discarded instead of closed.
+    """
+
+    def __init__(self, periods, history=500):
+        """
+        :param periods: The bar periods in seconds.
+        :param int history: Closed bars kept per asset and period.
+        """
+        self.periods = sorted(set(periods))
+        self.history = history
+        self.open_bars = {}
+        self.closed_bars = {}
+        self.callbacks = []
+        self.waiters = RequestTracker()
+
+    def subscribe(self, asset):
+        """Start building bars for an asset."""
+        if asset in self.open_bars:
+            return
+        self.closed_bars[asset] = {
+            period: deque(maxlen=self.history) for period in self.periods
+        }
+        self.open_bars[asset] = dict.fromkeys(self.periods)
+
+    def unsubscribe(self, asset):
+        self.open_bars.pop(asset, None)
+        self.closed_bars.pop(asset, None)
+
+    def add_callback(self, callback):
+        """Register ``callback(asset, period, bar)`` for closed bars.
+
+        Callbacks run on the thread that feeds the ticks and must not block.
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self.callbacks.remove(callback)
+
+    def update(self, asset, timestamp, price):
+        """Feed one tick.
+
+        :param str asset: The asset name.
+        :param timestamp: The tick timestamp in seconds.
+        :param price: The tick price.
+        """
+        open_bars = self.open_bars.get(asset)
+        if open_bars is None:
+            return
+        for period, bar in open_bars.items():
+            start = int(timestamp // period * period)
+            if bar is not None and start == bar["time"]:
+                bar["close"] = price
+                if price > bar["high"]:
+                    bar["high"] = price
+                elif price < bar["low"]:
+                    bar["low"] = price
+                bar["ticks"] += 1
+                continue
+            if bar is not None and start < bar["time"]:
+                # Late tick of an interval that is already closed.
+                continue
+            open_bars[period] = {
+                "time": start,
+                "open": price,
+                "close": price,
+                "high": price,
+                "low": price,
+                "ticks": 1,
+                "partial": bar is None
+            }
+            if bar is not None and not bar.pop("partial"):
+                self.close_bar(asset, period, bar)
+
+    def close_bar(self, asset, period, bar):
+        self.closed_bars[asset][period].append(bar)
+        for callback in self.callbacks:
+            try:
+                callback(asset, period, bar)
+            except Exception:
+                logger.exception("Candle close callback failed.")
+        self.waiters.resolve("close", bar, (asset, period))
+        self.waiters.resolve_matching("close", (asset, period, bar), lambda key: key is None)
+
+    def get_open(self, asset, period):
+        """Get the bar currently being built, or ``None``."""
+        bar = self.open_bars.get(asset, {}).get(period)
+        return dict(bar) if bar is not None else None
+
+    def get_closed(self, asset, period, n=None):
+        """Get closed bars, oldest first.
+
+        :param int n: (optional) Only the last ``n`` bars.
+        """
+        bars = self.closed_bars.get(asset, {}).get(period)
+        if not bars:
+            return []
+        if n is None or n >= len(bars):
+            return list(bars)
+        return list(bars)[-n:]
+
+    def register_close(self, asset=None, period=None):
+        """Register a future for the next closed bar.
+
+        :param asset: (optional) With ``period``, only this asset and period.
+        :returns: The :class:`asyncio.Future`; it resolves with the bar,
+            or ``(asset, period, bar)`` when no asset is given.
+        """
+        key = (asset, period) if asset is not None else None
+        return self.waiters.register("close", key)
+
+    async def wait_close(self, asset=None, period=None, timeout=None):
+        """Wait for the next closed bar.
+
+        :param asset: (optional) Only this asset and ``period``.
+        :param timeout: Seconds to wait, ``None`` waits forever.
+        """
+        future = self.register_close(asset, period)
+        return await self.waiters.wait("close", future, timeout)
@@ -0,0 +1,194 @@
+"""Module for chunked historical candle backfill."""
+import os
+import json
+import time
+import asyncio
+import logging
+from pyquotex.utils.processor import merge_candles
+
+logger = logging.getLogger(__name__)
+
+
+def split_windows(start, end, period, window_candles):
+    """Split a time range into ``history/load`` sized windows.
+
+    Window boundaries lie on a fixed grid of ``period * window_candles``
+    seconds, so runs with different end times share every window but the
+    newest, which lets a checkpoint resume them.
+
+    :param start: Range start timestamp.
+    :param end: Range end timestamp.
+    :param period: Candle period in seconds.
+    :param window_candles: Candles requested per window.
+    :returns: A list of ``(window_end, offset)`` tuples, newest first.
+    """
+    start = int(start // period * period)
+    end = int(end // period * period)
+    size = period * window_candles
+    windows = []
+    window_end = end
+    while window_end > start:
+        boundary = (window_end - 1) // size * size
+        offset = window_end - max(boundary, start)
+        windows.append((window_end, offset))
+        window_end -= offset
+    return windows
+
+
+def find_gaps(candles, period, start=None, end=None):
+    """Find missing candles in a sorted candle list.
+
+    :param candles: Candles sorted by ``time``.
+    :param period: Candle period in seconds.
+    :param start: (optional) Expected first candle time.
+    :param end: (optional) Expected end of the range.
+    :returns: A list of ``(gap_start, gap_end)`` tuples.
+    """
+    times = [candle["time"] for candle in candles]
+    if start is not None:
+        times.insert(0, int(start // period * period) - period)
+    if end is not None:
+        times.append(int(end // period * period))
+    return [
+        (previous + period, current)
+        for previous, current in zip(times, times[1:])
+        if current - previous > period
+    ]
+
+
+class Backfill(object):
+    """Fetch long candle histories in server-sized windows.
+
+    The range is split into windows of ``window_candles`` candles which are
+    requested concurrently, bounded by ``concurrency`` across all assets.
+    Each window is its own ``history/load`` request, answered by index.
+    Overlapping candles are deduplicated like :func:`merge_candles`. With a
+    ``checkpoint_dir`` every completed window is saved per asset and
+    period, so an interrupted backfill resumes the windows it finished,
+    even when the next run ends at a later time.
+    """
+
+    def __init__(
+            self,
+            client,
+            window_candles=199,
+            concurrency=5,
+            retries=2,
+            timeout=20,
+            checkpoint_dir=None
+    ):
+        """
+        :param client: The instance of :class:`Quotex <pyquotex.stable_api.Quotex>`;
+            windows are fetched with ``load_candles``.
+        :param window_candles: Candles requested per ``history/load`` call.
+        :param concurrency: Maximum requests in flight.
+        :param retries: Extra attempts for windows that return no candles.
+        :param timeout: Seconds to wait for each window.
+        :param checkpoint_dir: (optional) Directory for resume checkpoints.
+        """
+        self.client = client
+        self.window_candles = window_candles
+        self.retries = retries
+        self.timeout = timeout
+        self.checkpoint_dir = checkpoint_dir
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    def checkpoint_path(self, asset, period):
+        return os.path.join(self.checkpoint_dir, f"{asset}_{period}.json")
+
+    def load_checkpoint(self, asset, period):
+        empty = {"done": [], "candles": []}
+        if not self.checkpoint_dir:
+            return empty
+        path = self.checkpoint_path(asset, period)
+        if not os.path.exists(path):
+            return empty
+        with open(path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("window_candles") != self.window_candles:
+            return empty
+        return checkpoint
+
+    def save_checkpoint(self, asset, period, done, candles):
+        if not self.checkpoint_dir:
+            return
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self.checkpoint_path(asset, period)
+        checkpoint = {"window_candles": self.window_candles, "done": done, "candles": candles}
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(f"{path}.tmp", path)
+
+    def clear_checkpoint(self, asset, period):
+        if self.checkpoint_dir and os.path.exists(self.checkpoint_path(asset, period)):
+            os.remove(self.checkpoint_path(asset, period))
+
+    async def fetch_window(self, asset, period, window_end, offset):
+        for attempt in range(self.retries + 1):
+            async with self.semaphore:
+                candles = await self.client.load_candles(
+                    asset,
+                    window_end,
+                    offset,
+                    period,
+                    timeout=self.timeout
+                )
+            if candles:
+                return candles
+            logger.debug(f"Empty window {asset} {window_end} (attempt {attempt + 1}).")
+        return []
+
+    async def fetch(self, asset, start, end, period=60):
+        """Backfill one asset.
+
+        :param str asset: The asset name.
+        :param start: Range start timestamp.
+        :param end: Range end timestamp, ``None`` for now.
+        :param period: Candle period in seconds.
+        :returns: A dict with ``candles`` (sorted, deduplicated),
+            ``gaps`` (missing ranges) and ``failed`` (window ends that
+            returned no candles).
+        """
+        end = int(end or time.time())
+        start = int(start)
+        windows = split_windows(start, end, period, self.window_candles)
+        checkpoint = self.load_checkpoint(asset, period)
+        done = checkpoint["done"]
+        candles = checkpoint["candles"]
+        finished = {tuple(window) for window in done}
+        pending = [window for window in windows if window not in finished]
+        failed = []
+
+        async def run(window):
+            window_end, offset = window
+            result = await self.fetch_window(asset, period, window_end, offset)
+            if not result:
+                failed.append(window_end)
+                return
+            candles.extend(
+                candle for candle in result
+                if window_end - offset <= candle["time"] < window_end
+            )
+            done.append([window_end, offset])
+            self.save_checkpoint(asset, period, done, candles)
+
+        await asyncio.gather(*(run(window) for window in pending))
+        if not failed:
+            self.clear_checkpoint(asset, period)
+        first = int(start // period * period)
+        merged = [candle for candle in merge_candles(candles) if first <= candle["time"] < end]
+        return {
+            "candles": merged,
+            "gaps": find_gaps(merged, period, start, end),
+            "failed": sorted(failed)
+        }
+
+    async def fetch_many(self, assets, start, end, period=60):
+        """Backfill several assets concurrently.
+
+        :returns: A dict of :meth:`fetch` results keyed by asset.
+        """
+        results = await asyncio.gather(
+            *(self.fetch(asset, start, end, period) for asset in assets)
+        )
+        return dict(zip(assets, results))
@@ -0,0 +1,124 @@
+"""Module for vectorized binary-option backtests."""
+import numpy as np
+
+CALL = 1
+PUT = -1
+
+
+def outcomes(opens, closes, directions, expiry=1, level=0, ties="draw"):
+    """Score one entry level for every candle at once.
+
+    A signal on candle ``i`` enters at the open of candle
+    ``i + 1 + level * expiry`` and expires at the close of candle
+    ``i + (level + 1) * expiry``.
+
+    :param opens: Candle opens.
+    :param closes: Candle closes.
+    :param directions: ``1`` (call), ``-1`` (put) or ``0`` per candle.
+    :param int expiry: Trade duration in candles.
+    :param int level: MTG level, ``0`` for the first entry.
+    :param str ties: ``"draw"`` refunds an unchanged price, ``"loss"`` loses it.
+    :returns: An int8 array, ``1`` win, ``-1`` loss, ``0`` draw or no trade
+        (signals too close to the end of the series are not scored).
+    """
+    n = len(closes)
+    entry = np.arange(n) + 1 + level * expiry
+    exit_ = entry + expiry - 1
+    valid = (directions != 0) & (exit_ < n)
+    entry = np.minimum(entry, n - 1)
+    exit_ = np.minimum(exit_, n - 1)
+    move = np.sign(closes[exit_] - opens[entry]) * directions
+    if ties == "loss":
+        move = np.where(move == 0, -1, move)
+    return np.where(valid, move, 0).astype(np.int8)
+
+
+def backtest(
+        data,
+        directions,
+        expiry=1,
+        payout=0.8,
+        stake=1.0,
+        mtg=0,
+        mtg_factor=2.0,
+        ties="draw",
+        overlap=True
+):
+    """Score binary-option signals over a candle series.
+
+    :param data: Candle arrays with ``open`` and ``close``, like
+        :func:`candles_to_arrays <pyquotex.utils.indicators.candles_to_arrays>`.
+    :param directions: ``1`` (call), ``-1`` (put) or ``0`` per candle; the
+        signal is taken at the close of that candle.
+    :param int expiry: Trade duration in candles.
+    :param float payout: Profit per unit staked on a win, e.g. ``0.8`` for 80%.
+        An array of per-candle payouts is accepted as well.
+    :param float stake: Stake of the first entry.
+    :param int mtg: Martingale follow-ups after a loss, each entering right
+        after the previous one expires in the same direction.
+    :param float mtg_factor: Stake multiplier of every follow-up.
+    :param str ties: ``"draw"`` refunds an unchanged price and ends the
+        sequence, ``"loss"`` counts it as a loss.
+    :param bool overlap: When ``False`` signals raised while a previous
+        trade sequence is still running are skipped.
+    :returns: A dict with ``signals``, ``wins``, ``losses``, ``draws``,
+        ``win_rate``, ``mtg_wins`` (wins per level), ``profit``, the
+        ``pnl`` and ``equity`` arrays (booked on the signal candle) and
+        the ``trades`` record array with
+        the signal index, direction, level reached and result of each trade.
+    """
+    opens = np.asarray(data["open"], dtype=np.float64)
+    closes = np.asarray(data["close"], dtype=np.float64)
+    directions = np.asarray(directions, dtype=np.int8)
+    n = len(closes)
+    payout = np.broadcast_to(np.asarray(payout, dtype=np.float64), (n,))
+
+    # Only signals whose whole MTG sequence fits in the series are scored.
+    scored = directions.copy()
+    scored[max(n - (mtg + 1) * expiry, 0):] = 0
+
+    levels = np.stack([outcomes(opens, closes, scored, expiry, level, ties) for level in range(mtg + 1)])
+    stakes = stake * mtg_factor ** np.arange(mtg + 1)
+
+    # The sequence stops at the first level that is not a loss.
+    not_lost = levels != -1
+    reached = np.where(not_lost.any(axis=0), not_lost.argmax(axis=0), mtg)
+    final = levels[reached, np.arange(n)]
+    lost_stakes = np.concatenate(([0.0], np.cumsum(stakes)))[reached]
+    pnl = np.select(
+        [final == 1, final == -1],
+        [stakes[reached] * payout, -stakes[reached]],
+        0.0
+    ) - lost_stakes
+
+    signals = np.flatnonzero(scored)
+    if not overlap and len(signals):
+        keep = []
+        busy_until = -1
+        for index in signals.tolist():
+            if index >= busy_until:
+                keep.append(index)
+                busy_until = index + (int(reached[index]) + 1) * expiry
+        signals = np.array(keep, dtype=np.int64)
+
+    mask = np.zeros(n, dtype=bool)
+    mask[signals] = True
+    pnl = np.where(mask, pnl, 0.0)
+    results = final[signals]
+    wins = int((results == 1).sum())
+    losses = int((results == -1).sum())
+    return {
+        "signals": len(signals),
+        "wins": wins,
+        "losses": losses,
+        "draws": int((results == 0).sum()),
+        "win_rate": wins / (wins + losses) if wins + losses else 0.0,
+        "mtg_wins": np.bincount(reached[signals][results == 1], minlength=mtg + 1).tolist(),
+        "profit": float(pnl.sum()),
+        "pnl": pnl,
+        "equity": np.cumsum(pnl),
+        "trades": np.rec.fromarrays(
+            [signals, directions[signals], reached[signals], results],
+            names="index,direction,level,result"
+        )
+    }
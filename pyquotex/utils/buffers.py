@@ -0,0 +1,105 @@
+"""Module for fixed-capacity stream buffers."""
+import numpy as np
+
+TICK_DTYPE = np.dtype([("time", "<f8"), ("price", "<f8")])
+SENTIMENT_DTYPE = np.dtype([("time", "<f8"), ("buy", "<f8")])
+
+
+class RingBuffer(object):
+    """Fixed-capacity ring buffer backed by a numpy record array.
+
+    Every row is written twice, at ``i`` and ``i + capacity``, so the
+    retained rows always form one contiguous slice of the storage. Reading
+    the latest row or the last ``n`` rows is O(1) and returns views, not
+    copies. Rows index like dicts, ``buffer[-1]["price"]``, so code written
+    for the former lists of dicts keeps working.
+    """
+
+    def __init__(self, capacity, dtype=TICK_DTYPE):
+        """
+        :param int capacity: Maximum number of rows kept.
+        :param dtype: The numpy record dtype of a row.
+        """
+        if capacity < 1:
+            raise ValueError("The capacity must be a positive number.")
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        self.__storage = np.zeros(capacity * 2, dtype=self.dtype)
+        self.__position = 0
+        self.__count = 0
+
+    def append(self, *values):
+        """Append a row, dropping the oldest one when full.
+
+        :param values: The row fields, in dtype order.
+        """
+        position = self.__position
+        self.__storage[position] = values
+        self.__storage[position + self.capacity] = values
+        self.__position = (position + 1) % self.capacity
+        if self.__count < self.capacity:
+            self.__count += 1
+
+    def extend(self, rows):
+        """Append many rows, dropping the oldest ones when full.
+
+        :param rows: A record array of the buffer dtype, oldest first.
+        """
+        rows = rows[-self.capacity:]
+        n = len(rows)
+        if not n:
+            return
+        index = (self.__position + np.arange(n)) % self.capacity
+        self.__storage[index] = rows
+        self.__storage[index + self.capacity] = rows
+        self.__position = (self.__position + n) % self.capacity
+        self.__count = min(self.__count + n, self.capacity)
+
+    def resized(self, capacity):
+        """Get a new buffer of ``capacity`` holding the newest rows of this one."""
+        buffer = RingBuffer(capacity, self.dtype)
+        buffer.extend(self.last(capacity))
+        return buffer
+
+    def view(self):
+        """Get all retained rows, oldest first, as a view."""
+        end = self.__position + self.capacity
+        return self.__storage[end - self.__count:end]
+
+    def last(self, n):
+        """Get the last ``n`` rows, oldest first, as a view."""
+        end = self.__position + self.capacity
+        return self.__storage[end - min(n, self.__count):end]
+
+    def latest(self):
+        """Get the newest row or ``None`` when empty."""
+        if not self.__count:
+            return None
+        return self.__storage[self.__position + self.capacity - 1]
+
+    def clear(self):
+        self.__position = 0
+        self.__count = 0
+
+    def to_list(self):
+        """Get the retained rows as a list of dicts."""
+        names = self.dtype.names
+        return [dict(zip(names, row)) for row in self.view().tolist()]
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.view()[item]
+        if item < 0:
+            item += self.__count
+        if not 0 <= item < self.__count:
+            raise IndexError("RingBuffer index out of range")
+        return self.__storage[self.__position + self.capacity - self.__count + item]
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __repr__(self):
+        return f"RingBuffer(capacity={self.capacity}, size={self.__count})"
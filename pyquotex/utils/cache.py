@@ -0,0 +1,122 @@
+"""Module for memoizing indicator results."""
+import sys
+import json
+import threading
+from collections import OrderedDict
+
+
+def estimate_size(value):
+    """Estimate the memory used by a result of nested dicts and lists.
+
+    :returns: The approximate size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        # Lists of floats dominate; count one float object per item.
+        if value and isinstance(value[0], (dict, list, tuple)):
+            size += sum(estimate_size(item) for item in value)
+        else:
+            size += 24 * len(value)
+    return size
+
+
+def params_key(params):
+    """Normalize indicator params into a hashable key."""
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class IndicatorCache(object):
+    """LRU cache of indicator results.
+
+    Entries are keyed by ``(asset, timeframe, indicator, params, history,
+    candle_time)`` where ``candle_time`` is the time of the last closed
+    candle the result was computed for, so a result is never served once
+    a newer candle closed. :meth:`invalidate` drops the entries of an asset
+    and timeframe eagerly; it is meant to be registered as a close
+    callback of :class:`CandleAggregator <pyquotex.utils.aggregator.CandleAggregator>`,
+    so it runs on the websocket thread while lookups run on the event
+    loop. Every method holds the cache lock.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=32 * 1024 * 1024):
+        """
+        :param int max_entries: Maximum number of cached results.
+        :param int max_bytes: Approximate memory cap for all results.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(asset, timeframe, indicator, params, history, candle_time):
+        return asset, timeframe, indicator.upper(), params_key(params), history, candle_time
+
+    def get(self, key):
+        """Get a cached result and mark it as recently used, or ``None``."""
+        with self.__lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        """Cache a result, evicting the least recently used ones if needed."""
+        size = estimate_size(result)
+        if size > self.max_bytes:
+            return
+        with self.__lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self.entries[key] = (result, size)
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def invalidate(self, asset, timeframe, bar=None):
+        """Drop the cached results of an asset and timeframe.
+
+        The signature matches the aggregator close callbacks.
+        """
+        with self.__lock:
+            stale = [key for key in self.entries if key[0] == asset and key[1] == timeframe]
+            for key in stale:
+                self.bytes -= self.entries.pop(key)[1]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self.__lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def get_stats(self):
+        """Get the cache statistics.
+
+        :returns: A dict with hits, misses, hit rate, evictions,
+            invalidations, entries and the estimated bytes in use.
+        """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes
+            }
@@ -0,0 +1,131 @@
+"""Module for running CPU-heavy analytics off the event loop."""
+import time
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+class AnalyticsExecutor(object):
+    """Run analytics on a thread or process pool.
+
+    Threads suit the numpy indicator kernels, which release the GIL for
+    most of their work. Pure-Python analytics such as candle processing
+    or strategy scoring only stop competing with the event loop on a
+    process pool. With processes the function and its arguments must be
+    picklable, so pass module-level functions and plain data.
+    """
+
+    def __init__(self, kind="thread", workers=None):
+        """
+        :param str kind: ``"thread"`` or ``"process"``.
+        :param int workers: (optional) Pool size, the executor default when ``None``.
+        """
+        if kind == "thread":
+            self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pyquotex-analytics")
+        elif kind == "process":
+            self.pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            raise ValueError(f"Unknown executor kind '{kind}', expected 'thread' or 'process'.")
+        self.kind = kind
+        self.workers = workers
+        self.tasks = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    async def run(self, func, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self.pool, functools.partial(func, *args, **kwargs))
+        finally:
+            elapsed = time.perf_counter() - start
+            self.tasks += 1
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+
+    def shutdown(self, wait=True):
+        self.pool.shutdown(wait=wait)
+
+    def get_stats(self):
+        """Get the number of tasks and their round-trip times in milliseconds."""
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "tasks": self.tasks,
+            "avg_ms": self.total_time / self.tasks * 1e3 if self.tasks else 0.0,
+            "max_ms": self.max_time * 1e3
+        }
+
+
+def create_executor(kind=None, workers=None):
+    """Create an :class:`AnalyticsExecutor`, or ``None`` when ``kind`` is empty.
+
+    Handy to make the executor opt-in from configuration, e.g.
+    ``create_executor(os.getenv("PYQUOTEX_ANALYTICS_EXECUTOR"))``.
+    """
+    if not kind:
+        return None
+    return AnalyticsExecutor(kind, int(workers) if workers else None)
+
+
+class LoopLagMonitor(object):
+    """Measure how late the event loop wakes up a periodic timer.
+
+    A healthy loop wakes up within a fraction of a millisecond; lag in the
+    tens of milliseconds means a coroutine ran CPU-bound code and delayed
+    everything else on the loop, including websocket keepalives and order
+    acknowledgements.
+    """
+
+    def __init__(self, interval=0.05, window=2000):
+        """
+        :param float interval: Seconds between probes.
+        :param int window: Number of recent samples kept for percentiles.
+        """
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.max_lag = 0.0
+        self.task = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self.run())
+        return self.task
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def reset(self):
+        self.samples.clear()
+        self.max_lag = 0.0
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def get_stats(self):
+        """Get the loop lag in milliseconds.
+
+        :returns: A dict with the sample ``count``, ``mean_ms``, ``p50_ms``,
+            ``p99_ms`` over the recent window and ``max_ms`` since the last reset.
+        """
+        samples = sorted(self.samples)
+        count = len(samples)
+        if not count:
+            return {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": count,
+            "mean_ms": sum(samples) / count * 1e3,
+            "p50_ms": samples[count // 2] * 1e3,
+            "p99_ms": samples[min(count - 1, int(count * 0.99))] * 1e3,
+            "max_ms": self.max_lag * 1e3
+        }
@@ -1,77 +1,275 @@
+import math
 import numpy as np
-from typing import List, Dict, Union, Tuple
+from typing import List, Dict, Union, Tuple, Callable, Any
+
+ArrayLike = Union[List[float], np.ndarray]
+
+
+def as_array(values: ArrayLike) -> np.ndarray:
+    """Convierte una lista o array en un ndarray float64 sin copiar si ya lo es"""
+    return np.asarray(values, dtype=np.float64)
+
+
+def length(values: np.ndarray) -> int:
+    """Número de velas, el último eje de un array 1-D o 2-D (activos × tiempo)"""
+    return values.shape[-1]
+
+
+def empty(values: np.ndarray) -> np.ndarray:
+    """Array sin velas con las mismas filas que ``values``"""
+    return np.empty(values.shape[:-1] + (0,))
+
+
+def ewm(values: np.ndarray, alpha: float, seed) -> np.ndarray:
+    """Recurrencia y[i] = alpha * x[i] + (1 - alpha) * y[i - 1] resuelta por bloques
+
+    Devuelve ``length(values) + 1`` valores por fila, el primero es ``seed``.
+    Dentro de cada bloque la recurrencia se expresa con potencias y una suma
+    acumulada; el tamaño del bloque se limita para que las potencias no
+    pierdan precisión.
+    """
+    values = as_array(values)
+    decay = 1.0 - alpha
+    n = length(values)
+    result = np.empty(values.shape[:-1] + (n + 1,))
+    result[..., 0] = seed
+    if not n:
+        return result
+    if decay <= 0:
+        result[..., 1:] = values
+        return result
+    block = int(min(1024, max(1, 20 / -math.log(decay))))
+    powers = decay ** np.arange(block + 1)
+    inverse = 1.0 / powers[:-1]
+    last = result[..., :1]
+    for start in range(0, n, block):
+        chunk = values[..., start:start + block]
+        size = length(chunk)
+        weighted = np.cumsum(chunk * inverse[:size], axis=-1) * powers[:size]
+        out = powers[1:size + 1] * last + alpha * weighted
+        result[..., start + 1:start + size + 1] = out
+        last = out[..., -1:]
+    return result
+
+
+def sma(values: ArrayLike, period: int) -> np.ndarray:
+    """Media móvil simple en O(n) con sumas acumuladas"""
+    values = as_array(values)
+    if length(values) < period:
+        return empty(values)
+    cumsum = np.cumsum(values, axis=-1)
+    cumsum = np.concatenate((np.zeros(values.shape[:-1] + (1,)), cumsum), axis=-1)
+    return (cumsum[..., period:] - cumsum[..., :-period]) / period
+
+
+def ema(values: ArrayLike, period: int) -> np.ndarray:
+    """Media móvil exponencial iniciada con la SMA del primer período"""
+    values = as_array(values)
+    if length(values) < period:
+        return empty(values)
+    return ewm(values[..., period:], 2 / (period + 1), values[..., :period].mean(axis=-1))
+
+
+def wilder(values: ArrayLike, period: int) -> np.ndarray:
+    """Suavizado de Wilder (alpha = 1 / period) iniciado con la media del primer período"""
+    values = as_array(values)
+    if length(values) < period:
+        return empty(values)
+    return ewm(values[..., period:], 1 / period, values[..., :period].mean(axis=-1))
+
+
+def rolling_max(values: ArrayLike, window: int) -> np.ndarray:
+    """Máximo móvil en O(n) con el algoritmo de van Herk/Gil-Werman"""
+    values = as_array(values)
+    n = length(values)
+    if n < window:
+        return empty(values)
+    rows = values.shape[:-1]
+    padded = np.full(rows + (-(-n // window) * window,), -np.inf)
+    padded[..., :n] = values
+    blocks = padded.reshape(rows + (-1, window))
+    prefix = np.maximum.accumulate(blocks, axis=-1).reshape(padded.shape)
+    suffix = np.maximum.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+    count = n - window + 1
+    return np.maximum(suffix[..., :count], prefix[..., window - 1:window - 1 + count])
+
+
+def rolling_min(values: ArrayLike, window: int) -> np.ndarray:
+    """Mínimo móvil en O(n)"""
+    return -rolling_max(-as_array(values), window)
+
+
+def rolling_std(values: ArrayLike, period: int) -> np.ndarray:
+    """Desviación estándar poblacional móvil en O(n)"""
+    values = as_array(values)
+    if length(values) < period:
+        return empty(values)
+    # Centrar evita la cancelación numérica de E[x²] - E[x]² con precios grandes.
+    centered = values - values.mean(axis=-1, keepdims=True)
+    mean = sma(centered, period)
+    variance = sma(centered * centered, period) - mean * mean
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+def true_range(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    """True Range desde la segunda vela"""
+    prev_close = closes[..., :-1]
+    return np.maximum.reduce([
+        highs[..., 1:] - lows[..., 1:],
+        np.abs(highs[..., 1:] - prev_close),
+        np.abs(lows[..., 1:] - prev_close)
+    ])
+
+
+def rsi(prices: ArrayLike, period: int = 14) -> np.ndarray:
+    """Índice de Fuerza Relativa (RSI) con suavizado de Wilder"""
+    prices = as_array(prices)
+    if length(prices) < period + 1:
+        return empty(prices)
+    deltas = np.diff(prices, axis=-1)
+    avg_gain = wilder(np.where(deltas > 0, deltas, 0.0), period)
+    avg_loss = wilder(np.where(deltas < 0, -deltas, 0.0), period)
+    rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
+    return 100 - (100 / (1 + rs))
+
+
+def macd(prices: ArrayLike, fast_period: int = 12, slow_period: int = 26,
+         signal_period: int = 9) -> Dict[str, np.ndarray]:
+    """MACD, señal e histograma alineados por el final"""
+    prices = as_array(prices)
+    if length(prices) < slow_period:
+        return {"macd": empty(prices), "signal": empty(prices), "histogram": empty(prices)}
+    slow_ema = ema(prices, slow_period)
+    fast_ema = ema(prices, fast_period)[..., -length(slow_ema):]
+    macd_line = fast_ema - slow_ema
+    signal_line = ema(macd_line, signal_period)
+    histogram = macd_line[..., length(macd_line) - length(signal_line):] - signal_line
+    return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+
+
+def bollinger_bands(prices: ArrayLike, period: int = 20, num_std: float = 2) -> Dict[str, np.ndarray]:
+    """Bandas de Bollinger"""
+    middle = sma(prices, period)
+    std = rolling_std(prices, period)
+    return {"upper": middle + std * num_std, "middle": middle, "lower": middle - std * num_std}
+
+
+def stochastic(prices: ArrayLike, highs: ArrayLike, lows: ArrayLike, k_period: int = 14,
+               d_period: int = 3) -> Dict[str, np.ndarray]:
+    """Oscilador Estocástico"""
+    prices = as_array(prices)
+    if length(prices) < k_period:
+        return {"k": empty(prices), "d": empty(prices)}
+    window_high = rolling_max(highs, k_period)
+    window_low = rolling_min(lows, k_period)
+    spread = window_high - window_low
+    close = prices[..., k_period - 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(spread == 0, 100.0, (close - window_low) / spread * 100)
+    return {"k": k, "d": sma(k, d_period)}
+
+
+def atr(highs: ArrayLike, lows: ArrayLike, closes: ArrayLike, period: int = 14) -> np.ndarray:
+    """Average True Range (ATR)"""
+    highs = as_array(highs)
+    if length(highs) < period:
+        return empty(highs)
+    return wilder(true_range(highs, as_array(lows), as_array(closes)), period)
+
+
+def adx(highs: ArrayLike, lows: ArrayLike, closes: ArrayLike, period: int = 14) -> Dict[str, np.ndarray]:
+    """Average Directional Index (ADX) con +DI/-DI de Wilder"""
+    highs, lows, closes = as_array(highs), as_array(lows), as_array(closes)
+    if length(highs) < period + 1:
+        return {"adx": empty(highs), "plus_di": empty(highs), "minus_di": empty(highs)}
+    up = highs[..., 1:] - highs[..., :-1]
+    down = lows[..., :-1] - lows[..., 1:]
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    tr_avg = wilder(true_range(highs, lows, closes), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = np.nan_to_num(wilder(plus_dm, period) * 100 / tr_avg)
+        minus_di = np.nan_to_num(wilder(minus_dm, period) * 100 / tr_avg)
+        total = plus_di + minus_di
+        dx = np.where(total == 0, 0.0, np.abs(plus_di - minus_di) / total * 100)
+    return {"adx": wilder(dx, period), "plus_di": plus_di, "minus_di": minus_di}
+
+
+def donchian(highs: ArrayLike, lows: ArrayLike, period: int) -> np.ndarray:
+    """Punto medio del canal de Donchian"""
+    return (rolling_max(highs, period) + rolling_min(lows, period)) / 2
+
+
+def ichimoku(highs: ArrayLike, lows: ArrayLike, tenkan_period: int = 9, kijun_period: int = 26,
+             senkou_b_period: int = 52) -> Dict[str, np.ndarray]:
+    """Ichimoku Cloud
+
+    ``senkou_a`` promedia tenkan y kijun de la misma vela, alineándolas por
+    el final. La versión anterior las alineaba por el inicio, con valores
+    distintos a los de la referencia y a los de ``StreamingIchimoku``.
+    """
+    highs, lows = as_array(highs), as_array(lows)
+    if length(highs) < senkou_b_period:
+        none = empty(highs)
+        return {"tenkan": none, "kijun": none, "senkou_a": none, "senkou_b": none, "chikou": none}
+    tenkan = donchian(highs, lows, tenkan_period)
+    kijun = donchian(highs, lows, kijun_period)
+    size = min(length(tenkan), length(kijun))
+    return {
+        "tenkan": tenkan,
+        "kijun": kijun,
+        "senkou_a": (tenkan[..., length(tenkan) - size:] + kijun[..., length(kijun) - size:]) / 2,
+        "senkou_b": donchian(highs, lows, senkou_b_period),
+        # Chikou Span (desplazado 26 períodos)
+        "chikou": lows[..., kijun_period:]
+    }
+
+
+def to_list(values: np.ndarray) -> List[float]:
+    """Convierte un array en una lista redondeada a 2 decimales"""
+    return np.round(values, 2).tolist()
+
+
+def last(values: np.ndarray):
+    return float(values[-1]) if len(values) else None
 
 
 class TechnicalIndicators:
+    """Indicadores técnicos que devuelven listas redondeadas a 2 decimales
+
+    Los cálculos se hacen con las funciones vectorizadas de este módulo, que
+    también pueden usarse directamente con ndarrays, incluso 2-D (activos ×
+    tiempo). Los métodos ``format_*`` dan formato a una sola fila.
+    """
+
     @staticmethod
     def calculate_sma(prices: List[float], period: int) -> List[float]:
         """Calcula la Media Móvil Simple (SMA)"""
-        if len(prices) < period:
-            return []
-
-        sma_values = []
-        for i in range(len(prices) - period + 1):
-            sma = sum(prices[i:(i + period)]) / period
-            sma_values.append(round(sma, 2))
-        return sma_values
+        return to_list(sma(prices, period))
 
     @staticmethod
     def calculate_ema(prices: List[float], period: int) -> List[float]:
         """Calcula la Media Móvil Exponencial (EMA)"""
-        if len(prices) < period:
-            return []
-
-        multiplier = 2 / (period + 1)
-        ema_values = [sum(prices[:period]) / period]
-
-        for price in prices[period:]:
-            ema = (price * multiplier) + (ema_values[-1] * (1 - multiplier))
-            ema_values.append(round(ema, 2))
-        return ema_values
+        return to_list(ema(prices, period))
 
     @staticmethod
     def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
         """Calcula el Índice de Fuerza Relativa (RSI)"""
-        if len(prices) < period + 1:
-            return []
-
-        deltas = np.diff(prices)
-        gain = np.where(deltas > 0, deltas, 0)
-        loss = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.concatenate(([np.mean(gain[:period])], gain[period:]))
-        avg_loss = np.concatenate(([np.mean(loss[:period])], loss[period:]))
-
-        for i in range(1, len(avg_gain)):
-            avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[period + i - 1]) / period
-            avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[period + i - 1]) / period
-
-        rs = avg_gain / np.where(avg_loss == 0, 0.00001, avg_loss)
-        rsi = 100 - (100 / (1 + rs))
-        return [round(x, 2) for x in rsi.tolist()]
+        return to_list(rsi(prices, period))
 
     @staticmethod
     def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> \
     Dict[str, List[float]]:
         """Calcula el MACD (Moving Average Convergence Divergence)"""
-        if len(prices) < slow_period:
-            return {"macd": [], "signal": [], "histogram": []}
-
-        fast_ema = TechnicalIndicators.calculate_ema(prices, fast_period)
-        slow_ema = TechnicalIndicators.calculate_ema(prices, slow_period)
-
-        macd_line = []
-        for i in range(len(slow_ema)):
-            macd = fast_ema[i + (len(fast_ema) - len(slow_ema))] - slow_ema[i]
-            macd_line.append(round(macd, 2))
-
-        signal_line = TechnicalIndicators.calculate_ema(macd_line, signal_period)
-
-        histogram = []
-        for i in range(len(signal_line)):
-            hist = macd_line[i + (len(macd_line) - len(signal_line))] - signal_line[i]
-            histogram.append(round(hist, 2))
+        return TechnicalIndicators.format_macd(macd(prices, fast_period, slow_period, signal_period))
 
+    @staticmethod
+    def format_macd(data: Dict[str, np.ndarray]) -> Dict[str, List[float]]:
+        if not len(data["macd"]):
+            return {"macd": [], "signal": [], "histogram": []}
+        macd_line = to_list(data["macd"])
+        signal_line = to_list(data["signal"])
+        histogram = to_list(data["histogram"])
         return {
             "macd": macd_line,
             "signal": signal_line,
@@ -86,27 +284,24 @@ class TechnicalIndicators:
     @staticmethod
     def calculate_bollinger_bands(prices: List[float], period: int = 20, num_std: float = 2) -> Dict[str, List[float]]:
         """Calcula las Bandas de Bollinger"""
-        if len(prices) < period:
-            return {"upper": [], "middle": [], "lower": []}
-
-        sma = TechnicalIndicators.calculate_sma(prices, period)
-        std = []
-
-        for i in range(len(prices) - period + 1):
-            window = prices[i:(i + period)]
-            std.append(np.std(window))
-
-        upper_band = [sma[i] + (std[i] * num_std) for i in range(len(sma))]
-        lower_band = [sma[i] - (std[i] * num_std) for i in range(len(sma))]
+        return TechnicalIndicators.format_bollinger_bands(bollinger_bands(prices, period, num_std))
 
+    @staticmethod
+    def format_bollinger_bands(data: Dict[str, np.ndarray]) -> Dict[str, List[float]]:
+        if not len(data["middle"]):
+            return {"upper": [], "middle": [], "lower": []}
+        # Las bandas parten de la media redondeada, como en la salida original.
+        middle = np.round(data["middle"], 2)
+        upper = middle + (data["upper"] - data["middle"])
+        lower = middle - (data["middle"] - data["lower"])
         return {
-            "upper": [round(x, 2) for x in upper_band],
-            "middle": [round(x, 2) for x in sma],
-            "lower": [round(x, 2) for x in lower_band],
+            "upper": to_list(upper),
+            "middle": to_list(middle),
+            "lower": to_list(lower),
             "current": {
-                "upper": upper_band[-1] if upper_band else None,
-                "middle": sma[-1] if sma else None,
-                "lower": lower_band[-1] if lower_band else None
+                "upper": last(upper),
+                "middle": last(middle),
+                "lower": last(lower)
             }
         }
 
@@ -114,23 +309,14 @@ class TechnicalIndicators:
     def calculate_stochastic(prices: List[float], highs: List[float], lows: List[float], k_period: int = 14,
                              d_period: int = 3) -> Dict[str, List[float]]:
         """Calcula el Oscilador Estocástico"""
-        if len(prices) < k_period:
-            return {"k": [], "d": []}
-
-        k_values = []
-
-        for i in range(len(prices) - k_period + 1):
-            window_high = max(highs[i:i + k_period])
-            window_low = min(lows[i:i + k_period])
-
-            if window_high == window_low:
-                k = 100
-            else:
-                k = ((prices[i + k_period - 1] - window_low) / (window_high - window_low)) * 100
-            k_values.append(round(k, 2))
-
-        d_values = TechnicalIndicators.calculate_sma(k_values, d_period)
+        return TechnicalIndicators.format_stochastic(stochastic(prices, highs, lows, k_period, d_period))
 
+    @staticmethod
+    def format_stochastic(data: Dict[str, np.ndarray]) -> Dict[str, List[float]]:
+        if not len(data["k"]):
+            return {"k": [], "d": []}
+        k_values = to_list(data["k"])
+        d_values = to_list(data["d"])
         return {
             "k": k_values,
             "d": d_values,
@@ -143,99 +329,27 @@ class TechnicalIndicators:
     @staticmethod
     def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> List[float]:
         """Calcula el Average True Range (ATR)"""
-        if len(highs) < period:
-            return []
-
-        true_ranges = []
-        for i in range(1, len(highs)):
-            high = highs[i]
-            low = lows[i]
-            prev_close = closes[i - 1]
-
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-
-            true_range = max(tr1, tr2, tr3)
-            true_ranges.append(true_range)
-
-        atr_values = [sum(true_ranges[:period]) / period]
-
-        for i in range(period, len(true_ranges)):
-            atr = (atr_values[-1] * (period - 1) + true_ranges[i]) / period
-            atr_values.append(round(atr, 2))
-
-        return atr_values
+        return to_list(atr(highs, lows, closes, period))
 
     @staticmethod
     def calculate_adx(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> Dict[
         str, List[float]]:
         """Calcula el Average Directional Index (ADX)"""
-        if len(highs) < period + 1:
-            return {"adx": [], "plus_di": [], "minus_di": []}
-
-        # Calcular True Range
-        tr = []
-        plus_dm = []
-        minus_dm = []
-
-        for i in range(1, len(highs)):
-            high = highs[i]
-            low = lows[i]
-            prev_high = highs[i - 1]
-            prev_low = lows[i - 1]
-            prev_close = closes[i - 1]
-
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            tr.append(max(tr1, tr2, tr3))
-
-            plus_dm1 = high - prev_high
-            minus_dm1 = prev_low - low
-
-            if plus_dm1 > minus_dm1 and plus_dm1 > 0:
-                plus_dm.append(plus_dm1)
-            else:
-                plus_dm.append(0)
-
-            if minus_dm1 > plus_dm1 and minus_dm1 > 0:
-                minus_dm.append(minus_dm1)
-            else:
-                minus_dm.append(0)
-
-        # Calcular los promedios
-        tr_avg = [sum(tr[:period]) / period]
-        plus_di_avg = [sum(plus_dm[:period]) / period * 100 / tr_avg[0]]
-        minus_di_avg = [sum(minus_dm[:period]) / period * 100 / tr_avg[0]]
-
-        for i in range(period, len(tr)):
-            tr_avg.append((tr_avg[-1] * (period - 1) + tr[i]) / period)
-            plus_di = (plus_di_avg[-1] * (period - 1) + plus_dm[i]) / period
-            minus_di = (minus_di_avg[-1] * (period - 1) + minus_dm[i]) / period
-
-            plus_di_avg.append(plus_di * 100 / tr_avg[-1])
-            minus_di_avg.append(minus_di * 100 / tr_avg[-1])
-
-        # Calcular ADX
-        dx_values = []
-        for i in range(len(plus_di_avg)):
-            dx = abs(plus_di_avg[i] - minus_di_avg[i]) / (plus_di_avg[i] + minus_di_avg[i]) * 100
-            dx_values.append(dx)
-
-        adx_values = [sum(dx_values[:period]) / period]
-        for i in range(period, len(dx_values)):
-            adx = (adx_values[-1] * (period - 1) + dx_values[i]) / period
-            adx_values.append(round(adx, 2))
+        return TechnicalIndicators.format_adx(adx(highs, lows, closes, period))
 
+    @staticmethod
+    def format_adx(data: Dict[str, np.ndarray]) -> Dict[str, List[float]]:
+        if not len(data["plus_di"]):
+            return {"adx": [], "plus_di": [], "minus_di": []}
+        adx_values = to_list(data["adx"])
         return {
             "adx": adx_values,
-            "plus_di": [round(x, 2) for x in plus_di_avg],
-            "minus_di": [round(x, 2) for x in minus_di_avg],
+            "plus_di": to_list(data["plus_di"]),
+            "minus_di": to_list(data["minus_di"]),
             "current": {
                 "adx": adx_values[-1] if adx_values else None,
-                "plus_di": plus_di_avg[-1] if plus_di_avg else None,
-                "minus_di": minus_di_avg[-1] if minus_di_avg else None
+                "plus_di": last(data["plus_di"]),
+                "minus_di": last(data["minus_di"])
             }
         }
 
@@ -245,7 +359,13 @@ class TechnicalIndicators:
                            kijun_period: int = 26,
                            senkou_b_period: int = 52) -> Dict[str, List[float]]:
         """Calcula el Ichimoku Cloud"""
-        if len(highs) < senkou_b_period:
+        return TechnicalIndicators.format_ichimoku(
+            ichimoku(highs, lows, tenkan_period, kijun_period, senkou_b_period)
+        )
+
+    @staticmethod
+    def format_ichimoku(data: Dict[str, np.ndarray]) -> Dict[str, List[float]]:
+        if not len(data["tenkan"]):
             return {
                 "tenkan": [],
                 "kijun": [],
@@ -253,39 +373,166 @@ class TechnicalIndicators:
                 "senkou_b": [],
                 "chikou": []
             }
+        result = {name: to_list(values) for name, values in data.items()}
+        result["current"] = {name: last(values) for name, values in data.items()}
+        return result
 
-        def donchian(high_prices: List[float], low_prices: List[float], period: int) -> List[float]:
-            result = []
-            for i in range(len(high_prices) - period + 1):
-                highest = max(high_prices[i:i + period])
-                lowest = min(low_prices[i:i + period])
-                result.append((highest + lowest) / 2)
-            return result
+    @staticmethod
+    def format_series(data: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Formato de los indicadores de una sola serie (RSI, SMA, EMA, ATR)"""
+        (name, values), = data.items()
+        values = to_list(values)
+        return {name: values, "current": values[-1] if values else None, "history_size": len(values)}
+
+
+Kernel = Callable[..., Dict[str, np.ndarray]]
+Formatter = Callable[[Dict[str, np.ndarray]], Dict[str, Any]]
+INDICATORS: Dict[str, Tuple[Kernel, Formatter, str]] = {}
+
+
+def register_indicator(name: str, series: str, formatter: Formatter = TechnicalIndicators.format_series):
+    """Registra un indicador para ``calculate_indicators``
+
+    La función decorada recibe el dict de ``candles_to_arrays`` (o de
+    ``candles_to_matrix``) y los parámetros como argumentos con nombre, y
+    devuelve un dict de ndarrays calculados sobre el último eje.
+    ``formatter`` convierte el resultado de una fila en el dict público y
+    ``series`` es la clave cuya longitud fija los timestamps.
+    """
+    def decorator(kernel: Kernel) -> Kernel:
+        INDICATORS[name.upper()] = (kernel, formatter, series)
+        return kernel
+
+    return decorator
+
+
+CANDLE_FIELDS = ("time", "open", "close", "high", "low")
+
+
+def candles_to_arrays(candles: List[dict]) -> Dict[str, np.ndarray]:
+    """Convierte una lista de velas en ndarrays ``time``, ``open``, ``close``, ``high`` y ``low``"""
+    rows = np.array([tuple(candle[field] for field in CANDLE_FIELDS) for candle in candles], dtype=np.float64)
+    rows = rows.reshape(-1, len(CANDLE_FIELDS))
+    return {field: rows[:, i] for i, field in enumerate(CANDLE_FIELDS)}
+
+
+def candles_to_matrix(candles: Dict[str, List[dict]], size: int = None) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """Apila las últimas ``size`` velas de cada activo en arrays 2-D (activos × tiempo)
+
+    Por defecto ``size`` es la mediana de los históricos, así un activo con
+    pocas velas no recorta a los demás. Los activos con menos de ``size``
+    velas se excluyen. Devuelve la lista de activos en el orden de las filas
+    y el dict de arrays.
+    """
+    lengths = [len(rows) for rows in candles.values() if rows]
+    if size is None:
+        size = int(np.median(lengths)) if lengths else 0
+    assets = [asset for asset, rows in candles.items() if rows and len(rows) >= size]
+    matrix = np.array(
+        [[tuple(candle[field] for field in CANDLE_FIELDS) for candle in candles[asset][-size:]] for asset in assets],
+        dtype=np.float64
+    ).reshape(len(assets), size, len(CANDLE_FIELDS))
+    return assets, {field: matrix[..., i] for i, field in enumerate(CANDLE_FIELDS)}
 
-        # Cálculo de las líneas
-        tenkan = donchian(highs, lows, tenkan_period)
-        kijun = donchian(highs, lows, kijun_period)
-        senkou_b = donchian(highs, lows, senkou_b_period)
 
-        # Senkou Span A (Promedio de Tenkan y Kijun)
-        senkou_a = []
-        for i in range(min(len(tenkan), len(kijun))):
-            senkou_a.append((tenkan[i] + kijun[i]) / 2)
+def parse_spec(spec: Union[str, dict]) -> Tuple[str, str, dict]:
+    """Devuelve el nombre, la clave del resultado y los parámetros de un spec"""
+    if isinstance(spec, str):
+        spec = {"indicator": spec}
+    name = spec["indicator"].upper()
+    return name, spec.get("key") or name, spec.get("params") or {}
 
-        # Chikou Span (Precio de cierre desplazado 26 períodos hacia atrás)
-        chikou = lows[kijun_period:]
 
-        return {
-            "tenkan": [round(x, 2) for x in tenkan],
-            "kijun": [round(x, 2) for x in kijun],
-            "senkou_a": [round(x, 2) for x in senkou_a],
-            "senkou_b": [round(x, 2) for x in senkou_b],
-            "chikou": [round(x, 2) for x in chikou],
-            "current": {
-                "tenkan": tenkan[-1] if tenkan else None,
-                "kijun": kijun[-1] if kijun else None,
-                "senkou_a": senkou_a[-1] if senkou_a else None,
-                "senkou_b": senkou_b[-1] if senkou_b else None,
-                "chikou": chikou[-1] if chikou else None
-            }
-        }
\ No newline at end of file
+def _format(raw: Dict[str, np.ndarray], formatter: Formatter, series: str, timestamps: List[float]) -> dict:
+    result = formatter(raw)
+    size = length(raw[series])
+    result["timestamps"] = timestamps[-size:] if size else []
+    return result
+
+
+def calculate_indicators(data: Dict[str, np.ndarray], specs: List[Union[str, dict]],
+                         assets: List[str] = None) -> Dict[str, dict]:
+    """Calcula varios indicadores registrados sobre los mismos arrays
+
+    Cada spec es un nombre (``"RSI"``) o un dict con ``indicator``,
+    ``params`` opcionales y ``key`` opcional para el resultado, que por
+    defecto es el nombre del indicador. Un error en un indicador se
+    devuelve como ``{"error": ...}`` en su clave sin afectar al resto.
+
+    Con ``assets`` los arrays son 2-D (activos × tiempo, ver
+    ``candles_to_matrix``): cada indicador se calcula una sola vez para
+    todas las filas y el resultado es ``{asset: {key: ...}}``.
+    """
+    parsed = [parse_spec(spec) for spec in specs]
+    keys = [key for _, key, _ in parsed]
+    for key in keys:
+        if keys.count(key) > 1:
+            raise ValueError(f"Clave de indicador duplicada: '{key}'")
+    rows = [None] if assets is None else range(len(assets))
+    times = [data["time"].tolist()] if assets is None else data["time"].tolist()
+    results = [{} for _ in rows]
+    for name, key, params in parsed:
+        entry = INDICATORS.get(name)
+        if entry is None:
+            error = {"error": f"Indicador '{name}' no soportado"}
+        else:
+            kernel, formatter, series = entry
+            try:
+                raw = kernel(data, **params)
+                error = None
+            except Exception as e:
+                error = {"error": f"Error calculando el indicador: {str(e)}"}
+        for i, row in enumerate(rows):
+            if error:
+                results[i][key] = dict(error)
+                continue
+            row_raw = raw if row is None else {field: values[row] for field, values in raw.items()}
+            results[i][key] = _format(row_raw, formatter, series, times[i])
+    if assets is None:
+        return results[0]
+    return dict(zip(assets, results))
+
+
+@register_indicator("RSI", "rsi")
+def _rsi(data, period=14):
+    return {"rsi": rsi(data["close"], period)}
+
+
+@register_indicator("MACD", "macd", TechnicalIndicators.format_macd)
+def _macd(data, fast_period=12, slow_period=26, signal_period=9):
+    return macd(data["close"], fast_period, slow_period, signal_period)
+
+
+@register_indicator("SMA", "sma")
+def _sma(data, period=20):
+    return {"sma": sma(data["close"], period)}
+
+
+@register_indicator("EMA", "ema")
+def _ema(data, period=20):
+    return {"ema": ema(data["close"], period)}
+
+
+@register_indicator("BOLLINGER", "middle", TechnicalIndicators.format_bollinger_bands)
+def _bollinger(data, period=20, std=2):
+    return bollinger_bands(data["close"], period, std)
+
+
+@register_indicator("STOCHASTIC", "k", TechnicalIndicators.format_stochastic)
+def _stochastic(data, k_period=14, d_period=3):
+    return stochastic(data["close"], data["high"], data["low"], k_period, d_period)
+
+
+@register_indicator("ATR", "atr")
+def _atr(data, period=14):
+    return {"atr": atr(data["high"], data["low"], data["close"], period)}
+
+
+@register_indicator("ADX", "adx", TechnicalIndicators.format_adx)
+def _adx(data, period=14):
+    return adx(data["high"], data["low"], data["close"], period)
+
+
+@register_indicator("ICHIMOKU", "tenkan", TechnicalIndicators.format_ichimoku)
+def _ichimoku(data, tenkan_period=9, kijun_period=26, senkou_b_period=52):
+    return ichimoku(data["high"], data["low"], tenkan_period, kijun_period, senkou_b_period)
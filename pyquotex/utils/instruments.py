@@ -0,0 +1,267 @@
+"""Module for indexing the instruments/list pushed by Quotex."""
+import bisect
+import logging
+import threading
+from collections import namedtuple
+from pyquotex.ws.correlation import RequestTracker
+
+logger = logging.getLogger(__name__)
+
+Instrument = namedtuple(
+    "Instrument",
+    "id symbol name payment is_open turbo_payment profit_24h profit_1m profit_5m raw"
+)
+Instrument.__doc__ = """One row of ``instruments/list`` with named fields.
+
+``raw`` is the row as received, for callers that need other columns.
+"""
+
+InstrumentChange = namedtuple("InstrumentChange", "kind symbol old new")
+InstrumentChange.__doc__ = """A change between two ``instruments/list`` snapshots.
+
+``kind`` is one of :data:`CHANGE_KINDS`; ``old`` is ``None`` for an added
+instrument and ``new`` is ``None`` for a removed one.
+"""
+
+CHANGE_KINDS = ("added", "removed", "opened", "closed", "payout_changed")
+
+PAYOUT_CHANGE_FIELDS = ("payment", "turbo_payment", "profit_24h", "profit_1m", "profit_5m")
+
+# Timeframes of the payout views, as accepted by Quotex.get_payout_by_asset.
+PAYOUT_FIELDS = {
+    "24H": "profit_24h",
+    "1": "profit_1m",
+    "5": "profit_5m"
+}
+
+
+def parse_instrument(row):
+    """Build an :class:`Instrument` from a raw ``instruments/list`` row."""
+    return Instrument(
+        id=row[0],
+        symbol=row[1],
+        name=row[2].replace("\n", ""),
+        payment=row[5],
+        is_open=row[14],
+        turbo_payment=row[18],
+        profit_24h=row[-10],
+        profit_1m=row[-9],
+        profit_5m=row[-8],
+        raw=row
+    )
+
+
+def diff_instrument(old, new):
+    """Changes from one version of an instrument to the next.
+
+    :param old: The previous :class:`Instrument`, ``None`` when it is new.
+    :param new: The current :class:`Instrument`.
+    :returns: A list of :class:`InstrumentChange`.
+    """
+    if old is None:
+        return [InstrumentChange("added", new.symbol, None, new)]
+    changes = []
+    if bool(old.is_open) != bool(new.is_open):
+        kind = "opened" if new.is_open else "closed"
+        changes.append(InstrumentChange(kind, new.symbol, old, new))
+    if any(getattr(old, field) != getattr(new, field) for field in PAYOUT_CHANGE_FIELDS):
+        changes.append(InstrumentChange("payout_changed", new.symbol, old, new))
+    return changes
+
+
+def _payout(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class InstrumentCatalog(object):
+    """O(1) instrument lookups, rebuilt from each ``instruments/list`` push.
+
+    Instruments are indexed by symbol, by asset id and by display name.
+    The open assets and the assets sorted by payout are kept as views that
+    an update only touches for the instruments whose fields changed, so the
+    usual push, where a few payouts moved, costs a handful of bisects.
+    Updates come from the websocket thread; reads of the views are guarded
+    by a lock, single lookups are plain dict reads. A changed instrument
+    overwrites its index entries in place, so lookups never miss it.
+
+    Every snapshot is diffed against the previous one and the differences
+    are published as :class:`InstrumentChange` events, to callbacks and to
+    waiters from :meth:`wait_change`, so consumers react to payout moves
+    and assets opening or closing without rescanning the list. The first
+    snapshot reports every instrument as added.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.by_symbol = {}
+        self.by_id = {}
+        self.by_name = {}
+        self.open = {}
+        self.payouts = {timeframe: [] for timeframe in PAYOUT_FIELDS}
+        self.callbacks = []
+        self.waiters = RequestTracker()
+
+    def __len__(self):
+        return len(self.by_symbol)
+
+    def __iter__(self):
+        return iter(list(self.by_symbol.values()))
+
+    def __contains__(self, symbol):
+        return symbol in self.by_symbol
+
+    def get(self, symbol):
+        """Get an instrument by symbol, e.g. ``"EURUSD_otc"``, or ``None``."""
+        return self.by_symbol.get(symbol)
+
+    def get_by_id(self, asset_id):
+        return self.by_id.get(asset_id)
+
+    def get_by_name(self, name):
+        """Get an instrument by display name, e.g. ``"EUR/USD (OTC)"``, or ``None``."""
+        return self.by_name.get(name)
+
+    def add_callback(self, callback):
+        """Register ``callback(change)`` for :class:`InstrumentChange` events.
+
+        Callbacks run on the thread that feeds the updates and must not block.
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self.callbacks.remove(callback)
+
+    def register_change(self, symbol=None):
+        """Register a future for the next change.
+
+        :param symbol: (optional) Only changes of this instrument.
+        :returns: The :class:`asyncio.Future`; it resolves with the
+            :class:`InstrumentChange`.
+        """
+        return self.waiters.register("change", symbol)
+
+    async def wait_change(self, symbol=None, timeout=None):
+        """Wait for the next change.
+
+        :param symbol: (optional) Only changes of this instrument.
+        :param timeout: Seconds to wait, ``None`` waits forever.
+        """
+        future = self.register_change(symbol)
+        return await self.waiters.wait("change", future, timeout)
+
+    def update(self, rows):
+        """Apply an ``instruments/list`` push.
+
+        :param rows: The raw instrument rows.
+        :returns: The list of :class:`InstrumentChange` events.
+        """
+        instruments = {}
+        for row in rows:
+            instrument = parse_instrument(row)
+            instruments[instrument.symbol] = instrument
+        changes = []
+        with self.__lock:
+            for symbol in self.by_symbol.keys() - instruments.keys():
+                old = self.by_symbol[symbol]
+                self.remove(old)
+                changes.append(InstrumentChange("removed", symbol, old, None))
+            for symbol, instrument in instruments.items():
+                old = self.by_symbol.get(symbol)
+                if old is not None and old[:-1] == instrument[:-1]:
+                    # Unchanged: keep the views, only refresh the raw row.
+                    self.index(instrument)
+                    continue
+                if old is not None:
+                    self.replace(old, instrument)
+                else:
+                    self.add(instrument)
+                changes.extend(diff_instrument(old, instrument))
+        for change in changes:
+            self.publish(change)
+        return changes
+
+    def publish(self, change):
+        for callback in self.callbacks:
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Instrument change callback failed.")
+        self.waiters.resolve_matching(
+            "change",
+            change,
+            lambda key: key is None or key == change.symbol
+        )
+
+    def index(self, instrument):
+        self.by_symbol[instrument.symbol] = instrument
+        self.by_name[instrument.name] = instrument
+        if instrument.id != "":
+            self.by_id[instrument.id] = instrument
+        if instrument.is_open:
+            self.open[instrument.symbol] = instrument
+
+    def add(self, instrument):
+        self.index(instrument)
+        self.add_payouts(instrument)
+
+    def replace(self, old, new):
+        # Overwrite the index entries in place, so a concurrent lookup
+        # never sees the symbol missing.
+        self.index(new)
+        if old.name != new.name and self.by_name.get(old.name) is old:
+            del self.by_name[old.name]
+        if old.id != new.id and self.by_id.get(old.id) is old:
+            del self.by_id[old.id]
+        if not new.is_open:
+            self.open.pop(new.symbol, None)
+        self.remove_payouts(old)
+        self.add_payouts(new)
+
+    def add_payouts(self, instrument):
+        for timeframe, field in PAYOUT_FIELDS.items():
+            key = (-_payout(getattr(instrument, field)), instrument.symbol)
+            bisect.insort(self.payouts[timeframe], key)
+
+    def remove_payouts(self, instrument):
+        for timeframe, field in PAYOUT_FIELDS.items():
+            view = self.payouts[timeframe]
+            key = (-_payout(getattr(instrument, field)), instrument.symbol)
+            index = bisect.bisect_left(view, key)
+            if index < len(view) and view[index] == key:
+                del view[index]
+
+    def remove(self, instrument):
+        del self.by_symbol[instrument.symbol]
+        if self.by_name.get(instrument.name) is instrument:
+            del self.by_name[instrument.name]
+        if self.by_id.get(instrument.id) is instrument:
+            del self.by_id[instrument.id]
+        self.open.pop(instrument.symbol, None)
+        self.remove_payouts(instrument)
+
+    def get_open(self):
+        """Get the instruments open for trading."""
+        with self.__lock:
+            return list(self.open.values())
+
+    def get_by_payout(self, timeframe="1", open_only=True, n=None):
+        """Get instruments sorted by payout, highest first.
+
+        :param str timeframe: ``"1"``, ``"5"`` (minutes) or ``"24H"``.
+        :param bool open_only: Skip instruments closed for trading.
+        :param int n: (optional) Only the first ``n`` instruments.
+        """
+        if timeframe not in self.payouts:
+            raise ValueError(f"Unknown payout timeframe '{timeframe}', expected one of {list(PAYOUT_FIELDS)}.")
+        result = []
+        with self.__lock:
+            for _, symbol in self.payouts[timeframe]:
+                if n is not None and len(result) >= n:
+                    break
+                if open_only and symbol not in self.open:
+                    continue
+                result.append(self.by_symbol[symbol])
+        return result
@@ -0,0 +1,266 @@
+"""Module for parameter sweeps and walk-forward optimization of strategies."""
+import random
+import logging
+import itertools
+import functools
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pyquotex.utils.store import CandleStore
+from pyquotex.utils.backtest import backtest
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("time", "open", "close", "high", "low")
+
+# Candle arrays of the current worker process, loaded once by ``load_history``.
+_history = {}
+
+
+def parameter_grid(space):
+    """Every combination of a parameter space.
+
+    :param dict space: Lists of candidate values keyed by parameter name.
+    :returns: A list of parameter dicts.
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_parameters(space, samples, seed=None):
+    """Random samples of a parameter space.
+
+    :param dict space: Per parameter either a list of candidates or a
+        ``(low, high)`` tuple, sampled uniformly (as ints when both are ints).
+    :param int samples: Number of parameter sets.
+    :param seed: (optional) Seed for reproducible sweeps.
+    :returns: A list of parameter dicts.
+    """
+    rng = random.Random(seed)
+
+    def sample(values):
+        if isinstance(values, tuple):
+            low, high = values
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(low, high)
+        return rng.choice(values)
+
+    return [{name: sample(values) for name, values in space.items()} for _ in range(samples)]
+
+
+def walk_forward_splits(start, end, train, test, step=None):
+    """Split a time range into rolling train/test windows.
+
+    :param start: Range start timestamp.
+    :param end: Range end timestamp.
+    :param train: Train window length in seconds.
+    :param test: Test window length in seconds, right after the train window.
+    :param step: (optional) Shift between folds, defaults to ``test``.
+    :returns: A list of ``((train_start, train_end), (test_start, test_end))``.
+    """
+    step = step or test
+    folds = []
+    fold_start = start
+    while fold_start + train + test <= end:
+        train_end = fold_start + train
+        folds.append(((fold_start, train_end), (train_end, train_end + test)))
+        fold_start += step
+    return folds
+
+
+def metrics(rows):
+    """Aggregate ``(signals, wins, losses, draws, profit)`` rows.
+
+    :returns: A dict with the totals, ``win_rate`` and ``expectancy``, the
+        mean profit per trade in stake units.
+    """
+    signals = sum(row[0] for row in rows)
+    wins = sum(row[1] for row in rows)
+    losses = sum(row[2] for row in rows)
+    profit = sum(row[4] for row in rows)
+    return {
+        "signals": signals,
+        "wins": wins,
+        "losses": losses,
+        "draws": sum(row[3] for row in rows),
+        "win_rate": wins / (wins + losses) if wins + losses else 0.0,
+        "expectancy": profit / signals if signals else 0.0,
+        "profit": profit
+    }
+
+
+def load_history(root, period, assets, start, end):
+    """Load stored candles into the current process.
+
+    Runs once per worker as the pool initializer; the store is read through
+    ``numpy.memmap``, so workers share the OS page cache instead of
+    downloading or copying the history between processes.
+    """
+    store = CandleStore(root)
+    _history.clear()
+    for asset in assets:
+        records = store.read(asset, period, start, end)
+        if len(records):
+            _history[asset] = {field: np.asarray(records[field], dtype=np.float64) for field in FIELDS}
+
+
+def evaluate(strategy, params, segments, min_confidence, options):
+    """Score one parameter set on every loaded asset and segment.
+
+    :returns: A dict keyed by asset with one
+        ``(signals, wins, losses, draws, profit)`` row per segment.
+    """
+    rows = {}
+    for asset, data in _history.items():
+        signals = strategy(**params).signals(data)
+        if isinstance(signals, tuple):
+            directions, confidence = signals
+            directions = np.where(confidence > min_confidence, directions, 0)
+        else:
+            directions = signals
+        rows[asset] = []
+        for segment_start, segment_end in segments:
+            lo, hi = np.searchsorted(data["time"], [segment_start, segment_end])
+            part = {field: values[lo:hi] for field, values in data.items()}
+            result = backtest(part, directions[lo:hi], **options)
+            rows[asset].append(
+                (result["signals"], result["wins"], result["losses"], result["draws"], result["profit"])
+            )
+    return rows
+
+
+class Optimizer(object):
+    """Sweep strategy parameters over stored candle history.
+
+    ``strategy`` is a picklable callable, usually a class, that builds a
+    strategy from keyword parameters; the strategy must provide
+    ``signals(data)`` returning the directions per candle, or a
+    ``(directions, confidence)`` tuple. Every worker loads the history
+    from the :class:`CandleStore <pyquotex.utils.store.CandleStore>`
+    once, then each parameter set is one task over all assets.
+    """
+
+    def __init__(
+            self,
+            strategy,
+            store,
+            period=60,
+            workers=None,
+            min_confidence=0.0,
+            **backtest_options
+    ):
+        """
+        :param strategy: Callable building a strategy from parameters.
+        :param store: The :class:`CandleStore <pyquotex.utils.store.CandleStore>`
+            or its root directory.
+        :param int period: Candle period in seconds.
+        :param int workers: Worker processes, all cores when ``None`` and
+            inline in this process when ``0``.
+        :param float min_confidence: Signals with a lower confidence are ignored.
+        :param backtest_options: Passed to :func:`backtest <pyquotex.utils.backtest.backtest>`,
+            e.g. ``expiry``, ``payout`` or ``mtg``.
+        """
+        self.strategy = strategy
+        self.root = store.root if isinstance(store, CandleStore) else store
+        self.period = period
+        self.workers = workers
+        self.min_confidence = min_confidence
+        self.backtest_options = backtest_options
+
+    def run_tasks(self, parameter_sets, assets, start, end, segments):
+        task = functools.partial(
+            evaluate,
+            self.strategy,
+            segments=segments,
+            min_confidence=self.min_confidence,
+            options=self.backtest_options
+        )
+        history = (self.root, self.period, assets, start, end)
+        if self.workers == 0:
+            load_history(*history)
+            return [task(params) for params in parameter_sets]
+        # Spawned workers do not inherit the event loop, threads or sockets
+        # of a running client, as forked ones would.
+        with ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=load_history,
+                initargs=history
+        ) as pool:
+            return list(pool.map(task, parameter_sets))
+
+    def optimize(
+            self,
+            parameter_sets,
+            assets,
+            start,
+            end,
+            train=None,
+            test=None,
+            step=None,
+            score="expectancy",
+            min_signals=20
+    ):
+        """Evaluate parameter sets, optionally walk-forward.
+
+        :param parameter_sets: Parameter dicts, e.g. from :func:`parameter_grid`
+            or :func:`random_parameters`.
+        :param assets: Asset names, read from the store.
+        :param start: Range start timestamp.
+        :param end: Range end timestamp.
+        :param train: (optional) Walk-forward train window in seconds.
+        :param test: (optional) Walk-forward test window in seconds.
+        :param step: (optional) Shift between folds, defaults to ``test``.
+        :param str score: Metric that ranks parameter sets on the train window.
+        :param int min_signals: Train signals needed to pick a parameter set.
+        :returns: A dict with ``results``, one entry per parameter set with
+            its ``params``, ``train`` and ``test`` metrics over all folds and
+            assets (``train`` covers the whole range without walk-forward),
+            and with walk-forward also ``folds``, the best parameters of
+            each train window with their out-of-sample metrics, and
+            ``walk_forward``, the metrics of those picks over all test windows.
+        """
+        start, end = int(start), int(end)
+        folds = walk_forward_splits(start, end, train, test, step) if train and test else []
+        segments = [segment for fold in folds for segment in fold] or [(start, end)]
+        rows = self.run_tasks(parameter_sets, assets, start, end, segments)
+
+        def segment_rows(index, position):
+            return [asset_rows[position] for asset_rows in rows[index].values()]
+
+        results = []
+        for index, params in enumerate(parameter_sets):
+            train_rows = [row for position in range(0, len(segments), 2 if folds else 1)
+                          for row in segment_rows(index, position)]
+            test_rows = [row for position in range(1, len(segments), 2) for row in segment_rows(index, position)]
+            results.append({
+                "params": params,
+                "train": metrics(train_rows),
+                "test": metrics(test_rows) if folds else None
+            })
+        if not folds:
+            return {"results": results}
+
+        picks = []
+        oos_rows = []
+        for number, (train_range, test_range) in enumerate(folds):
+            ranked = []
+            for index in range(len(parameter_sets)):
+                train_metrics = metrics(segment_rows(index, number * 2))
+                if train_metrics["signals"] >= min_signals:
+                    ranked.append((train_metrics[score], index, train_metrics))
+            if not ranked:
+                logger.debug(f"No parameter set reached {min_signals} signals in fold {number}.")
+                continue
+            _, best, train_metrics = max(ranked, key=lambda item: item[0])
+            test_rows = segment_rows(best, number * 2 + 1)
+            oos_rows.extend(test_rows)
+            picks.append({
+                "train": train_range,
+                "test": test_range,
+                "params": parameter_sets[best],
+                "train_metrics": train_metrics,
+                "test_metrics": metrics(test_rows)
+            })
+        return {"results": results, "folds": picks, "walk_forward": metrics(oos_rows)}
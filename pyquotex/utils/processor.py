@@ -153,6 +153,46 @@ def merge_candles(candles_data):
     return merged_list
 
 
+def build_candles(asset, period, response):
+    """Build sorted, deduplicated candles from a ``history/list/v2`` response."""
+    candles_data = calculate_candles(response.get("history", []), period)
+    candles_v2_data = process_candles_v2({asset: response}, asset, candles_data)
+    return merge_candles(candles_v2_data)
+
+
+def build_history_candles(response, period):
+    """Build sorted, deduplicated candles from a ``history/load`` response.
+
+    The rows arrive under ``data`` or ``candles`` as
+    ``[time, open, close, high, low, ticks]`` lists or as candle dicts;
+    tick rows ``[time, price, ...]`` are grouped into candles of ``period``.
+    """
+    rows = response.get("data") or response.get("candles") or response.get("history") or []
+    if isinstance(rows, dict):
+        rows = rows.get("candles") or rows.get("history") or []
+    candles = []
+    ticks = []
+    for row in rows:
+        if isinstance(row, dict):
+            if "time" in row and "open" in row:
+                candles.append(row)
+        elif isinstance(row, (list, tuple)):
+            if len(row) >= 5:
+                candles.append({
+                    "time": row[0],
+                    "open": row[1],
+                    "close": row[2],
+                    "high": row[3],
+                    "low": row[4],
+                    "ticks": row[5] if len(row) > 5 else 0
+                })
+            elif len(row) >= 2:
+                ticks.append(row)
+    if ticks:
+        candles += calculate_candles(ticks, period)
+    return merge_candles(candles)
+
+
 def aggregate_candle(tick, candles):
     for timestamp, data in tick.items():
         candle = candles.setdefault(timestamp, {
@@ -0,0 +1,231 @@
+"""Module for running strategies once per candle, aligned to server time."""
+import time
+import heapq
+import asyncio
+import inspect
+import logging
+import itertools
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJob(object):
+    """One strategy registration of a :class:`BarScheduler`."""
+
+    def __init__(self, asset, period, callback, offset):
+        self.asset = asset
+        self.period = period
+        self.callback = callback
+        self.offset = offset
+        self.next_bar = None
+        self.seq = None
+        self.active = True
+
+    def fire_time(self, bar, grace):
+        """Server time at which the job fires for the bar starting at ``bar``."""
+        if self.offset:
+            return bar + self.period - self.offset
+        return bar + self.period + grace
+
+
+class BarScheduler(object):
+    """Fire callbacks once per bar of each registered asset and period.
+
+    Jobs wait in one heap ordered by their next fire time on the server
+    clock, so each event costs ``O(log n)`` no matter how many thousands of
+    asset/timeframe pairs are registered. Jobs with an ``offset`` fire that
+    many seconds before the bar closes, e.g. in a signal window. Jobs at
+    the close fire as soon as :meth:`on_candle_close` sees the candle close
+    in the realtime stream, or from the heap ``grace`` seconds later when
+    no tick closes it. A job never fires twice for the same bar and bars
+    missed while the loop was blocked are skipped, not replayed.
+    """
+
+    def __init__(self, clock=time.time, grace=2.0):
+        """
+        :param clock: Callable returning the current server timestamp.
+        :param float grace: Seconds a job at the close waits for the stream
+            before the timer fires it.
+        """
+        self.clock = clock
+        self.grace = grace
+        self.heap = []
+        self.jobs = {}
+        self.counter = itertools.count()
+        self.tasks = set()
+        self.task = None
+        self.loop = None
+        self.wakeup = asyncio.Event()
+        self.fired_stream = 0
+        self.fired_timer = 0
+        self.max_delay = 0.0
+
+    def due_bar(self, job, now):
+        """Start of the latest bar whose fire time has passed."""
+        lead = job.offset or -self.grace
+        return int((now - job.period + lead) // job.period * job.period)
+
+    def first_bar(self, job, now):
+        """Start of the first bar to fire, never one that closed before ``now``."""
+        return max(self.due_bar(job, now) + job.period, int(now // job.period * job.period))
+
+    def push(self, job):
+        job.seq = next(self.counter)
+        heapq.heappush(self.heap, (job.fire_time(job.next_bar, self.grace), job.seq, job))
+
+    def register(self, asset, period, callback, offset=0):
+        """Register a strategy.
+
+        :param asset: The asset name; ``None`` registers a job driven by
+            the clock alone, e.g. a periodic report.
+        :param int period: The candle period in seconds.
+        :param callback: ``callback(event)``, a function or coroutine
+            function; ``event`` is a dict with ``asset``, ``period``, the
+            bar ``time``, its ``close_time`` and the closed ``candle`` when
+            the stream closed it, ``None`` otherwise.
+        :param float offset: Seconds before the close to fire, ``0`` fires
+            at the close.
+        :returns: The :class:`ScheduledJob`, to pass to :meth:`unregister`.
+        """
+        if not 0 <= offset < period:
+            raise ValueError(f"The offset must be within the period, got {offset} for {period}s.")
+        job = ScheduledJob(asset, period, callback, offset)
+        job.next_bar = self.first_bar(job, self.clock())
+        self.jobs.setdefault((asset, period), []).append(job)
+        self.push(job)
+        self.wakeup.set()
+        return job
+
+    def unregister(self, job):
+        job.active = False
+        job.seq = None
+        jobs = self.jobs.get((job.asset, job.period), [])
+        if job in jobs:
+            jobs.remove(job)
+        if not jobs:
+            self.jobs.pop((job.asset, job.period), None)
+
+    async def wait(self, asset, period, offset=0, timeout=None):
+        """Wait for the next bar of an asset and period.
+
+        :returns: The event a registered callback would get.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        def resolve(event):
+            if not future.done():
+                future.set_result(event)
+
+        job = self.register(asset, period, resolve, offset)
+        self.start()
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.unregister(job)
+
+    def on_candle_close(self, asset, period, candle):
+        """Candle close callback for the :class:`CandleAggregator
+        <pyquotex.utils.aggregator.CandleAggregator>`; safe to call from
+        the websocket thread.
+        """
+        if self.loop is None or (asset, period) not in self.jobs:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.handle_close(asset, period, candle)
+        else:
+            self.loop.call_soon_threadsafe(self.handle_close, asset, period, candle)
+
+    def handle_close(self, asset, period, candle):
+        for job in list(self.jobs.get((asset, period), [])):
+            if not job.offset and self.fire(job, candle["time"], candle):
+                self.fired_stream += 1
+
+    def fire(self, job, bar, candle=None):
+        if not job.active or bar < job.next_bar:
+            return False
+        job.next_bar = max(bar + job.period, self.first_bar(job, self.clock()))
+        self.push(job)
+        event = {
+            "asset": job.asset,
+            "period": job.period,
+            "time": bar,
+            "close_time": bar + job.period,
+            "candle": candle
+        }
+        try:
+            result = job.callback(event)
+        except Exception:
+            logger.exception("Scheduled job failed.")
+            return True
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self.tasks.add(task)
+            task.add_done_callback(self.task_done)
+        return True
+
+    def task_done(self, task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Scheduled job failed.", exc_info=task.exception())
+
+    def run_due(self):
+        """Fire every job that is due.
+
+        :returns: Seconds until the next fire time, ``None`` without jobs.
+        """
+        while self.heap:
+            fire_time, seq, job = self.heap[0]
+            if seq != job.seq:
+                # Unregistered, or already fired by the stream.
+                heapq.heappop(self.heap)
+                continue
+            now = self.clock()
+            if fire_time > now:
+                return fire_time - now
+            heapq.heappop(self.heap)
+            self.max_delay = max(self.max_delay, now - fire_time)
+            if self.fire(job, max(job.next_bar, self.due_bar(job, now))):
+                self.fired_timer += 1
+        return None
+
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        while True:
+            self.wakeup.clear()
+            delay = self.run_due()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self.run())
+            self.loop = asyncio.get_running_loop()
+        return self.task
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        for task in list(self.tasks):
+            task.cancel()
+
+    def get_stats(self):
+        """Get the registrations and how jobs fired.
+
+        :returns: A dict with ``jobs``, the ``heap`` size, the jobs fired
+            by the ``stream`` and by the ``timer`` and ``max_delay_ms``, the
+            worst lateness of a timer.
+        """
+        return {
+            "jobs": sum(len(jobs) for jobs in self.jobs.values()),
+            "heap": len(self.heap),
+            "stream": self.fired_stream,
+            "timer": self.fired_timer,
+            "max_delay_ms": self.max_delay * 1e3
+        }
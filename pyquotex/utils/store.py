@@ -0,0 +1,156 @@
+"""Module for the on-disk candle store."""
+import os
+import re
+import threading
+import numpy as np
+
+CANDLE_DTYPE = np.dtype([
+    ("time", "<i8"),
+    ("open", "<f8"),
+    ("close", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("ticks", "<i8"),
+])
+
+
+def to_records(candles):
+    """Convert candle dicts to a sorted, deduplicated record array.
+
+    :param candles: Candle dicts with ``time``, ``open``, ``close``,
+        ``high``, ``low`` and optionally ``ticks``.
+    :returns: A :class:`numpy.ndarray` of :data:`CANDLE_DTYPE`.
+    """
+    records = np.array([
+        (
+            int(candle["time"]),
+            float(candle["open"]),
+            float(candle["close"]),
+            float(candle.get("high", candle.get("max", 0))),
+            float(candle.get("low", candle.get("min", 0))),
+            int(candle.get("ticks") or 0)
+        )
+        for candle in candles
+    ], dtype=CANDLE_DTYPE)
+    if not len(records):
+        return records
+    # Keep the last occurrence of each time, like a later server response wins.
+    records = records[::-1]
+    _, unique = np.unique(records["time"], return_index=True)
+    return records[unique]
+
+
+def to_dicts(records):
+    """Convert records back to the candle dicts returned by ``get_candles``."""
+    return [
+        {
+            "time": int(record["time"]),
+            "open": float(record["open"]),
+            "close": float(record["close"]),
+            "high": float(record["high"]),
+            "low": float(record["low"]),
+            "ticks": int(record["ticks"])
+        }
+        for record in records
+    ]
+
+
+class CandleStore(object):
+    """Append-only candle files keyed by asset and period.
+
+    Each ``(asset, period)`` pair is a flat file of fixed-size records
+    sorted by time and read through :class:`numpy.memmap`, so range
+    lookups are a binary search and no JSON is parsed. Candles newer than
+    the last stored one are appended in place; older or overlapping
+    candles rewrite the file atomically. Writes to one file are serialized
+    by a lock per ``(asset, period)``, so the store can be shared by the
+    event loop and writer threads.
+    """
+
+    def __init__(self, root="candles"):
+        """
+        :param root: Directory holding the candle files.
+        """
+        self.root = root
+        self.__lock = threading.Lock()
+        self.__locks = {}
+        os.makedirs(root, exist_ok=True)
+
+    def lock(self, asset, period):
+        """Get the lock of an ``(asset, period)`` file."""
+        with self.__lock:
+            lock = self.__locks.get((asset, period))
+            if lock is None:
+                lock = self.__locks[(asset, period)] = threading.RLock()
+            return lock
+
+    def path(self, asset, period):
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", asset)
+        return os.path.join(self.root, f"{name}_{int(period)}.bin")
+
+    def read(self, asset, period, start=None, end=None):
+        """Read stored candles as a record array.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param start: (optional) First candle time to include.
+        :param end: (optional) Exclusive end time.
+        :returns: A read-only :class:`numpy.memmap` slice, empty when
+            nothing is stored.
+        """
+        path = self.path(asset, period)
+        with self.lock(asset, period):
+            if not os.path.exists(path) or os.path.getsize(path) < CANDLE_DTYPE.itemsize:
+                return np.empty(0, dtype=CANDLE_DTYPE)
+            # Appends only grow the file and rewrites replace it, so the
+            # mapping stays valid after the lock is released.
+            records = np.memmap(path, dtype=CANDLE_DTYPE, mode="r")
+        times = records["time"]
+        lo = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+        hi = len(records) if end is None else int(np.searchsorted(times, end, side="left"))
+        return records[lo:hi]
+
+    def get(self, asset, period, start=None, end=None):
+        """Read stored candles as a list of dicts."""
+        return to_dicts(self.read(asset, period, start, end))
+
+    def bounds(self, asset, period):
+        """Get the first and last stored candle times.
+
+        :returns: A tuple ``(first, last)``, ``(None, None)`` when empty.
+        """
+        records = self.read(asset, period)
+        if not len(records):
+            return None, None
+        return int(records[0]["time"]), int(records[-1]["time"])
+
+    def append(self, asset, period, candles):
+        """Store closed candles.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param candles: Candle dicts or a :data:`CANDLE_DTYPE` array.
+        :returns: The number of candles written.
+        """
+        if isinstance(candles, np.ndarray):
+            new = candles.astype(CANDLE_DTYPE)
+        else:
+            new = to_records(candles)
+        if not len(new):
+            return 0
+        with self.lock(asset, period):
+            path = self.path(asset, period)
+            first, last = self.bounds(asset, period)
+            if last is None or new["time"][0] > last:
+                with open(path, "ab") as f:
+                    f.write(new.tobytes())
+                return len(new)
+            existing = np.array(self.read(asset, period))
+            merged = np.concatenate([existing, new])
+            merged = merged[::-1]
+            _, unique = np.unique(merged["time"], return_index=True)
+            merged = merged[unique]
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(merged.tobytes())
+            os.replace(f"{path}.tmp", path)
+            return len(merged) - len(existing)
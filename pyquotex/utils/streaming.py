@@ -0,0 +1,418 @@
+"""Module for incremental technical indicators."""
+from collections import deque
+
+
+class Smoother(object):
+    """Exponential smoothing seeded with the simple mean of the first values.
+
+    Matches :func:`pyquotex.utils.indicators.ewm` as used by ``ema`` and
+    ``wilder``: ``None`` until ``period`` values were seen.
+    """
+
+    def __init__(self, period, alpha):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.total = 0.0
+        self.value = None
+
+    def preview(self, x):
+        if self.value is not None:
+            return self.alpha * x + (1 - self.alpha) * self.value
+        if self.count + 1 == self.period:
+            return (self.total + x) / self.period
+        return None
+
+    def update(self, x):
+        value = self.preview(x)
+        if self.count < self.period:
+            self.total += x
+        self.count += 1
+        self.value = value
+        return value
+
+
+def ema_smoother(period):
+    return Smoother(period, 2 / (period + 1))
+
+
+def wilder_smoother(period):
+    return Smoother(period, 1 / period)
+
+
+class RollingWindow(object):
+    """Rolling mean and population std over the last ``period`` values."""
+
+    def __init__(self, period):
+        self.period = period
+        self.values = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        # Sums are kept relative to the first value to limit cancellation.
+        self.reference = None
+
+    def stats(self, total, total_sq, reference):
+        mean = total / self.period
+        variance = max(total_sq / self.period - mean * mean, 0.0)
+        return mean + reference, variance ** 0.5
+
+    def preview(self, x):
+        if len(self.values) + 1 < self.period:
+            return None
+        reference = x if self.reference is None else self.reference
+        x -= reference
+        total, total_sq = self.total + x, self.total_sq + x * x
+        if len(self.values) == self.period:
+            oldest = self.values[0]
+            total -= oldest
+            total_sq -= oldest * oldest
+        return self.stats(total, total_sq, reference)
+
+    def update(self, x):
+        if self.reference is None:
+            self.reference = x
+        x -= self.reference
+        self.values.append(x)
+        self.total += x
+        self.total_sq += x * x
+        if len(self.values) > self.period:
+            oldest = self.values.popleft()
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        if len(self.values) < self.period:
+            return None
+        return self.stats(self.total, self.total_sq, self.reference)
+
+
+class RollingExtreme(object):
+    """Rolling max (or min) over the last ``period`` values.
+
+    Uses a monotonic deque, so both :meth:`update` and :meth:`preview`
+    are O(1) amortized.
+    """
+
+    def __init__(self, period, maximum=True):
+        self.period = period
+        self.sign = 1 if maximum else -1
+        self.window = deque()
+        self.index = 0
+
+    def preview(self, x):
+        if self.index + 1 < self.period:
+            return None
+        value = x * self.sign
+        dropped = self.index - self.period
+        best = value
+        for position in range(min(2, len(self.window))):
+            index, candidate = self.window[position]
+            if index > dropped:
+                best = max(best, candidate)
+                break
+        return best * self.sign
+
+    def update(self, x):
+        value = x * self.sign
+        window = self.window
+        while window and window[-1][1] <= value:
+            window.pop()
+        window.append((self.index, value))
+        while window[0][0] <= self.index - self.period:
+            window.popleft()
+        self.index += 1
+        if self.index < self.period:
+            return None
+        return window[0][1] * self.sign
+
+
+class StreamingIndicator(object):
+    """Base class of the incremental indicators.
+
+    :meth:`update` consumes a closed candle and returns the new value,
+    :meth:`preview` returns the value the indicator would have if the
+    given in-progress candle closed now, without changing the state. Both
+    are O(1) and the state is O(period).
+    """
+
+    name = None
+    warmup = 1
+
+    def __init__(self):
+        self.value = None
+
+    def seed(self, candles):
+        """Feed closed candles, oldest first.
+
+        :returns: The current value.
+        """
+        for candle in candles:
+            self.update(candle)
+        return self.value
+
+    def update(self, candle):
+        self.value = self.compute(candle, True)
+        return self.value
+
+    def preview(self, candle):
+        return self.compute(candle, False)
+
+    def compute(self, candle, commit):
+        raise NotImplementedError
+
+
+class StreamingSMA(StreamingIndicator):
+    name = "SMA"
+
+    def __init__(self, period=20):
+        super().__init__()
+        self.window = RollingWindow(period)
+        self.warmup = period
+
+    def compute(self, candle, commit):
+        close = float(candle["close"])
+        stats = self.window.update(close) if commit else self.window.preview(close)
+        return stats[0] if stats else None
+
+
+class StreamingEMA(StreamingIndicator):
+    name = "EMA"
+
+    def __init__(self, period=20):
+        super().__init__()
+        self.smoother = ema_smoother(period)
+        self.warmup = period
+
+    def compute(self, candle, commit):
+        close = float(candle["close"])
+        return self.smoother.update(close) if commit else self.smoother.preview(close)
+
+
+class StreamingRSI(StreamingIndicator):
+    name = "RSI"
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.gain = wilder_smoother(period)
+        self.loss = wilder_smoother(period)
+        self.prev_close = None
+        self.warmup = period + 1
+
+    def compute(self, candle, commit):
+        close = float(candle["close"])
+        if self.prev_close is None:
+            if commit:
+                self.prev_close = close
+            return None
+        delta = close - self.prev_close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        if commit:
+            self.prev_close = close
+            avg_gain, avg_loss = self.gain.update(gain), self.loss.update(loss)
+        else:
+            avg_gain, avg_loss = self.gain.preview(gain), self.loss.preview(loss)
+        if avg_gain is None:
+            return None
+        rs = avg_gain / (avg_loss if avg_loss != 0 else 0.00001)
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingMACD(StreamingIndicator):
+    name = "MACD"
+
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        super().__init__()
+        self.fast = ema_smoother(fast_period)
+        self.slow = ema_smoother(slow_period)
+        self.signal = ema_smoother(signal_period)
+        self.warmup = slow_period + signal_period
+
+    def compute(self, candle, commit):
+        close = float(candle["close"])
+        step = "update" if commit else "preview"
+        fast = getattr(self.fast, step)(close)
+        slow = getattr(self.slow, step)(close)
+        if slow is None:
+            return {"macd": None, "signal": None, "histogram": None}
+        macd = fast - slow
+        signal = getattr(self.signal, step)(macd)
+        return {
+            "macd": macd,
+            "signal": signal,
+            "histogram": macd - signal if signal is not None else None
+        }
+
+
+class StreamingBollinger(StreamingIndicator):
+    name = "BOLLINGER"
+
+    def __init__(self, period=20, std=2):
+        super().__init__()
+        self.window = RollingWindow(period)
+        self.num_std = std
+        self.warmup = period
+
+    def compute(self, candle, commit):
+        close = float(candle["close"])
+        stats = self.window.update(close) if commit else self.window.preview(close)
+        if stats is None:
+            return {"upper": None, "middle": None, "lower": None}
+        middle, std = stats
+        return {
+            "upper": middle + std * self.num_std,
+            "middle": middle,
+            "lower": middle - std * self.num_std
+        }
+
+
+class StreamingATR(StreamingIndicator):
+    name = "ATR"
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.smoother = wilder_smoother(period)
+        self.prev_close = None
+        self.warmup = period + 1
+
+    def true_range(self, candle):
+        high, low = float(candle["high"]), float(candle["low"])
+        return max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+
+    def compute(self, candle, commit):
+        if self.prev_close is None:
+            if commit:
+                self.prev_close = float(candle["close"])
+            return None
+        tr = self.true_range(candle)
+        if not commit:
+            return self.smoother.preview(tr)
+        self.prev_close = float(candle["close"])
+        return self.smoother.update(tr)
+
+
+class StreamingADX(StreamingIndicator):
+    name = "ADX"
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.tr = wilder_smoother(period)
+        self.plus_dm = wilder_smoother(period)
+        self.minus_dm = wilder_smoother(period)
+        self.dx = wilder_smoother(period)
+        self.prev = None
+        self.warmup = period * 2
+
+    def compute(self, candle, commit):
+        high, low, close = float(candle["high"]), float(candle["low"]), float(candle["close"])
+        if self.prev is None:
+            if commit:
+                self.prev = (high, low, close)
+            return {"adx": None, "plus_di": None, "minus_di": None}
+        prev_high, prev_low, prev_close = self.prev
+        up, down = high - prev_high, prev_low - low
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        plus_dm = up if up > down and up > 0 else 0.0
+        minus_dm = down if down > up and down > 0 else 0.0
+        step = "update" if commit else "preview"
+        if commit:
+            self.prev = (high, low, close)
+        tr_avg = getattr(self.tr, step)(tr)
+        plus_avg = getattr(self.plus_dm, step)(plus_dm)
+        minus_avg = getattr(self.minus_dm, step)(minus_dm)
+        if tr_avg is None:
+            return {"adx": None, "plus_di": None, "minus_di": None}
+        plus_di = plus_avg * 100 / tr_avg if tr_avg else 0.0
+        minus_di = minus_avg * 100 / tr_avg if tr_avg else 0.0
+        total = plus_di + minus_di
+        dx = abs(plus_di - minus_di) / total * 100 if total else 0.0
+        return {"adx": getattr(self.dx, step)(dx), "plus_di": plus_di, "minus_di": minus_di}
+
+
+class StreamingStochastic(StreamingIndicator):
+    name = "STOCHASTIC"
+
+    def __init__(self, k_period=14, d_period=3):
+        super().__init__()
+        self.highs = RollingExtreme(k_period)
+        self.lows = RollingExtreme(k_period, maximum=False)
+        self.d = RollingWindow(d_period)
+        self.warmup = k_period + d_period
+
+    def compute(self, candle, commit):
+        high, low, close = float(candle["high"]), float(candle["low"]), float(candle["close"])
+        step = "update" if commit else "preview"
+        window_high = getattr(self.highs, step)(high)
+        window_low = getattr(self.lows, step)(low)
+        if window_high is None:
+            return {"k": None, "d": None}
+        spread = window_high - window_low
+        k = 100.0 if spread == 0 else (close - window_low) / spread * 100
+        d = getattr(self.d, step)(k)
+        return {"k": k, "d": d[0] if d else None}
+
+
+class StreamingIchimoku(StreamingIndicator):
+    name = "ICHIMOKU"
+
+    def __init__(self, tenkan_period=9, kijun_period=26, senkou_b_period=52):
+        super().__init__()
+        self.lines = {
+            name: (RollingExtreme(period), RollingExtreme(period, maximum=False))
+            for name, period in (
+                ("tenkan", tenkan_period),
+                ("kijun", kijun_period),
+                ("senkou_b", senkou_b_period)
+            )
+        }
+        self.warmup = senkou_b_period
+
+    def compute(self, candle, commit):
+        high, low = float(candle["high"]), float(candle["low"])
+        step = "update" if commit else "preview"
+        result = {}
+        for name, (highs, lows) in self.lines.items():
+            window_high = getattr(highs, step)(high)
+            window_low = getattr(lows, step)(low)
+            result[name] = (window_high + window_low) / 2 if window_high is not None else None
+        tenkan, kijun = result["tenkan"], result["kijun"]
+        result["senkou_a"] = (tenkan + kijun) / 2 if kijun is not None else None
+        result["chikou"] = low
+        return result
+
+
+STREAMING_INDICATORS = {
+    indicator.name: indicator
+    for indicator in (
+        StreamingSMA,
+        StreamingEMA,
+        StreamingRSI,
+        StreamingMACD,
+        StreamingBollinger,
+        StreamingATR,
+        StreamingADX,
+        StreamingStochastic,
+        StreamingIchimoku,
+    )
+}
+
+
+def create_streaming_indicator(indicator, params=None):
+    """Create an incremental indicator by name.
+
+    :param str indicator: The indicator name, e.g. ``"RSI"``.
+    :param dict params: (optional) Keyword arguments, with the same names
+        as in ``Quotex.calculate_indicator``.
+    :raises ValueError: If the indicator is not supported.
+    """
+    cls = STREAMING_INDICATORS.get(indicator.upper())
+    if cls is None:
+        raise ValueError(f"Indicador '{indicator}' no soportado para tiempo real")
+    return cls(**(params or {}))
+
+
+def seed_streaming_indicator(stream, candles):
+    """Seed ``stream`` with closed candles and return it.
+
+    Returning the indicator lets the seeding run on a process pool, where
+    the caller receives a seeded copy.
+    """
+    stream.seed(candles)
+    return stream
@@ -0,0 +1,113 @@
+"""Module for Quotex asyncio websocket transport."""
+import asyncio
+import logging
+from .client import WebsocketClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWebsocketClient(WebsocketClient):
+    """Quotex API websocket client running inside the asyncio event loop.
+
+    Uses the same handler table as :class:`WebsocketClient`, but frames
+    are read by a task on the caller's loop, so handlers resolve awaiting
+    futures directly. Keepalive pings and reconnection run as tasks too;
+    each reconnect authorizes again and restores the active subscriptions
+    through :meth:`on_open <WebsocketClient.on_open>`. Requires the
+    optional ``websockets`` package.
+    """
+
+    def __init__(self, api):
+        """
+        :param api: The instance of :class:`QuotexAPI
+            <pyquotex.api.QuotexAPI>`.
+        """
+        super().__init__(api)
+        self.task = None
+        self.keepalive_task = None
+        self.closing = False
+
+    def create_app(self):
+        # The connection is opened by :meth:`run`.
+        return None
+
+    def start(self, ssl_context=None, ping_interval=24, reconnect=5):
+        """Start the transport task on the running loop.
+
+        :param ssl_context: (optional) The :class:`ssl.SSLContext` used to connect.
+        :param ping_interval: Seconds between Engine.IO ``"2"`` pings.
+        :param reconnect: Seconds to wait before reconnecting, ``0`` disables it.
+        :returns: The transport :class:`asyncio.Task`.
+        """
+        self.closing = False
+        self.task = asyncio.get_running_loop().create_task(
+            self.run(ssl_context, ping_interval, reconnect),
+            name="quotex-websocket"
+        )
+        return self.task
+
+    async def run(self, ssl_context=None, ping_interval=24, reconnect=5):
+        """Connect, read frames until the connection drops and reconnect."""
+        try:
+            from websockets.asyncio.client import connect
+        except ImportError:
+            raise ImportError(
+                "The asyncio transport requires the 'websockets' package. "
+                "Install it with `pip install pyquotex[async]`."
+            )
+
+        headers = {
+            "User-Agent": self.headers["User-Agent"],
+            "Origin": self.headers["Origin"],
+        }
+        while not self.closing:
+            try:
+                async with connect(
+                        self.api.wss_url,
+                        additional_headers=headers,
+                        user_agent_header=None,
+                        ssl=ssl_context if self.api.wss_url.startswith("wss") else None,
+                        ping_interval=None,
+                        max_size=None
+                ) as wss:
+                    self.wss = wss
+                    self.on_open(wss)
+                    self.keepalive_task = asyncio.create_task(self.keepalive(ping_interval))
+                    try:
+                        async for message in wss:
+                            self.on_message(wss, message)
+                    finally:
+                        self.keepalive_task.cancel()
+                    self.on_close(wss, wss.close_code, wss.close_reason)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.on_error(self.wss, e)
+                self.on_close(self.wss, None, str(e))
+            if not reconnect or self.closing:
+                break
+            await asyncio.sleep(reconnect)
+
+    async def keepalive(self, interval):
+        """Send Engine.IO pings while the connection is open."""
+        while True:
+            await asyncio.sleep(interval)
+            self.api.send_websocket_request("2")
+
+    async def send(self, data):
+        """Write a frame to the current connection.
+
+        :param str data: The websocket frame.
+        """
+        await self.wss.send(data)
+
+    async def close(self):
+        """Close the connection and stop reconnecting."""
+        self.closing = True
+        if self.wss is not None:
+            await self.wss.close()
+        if self.task is not None:
+            try:
+                await asyncio.wait_for(self.task, 5)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self.task.cancel()
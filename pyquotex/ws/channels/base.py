@@ -8,9 +8,10 @@ class Base(object):
         """
         self.api = api
 
-    def send_websocket_request(self, data):
+    def send_websocket_request(self, data, ttl=None):
         """Send request to Quotex server websocket.
         :param str data: The websocket channel data.
+        :param ttl: (optional) Seconds the frame may wait for the connection.
         :returns: The instance of :class:`requests.Response`.
         """
-        return self.api.send_websocket_request(data)
+        return self.api.send_websocket_request(data, ttl=ttl)
@@ -1,6 +1,6 @@
 import json
-import time
 from pyquotex.ws.channels.base import Base
+from pyquotex.ws.sender import ORDER_FRAME_TTL
 from pyquotex.expiration import get_expiration_time_quotex
 
 
@@ -13,7 +13,7 @@ class Buy(Base):
         option_type = 1
 
         expiration_time = get_expiration_time_quotex(
-            int(time.time()),
+            int(self.api.timesync.now()),
             duration
         )
         expiration = expiration_time
@@ -49,4 +49,4 @@ class Buy(Base):
 
         data = f'42["orders/open",{json.dumps(payload)}]'
         print(data)
-        self.send_websocket_request(data)
+        self.send_websocket_request(data, ttl=ORDER_FRAME_TTL)
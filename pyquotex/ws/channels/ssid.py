@@ -18,4 +18,5 @@ class Ssid(Base):
             "tournamentId": 0
         }
         data = f'42["authorization",{json.dumps(payload)}]'
-        self.send_websocket_request(data)
+        # Kept by the send queue and written first after every reconnect.
+        self.api.send_queue.authorize(data)
@@ -1,9 +1,9 @@
 """Module for Quotex websocket."""
-import json
 import time
 import logging
 import websocket
-from .. import global_value
+from .dispatcher import FrameDispatcher
+from ..utils.buffers import SENTIMENT_DTYPE
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +18,27 @@ class WebsocketClient(object):
         trace_ws: Enables and disable `enableTrace` in WebSocket Client.
         """
         self.api = api
+        self.last_tick = None
         self.headers = {
             "User-Agent": self.api.session_data.get("user_agent"),
             "Origin": self.api.https_url,
             "Host": f"ws2.{self.api.host}",
         }
 
+        self.dispatcher = FrameDispatcher(
+            classifier=self.classify,
+            on_packet=self.on_packet
+        )
+        self.register_handlers()
+        self.wss = self.create_app()
+
+    def create_app(self):
+        """Create the threaded websocket application.
+
+        :returns: The instance of :class:`WebSocketApp <websocket.WebSocketApp>`.
+        """
         websocket.enableTrace(self.api.trace_ws)
-        self.wss = websocket.WebSocketApp(
+        return websocket.WebSocketApp(
             self.api.wss_url,
             on_message=self.on_message,
             on_error=self.on_error,
@@ -39,151 +52,277 @@ class WebsocketClient(object):
 
     def on_message(self, wss, message):
         """Method to process websocket messages."""
-        global_value.ssl_Mutual_exclusion = True
-        current_time = time.localtime()
-        if current_time.tm_sec in [0, 5, 10, 15, 20, 30, 40, 50]:
-            self.wss.send('42["tick"]')
-        try:
-            if "authorization/reject" in str(message):
-                print("Token rejected, making automatic reconnection.")
-                logger.debug("Token rejected, making automatic reconnection.")
-                global_value.check_rejected_connection = 1
-            elif "s_authorization" in str(message):
-                global_value.check_accepted_connection = 1
-                global_value.check_rejected_connection = 0
-            elif "instruments/list" in str(message):
-                global_value.started_listen_instruments = True
+        now = int(time.time())
+        # One tick per matching second, not one per inbound frame.
+        if now != self.last_tick and time.localtime(now).tm_sec in [0, 5, 10, 15, 20, 30, 40, 50]:
+            self.last_tick = now
+            self.api.send_websocket_request('42["tick"]')
+        self.dispatcher.dispatch(message)
 
-            try:
-                message = message[1:].decode()
-                logger.debug(message)
-                message = json.loads(message)
-                self.api.wss_message = message
-                if "call" in str(message) or 'put' in str(message):
-                    self.api.instruments = message
-                if isinstance(message, dict):
-                    if message.get("signals"):
-                        time_in = message.get("time")
-                        for i in message["signals"]:
-                            try:
-                                self.api.signal_data[i[0]] = {}
-                                self.api.signal_data[i[0]][i[2]] = {}
-                                self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
-                                self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
-                            except:
-                                self.api.signal_data[i[0]] = {}
-                                self.api.signal_data[i[0]][time_in] = {}
-                                self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
-                                self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
-                    elif message.get("liveBalance") or message.get("demoBalance"):
-                        self.api.account_balance = message
-                    elif message.get("position"):
-                        self.api.top_list_leader = message
-                    elif len(message) == 1 and message.get("profit", -1) > -1:
-                        self.api.profit_today = message
-                    elif message.get("index"):
-                        self.api.historical_candles = message
-                        self.api.timesync.server_timestamp = message.get("closeTimestamp")
-                    if message.get("pending"):
-                        self.api.pending_successful = message
-                        self.api.pending_id = message["pending"]["ticket"]
-                    elif message.get("id") and not message.get("ticket"):
-                        self.api.buy_successful = message
-                        self.api.buy_id = message["id"]
-                        self.api.timesync.server_timestamp = message.get("closeTimestamp")
-                    elif message.get("ticket") and not message.get("id"):
-                        self.api.sold_options_respond = message
-                    elif message.get("deals"):
-                        for get_m in message["deals"]:
-                            self.api.profit_in_operation = get_m["profit"]
-                            get_m["win"] = True if message["profit"] > 0 else False
-                            get_m["game_state"] = 1
-                            self.api.listinfodata.set(
-                                get_m["win"],
-                                get_m["game_state"],
-                                get_m["id"]
-                            )
-                    elif message.get("isDemo") and message.get("balance"):
-                        self.api.training_balance_edit_request = message
-                    elif message.get("error"):
-                        global_value.websocket_error_reason = message.get("error")
-                        global_value.check_websocket_if_error = True
-                        if global_value.websocket_error_reason == "not_money":
-                            self.api.account_balance = {"liveBalance": 0}
-                    elif not message.get("list") == []:
-                        self.api.wss_message = message
-            except:
-                pass
-
-            if str(message) == "41":
-                logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
-                global_value.check_websocket_if_connect = 0
-            if "51-" in str(message):
-                self.api._temp_status = str(message)
-            elif self.api._temp_status == """451-["settings/list",{"_placeholder":true,"num":0}]""":
-                self.api.settings_list = message
-                self.api._temp_status = ""
-            elif self.api._temp_status == """451-["history/list/v2",{"_placeholder":true,"num":0}]""":
-                if message.get("asset") == self.api.current_asset:
-                    self.api.candles.candles_data = message["history"]
-                    self.api.candle_v2_data[message["asset"]] = message
-                    self.api.candle_v2_data[message["asset"]]["candles"] = [{
-                        "time": candle[0],
-                        "open": candle[1],
-                        "close": candle[2],
-                        "high": candle[3],
-                        "low": candle[4],
-                        "ticks": candle[5]
-                    } for candle in message["candles"]]
-            elif len(message[0]) == 4:
-                result = {
-                    "time": message[0][1],
-                    "price": message[0][2]
+    def register_handlers(self):
+        """Register the handler table for inbound events."""
+        handlers = {
+            "connect": self.on_connect_event,
+            "disconnect": self.on_disconnect_event,
+            "authorization/reject": self.on_authorization_reject,
+            "s_authorization": self.on_authorization,
+            "instruments/list": self.on_instruments_list,
+            "settings/list": self.on_settings_list,
+            "history/list/v2": self.on_history_list,
+            "history/line": self.on_history_line,
+            "quotes/stream": self.on_ticks,
+            "ticks": self.on_ticks,
+            "sentiment": self.on_sentiment,
+            "signals": self.on_signals,
+            "balance": self.on_balance,
+            "leaderboard": self.on_leaderboard,
+            "profit": self.on_profit_today,
+            "pending": self.on_pending,
+            "order/open": self.on_order_open,
+            "order/sell": self.on_order_sell,
+            "deals": self.on_deals,
+            "demo/refill": self.on_demo_refill,
+            "error": self.on_error_message,
+        }
+        for event, handler in handlers.items():
+            self.dispatcher.register(event, handler)
+
+    @staticmethod
+    def classify(payload):
+        """Map a payload without a registered event name to its routes.
+
+        A dict is matched against two independent chains, as an order or
+        deal reply may also carry e.g. an ``index`` or balance key.
+
+        :param payload: The decoded packet payload.
+        :returns: A tuple of route names, empty when nothing matches.
+        """
+        routes = ()
+        if isinstance(payload, dict):
+            if payload.get("signals"):
+                routes += ("signals",)
+            elif payload.get("liveBalance") or payload.get("demoBalance"):
+                routes += ("balance",)
+            elif payload.get("position"):
+                routes += ("leaderboard",)
+            elif len(payload) == 1 and payload.get("profit", -1) > -1:
+                routes += ("profit",)
+            elif payload.get("index"):
+                routes += ("history/line",)
+            if payload.get("pending"):
+                routes += ("pending",)
+            elif payload.get("id") and not payload.get("ticket"):
+                routes += ("order/open",)
+            elif payload.get("ticket") and not payload.get("id"):
+                routes += ("order/sell",)
+            elif payload.get("deals"):
+                routes += ("deals",)
+            elif payload.get("isDemo") and payload.get("balance"):
+                routes += ("demo/refill",)
+            elif payload.get("error"):
+                routes += ("error",)
+        elif isinstance(payload, list) and payload and isinstance(payload[0], list):
+            size = len(payload[0])
+            if size == 4:
+                routes = ("ticks",)
+            elif size == 2:
+                routes = ("sentiment",)
+            elif size > 20:
+                routes = ("instruments/list",)
+        return routes
+
+    def on_packet(self, event, payload):
+        if payload is not None:
+            self.api.wss_message = payload
+
+    def on_connect_event(self, payload):
+        logger.debug("Socket.io namespace connected.")
+
+    def on_disconnect_event(self, payload):
+        logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
+        self.api.state.check_websocket_if_connect = 0
+
+    def on_authorization_reject(self, payload):
+        print("Token rejected, making automatic reconnection.")
+        logger.debug("Token rejected, making automatic reconnection.")
+        self.api.state.check_rejected_connection = 1
+
+    def on_authorization(self, payload):
+        self.api.state.check_accepted_connection = 1
+        self.api.state.check_rejected_connection = 0
+
+    def on_instruments_list(self, payload):
+        self.api.state.started_listen_instruments = True
+        if payload:
+            self.api.instruments = payload
+            self.api.instrument_catalog.update(payload)
+            self.api.pending_requests.resolve_all("instruments", payload)
+
+    def on_settings_list(self, payload):
+        self.api.settings_list = payload
+        self.api.pending_requests.resolve_all("settings", payload)
+
+    def on_history_list(self, payload):
+        asset = payload.get("asset")
+        self.api.candles.candles_data = payload["history"]
+        payload["candles"] = [{
+            "time": candle[0],
+            "open": candle[1],
+            "close": candle[2],
+            "high": candle[3],
+            "low": candle[4],
+            "ticks": candle[5]
+        } for candle in payload["candles"]]
+        # Keep only the latest candles per asset, not the raw tick history.
+        self.api.candle_v2_data[asset] = {
+            key: value for key, value in payload.items() if key != "history"
+        }
+        period = payload.get("period")
+        if period is not None:
+            self.api.pending_requests.resolve("candles", payload, (asset, period))
+        else:
+            # Without a period in the response, any request for the asset matches.
+            self.api.pending_requests.resolve_matching(
+                "candles",
+                payload,
+                lambda key: key[0] == asset
+            )
+
+    def on_history_line(self, payload):
+        self.api.historical_candles = payload
+        if payload.get("closeTimestamp"):
+            self.api.timesync.server_timestamp = payload["closeTimestamp"]
+        self.api.pending_requests.resolve("history", payload, payload.get("index"))
+
+    def on_ticks(self, payload):
+        realtime_price = self.api.realtime_price
+        aggregator = self.api.aggregator
+        for tick in payload:
+            asset = tick[0]
+            prices = realtime_price.get(asset)
+            if prices is not None:
+                prices.append(tick[1], tick[2])
+            if aggregator is not None:
+                aggregator.update(asset, tick[1], tick[2])
+            self.api.realtime_candles[asset] = tick
+        if payload:
+            self.api.timesync.synchronize(payload[-1][1])
+
+    def on_sentiment(self, payload):
+        now = time.time()
+        sentiment_history = self.api.sentiment_history
+        for item in payload:
+            asset = item[0]
+            self.api.realtime_sentiment[asset] = {
+                "sentiment": {
+                    "sell": 100 - int(item[1]),
+                    "buy": int(item[1])
                 }
-                self.api.realtime_price[message[0][0]].append(result)
-                self.api.realtime_candles[self.api.current_asset] = message[0]
-                #print(self.api.realtime_candles)
-            elif len(message[0]) == 2:
-                for i in message:
-                    result = {
-                        "sentiment": {
-                            "sell": 100 - int(i[1]),
-                            "buy": int(i[1])
-                        }
-                    }
-                    self.api.realtime_sentiment[i[0]] = result
-        except:
-            pass
-        global_value.ssl_Mutual_exclusion = False
+            }
+            history = sentiment_history.get(asset)
+            if history is None:
+                history = sentiment_history[asset] = self.api.create_buffer(asset, SENTIMENT_DTYPE)
+            history.append(now, item[1])
+
+    def on_signals(self, payload):
+        time_in = payload.get("time")
+        for i in payload["signals"]:
+            try:
+                self.api.signal_data[i[0]] = {}
+                self.api.signal_data[i[0]][i[2]] = {}
+                self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
+                self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
+            except (IndexError, KeyError, TypeError):
+                self.api.signal_data[i[0]] = {}
+                self.api.signal_data[i[0]][time_in] = {}
+                self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
+                self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
+
+    def on_balance(self, payload):
+        self.api.account_balance = payload
+        self.api.invalidate_profile()
+        self.api.pending_requests.resolve_all("balance", payload)
+
+    def on_leaderboard(self, payload):
+        self.api.top_list_leader = payload
+
+    def on_profit_today(self, payload):
+        self.api.profit_today = payload
+
+    def on_pending(self, payload):
+        self.api.pending_successful = payload
+        self.api.pending_id = payload["pending"]["ticket"]
+        self.api.pending_requests.resolve("pending", payload)
+
+    def on_order_open(self, payload):
+        self.api.buy_successful = payload
+        self.api.buy_id = payload["id"]
+        if payload.get("closeTimestamp"):
+            self.api.timesync.server_timestamp = payload["closeTimestamp"]
+        self.api.pending_requests.resolve("buy", payload, payload.get("requestId"))
+
+    def on_order_sell(self, payload):
+        self.api.sold_options_respond = payload
+        self.api.pending_requests.resolve("sell", payload, payload.get("ticket"))
+
+    def on_deals(self, payload):
+        for get_m in payload["deals"]:
+            self.api.profit_in_operation = get_m["profit"]
+            get_m["win"] = True if payload["profit"] > 0 else False
+            get_m["game_state"] = 1
+            self.api.listinfodata.set(
+                get_m["win"],
+                get_m["game_state"],
+                get_m["id"]
+            )
+            self.api.pending_requests.resolve("deal", get_m, get_m["id"])
+
+    def on_demo_refill(self, payload):
+        self.api.training_balance_edit_request = payload
+        self.api.invalidate_profile()
+        self.api.pending_requests.resolve("demo/refill", payload)
+
+    def on_error_message(self, payload):
+        self.api.state.websocket_error_reason = payload.get("error")
+        self.api.state.check_websocket_if_error = True
+        if self.api.state.websocket_error_reason == "not_money":
+            self.api.account_balance = {"liveBalance": 0}
+        self.api.pending_requests.resolve_all("buy", payload)
+        self.api.pending_requests.resolve_all("pending", payload)
 
     def on_error(self, wss, error):
         """Method to process websocket errors."""
         logger.error(error)
-        global_value.websocket_error_reason = str(error)
-        global_value.check_websocket_if_error = True
+        self.api.state.websocket_error_reason = str(error)
+        self.api.state.check_websocket_if_error = True
 
     def on_open(self, wss):
         """Method to process websocket open."""
         logger.info("Websocket client connected.")
-        global_value.check_websocket_if_connect = 1
+        self.api.state.check_websocket_if_connect = 1
+        self.api.send_queue.mark_connected()
         asset_name = self.api.current_asset
         period = self.api.current_period
-        self.wss.send('42["tick"]')
-        self.wss.send('42["indicator/list"]')
-        self.wss.send('42["drawing/load"]')
-        self.wss.send('42["pending/list"]')
-        self.wss.send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
-        self.wss.send('42["depth/follow","%s"]' % asset_name)
-        self.wss.send('42["chart_notification/get"]')
-        self.wss.send('42["tick"]')
+        send = self.api.send_websocket_request
+        send('42["tick"]')
+        send('42["indicator/list"]')
+        send('42["drawing/load"]')
+        send('42["pending/list"]')
+        send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
+        send('42["depth/follow","%s"]' % asset_name)
+        send('42["chart_notification/get"]')
+        send('42["tick"]')
+        # After a reconnect the send queue writes the authorization first.
+        self.api.resubscribe()
 
     def on_close(self, wss, close_status_code, close_msg):
         """Method to process websocket close."""
         logger.info("Websocket connection closed.")
-        global_value.check_websocket_if_connect = 0
+        self.api.state.check_websocket_if_connect = 0
+        self.api.send_queue.mark_disconnected()
 
     def on_ping(self, wss, ping_msg):
         pass
 
     def on_pong(self, wss, pong_msg):
-        self.wss.send("2")
+        self.api.send_websocket_request("2")
@@ -0,0 +1,117 @@
+"""Module for Quotex websocket request/response correlation."""
+import asyncio
+import threading
+
+
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def _resolve(future, value):
+    loop = future.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        # Already on the awaiting loop (asyncio transport): no thread handoff.
+        _set_result(future, value)
+    else:
+        loop.call_soon_threadsafe(_set_result, future, value)
+
+
+class RequestTracker(object):
+    """Correlate outbound websocket requests with inbound responses.
+
+    Callers register a :class:`asyncio.Future` under a request kind and
+    an optional key (requestId, asset, ticket...) before sending. The
+    websocket handlers resolve it from whatever thread they run on and the
+    caller wakes as soon as the response arrives.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__waiters = {}
+
+    def register(self, kind, key=None):
+        """Register a waiter for a response.
+
+        :param str kind: The request kind, e.g. ``"buy"``.
+        :param key: (optional) The correlation key of the request.
+        :returns: The :class:`asyncio.Future` resolved with the response.
+        """
+        future = asyncio.get_running_loop().create_future()
+        with self.__lock:
+            self.__waiters.setdefault(kind, []).append((key, future))
+        return future
+
+    def discard(self, kind, future):
+        """Remove a waiter that is no longer awaited."""
+        with self.__lock:
+            waiters = self.__waiters.get(kind, [])
+            self.__waiters[kind] = [item for item in waiters if item[1] is not future]
+
+    def resolve(self, kind, value, key=None):
+        """Resolve waiters of a request kind.
+
+        :param str kind: The request kind.
+        :param value: The response passed to the waiters.
+        :param key: (optional) Resolve every waiter registered with this
+            key. When omitted the oldest waiter of the kind is resolved.
+        :returns: The number of waiters resolved.
+        """
+        if key is not None:
+            return self.resolve_matching(kind, value, lambda item_key: item_key == key)
+        with self.__lock:
+            waiters = self.__waiters.get(kind)
+            if not waiters:
+                return 0
+            _, future = waiters.pop(0)
+        _resolve(future, value)
+        return 1
+
+    def resolve_matching(self, kind, value, predicate):
+        """Resolve every waiter of a kind whose key matches a predicate.
+
+        :param str kind: The request kind.
+        :param value: The response passed to the waiters.
+        :param predicate: Callable receiving a waiter key.
+        :returns: The number of waiters resolved.
+        """
+        with self.__lock:
+            waiters = self.__waiters.get(kind)
+            if not waiters:
+                return 0
+            matched = [item for item in waiters if predicate(item[0])]
+            if matched:
+                self.__waiters[kind] = [item for item in waiters if not predicate(item[0])]
+        for _, future in matched:
+            _resolve(future, value)
+        return len(matched)
+
+    def resolve_all(self, kind, value):
+        """Resolve every waiter of a request kind.
+
+        :returns: The number of waiters resolved.
+        """
+        with self.__lock:
+            waiters = self.__waiters.pop(kind, [])
+        for _, future in waiters:
+            _resolve(future, value)
+        return len(waiters)
+
+    async def wait(self, kind, future, timeout=None):
+        """Wait for a registered response.
+
+        :param str kind: The request kind the future was registered with.
+        :param future: The future returned by :meth:`register`.
+        :param timeout: Seconds to wait, ``None`` waits forever.
+        :returns: The response value.
+        :raises asyncio.TimeoutError: If no response arrives in time.
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if not future.done() or future.cancelled():
+                self.discard(kind, future)
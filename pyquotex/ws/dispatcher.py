@@ -0,0 +1,197 @@
+"""Module for Quotex websocket frame decoding and dispatch."""
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Engine.IO v3 packet types.
+EIO_OPEN = "0"
+EIO_CLOSE = "1"
+EIO_PING = "2"
+EIO_PONG = "3"
+EIO_MESSAGE = "4"
+
+# Socket.IO packet types carried inside an Engine.IO message.
+SIO_CONNECT = "0"
+SIO_DISCONNECT = "1"
+SIO_EVENT = "2"
+SIO_ACK = "3"
+SIO_ERROR = "4"
+SIO_BINARY_EVENT = "5"
+SIO_BINARY_ACK = "6"
+
+
+class FrameDecoder(object):
+    """Decode socket.io (EIO=3) frames into ``(event, payload)`` pairs.
+
+    Text frames such as ``42["event",{...}]`` are complete packets. Binary
+    events arrive in two parts: a ``451-["event",{"_placeholder":true}]``
+    header followed by one binary frame per attachment; the decoder keeps
+    the header until all attachments are received.
+    """
+
+    def __init__(self):
+        self.__pending_event = None
+        self.__pending_left = 0
+        self.__pending_data = []
+
+    def decode(self, message):
+        """Decode a single websocket frame.
+
+        :param message: The raw frame (``str`` or ``bytes``).
+        :returns: A tuple ``(event, payload)`` when a packet is complete,
+            otherwise ``None``. ``event`` is ``None`` for binary frames
+            that were not announced by a header.
+        """
+        if isinstance(message, (bytes, bytearray)):
+            return self._decode_binary(message)
+        return self._decode_text(message)
+
+    def _decode_text(self, message):
+        if not message or message[0] != EIO_MESSAGE:
+            return None
+        sio_type = message[1:2]
+        if sio_type == SIO_EVENT:
+            start = message.find("[")
+            if start < 0:
+                return None
+            packet = json.loads(message[start:])
+            return packet[0], packet[1] if len(packet) > 1 else None
+        if sio_type == SIO_BINARY_EVENT:
+            dash = message.find("-")
+            packet = json.loads(message[dash + 1:])
+            self.__pending_event = packet[0]
+            self.__pending_left = int(message[2:dash] or 0)
+            self.__pending_data = []
+            if self.__pending_left == 0:
+                self.__pending_event = None
+                return packet[0], packet[1] if len(packet) > 1 else None
+            return None
+        if sio_type == SIO_CONNECT:
+            return "connect", None
+        if sio_type == SIO_DISCONNECT:
+            return "disconnect", None
+        return None
+
+    def _decode_binary(self, message):
+        # Binary attachments are prefixed with the Engine.IO message type byte.
+        payload = json.loads(message[1:])
+        if self.__pending_event is None:
+            return None, payload
+        self.__pending_data.append(payload)
+        self.__pending_left -= 1
+        if self.__pending_left > 0:
+            return None
+        event = self.__pending_event
+        data = self.__pending_data
+        self.__pending_event = None
+        self.__pending_data = []
+        return event, data[0] if len(data) == 1 else data
+
+
+class FrameDispatcher(object):
+    """Route decoded frames through a table of registered handlers.
+
+    Every frame is parsed exactly once. Handlers are looked up by event
+    name; when no handler is registered for the event, the optional
+    ``classifier`` maps the payload to one or more route names instead.
+    Each route keeps a call counter and the time spent in its handler.
+    """
+
+    def __init__(self, classifier=None, on_packet=None):
+        """
+        :param classifier: (optional) Callable ``classifier(payload)``
+            returning a route name, or a tuple of route names, for events
+            without a handler.
+        :param on_packet: (optional) Callable ``on_packet(event, payload)``
+            called for every complete packet before it is routed.
+        """
+        self.decoder = FrameDecoder()
+        self.classifier = classifier
+        self.on_packet = on_packet
+        self.handlers = {}
+        self.stats = {}
+        self.errors = 0
+
+    def register(self, event, handler):
+        """Register a handler for an event or route name.
+
+        :param str event: The event name, e.g. ``"instruments/list"``.
+        :param handler: Callable receiving the decoded payload.
+        """
+        self.handlers[event] = handler
+
+    def dispatch(self, message):
+        """Decode a frame and call the matching handler.
+
+        :param message: The raw websocket frame.
+        :returns: The (first) route name used, or ``None`` if the frame
+            was not a complete packet or had no handler.
+        """
+        try:
+            packet = self.decoder.decode(message)
+        except (ValueError, IndexError) as e:
+            self.errors += 1
+            logger.debug(f"Could not decode frame {message!r}: {e}")
+            return None
+        if packet is None:
+            return None
+        event, payload = packet
+        if self.on_packet is not None:
+            self.on_packet(event, payload)
+        handler = self.handlers.get(event)
+        if handler is not None:
+            self._call(event, handler, payload)
+            return event
+        routes = self.classifier(payload) if self.classifier is not None else None
+        if isinstance(routes, str):
+            routes = (routes,)
+        handled = None
+        for route in routes or ():
+            handler = self.handlers.get(route)
+            if handler is not None:
+                self._call(route, handler, payload)
+                handled = handled or route
+        if handled is None:
+            self._record(event or "unhandled", 0)
+        return handled
+
+    def _call(self, event, handler, payload):
+        start = time.perf_counter_ns()
+        try:
+            handler(payload)
+        except Exception:
+            self.errors += 1
+            logger.exception(f"Handler for '{event}' failed.")
+        self._record(event, time.perf_counter_ns() - start)
+
+    def _record(self, event, elapsed):
+        stat = self.stats.get(event)
+        if stat is None:
+            self.stats[event] = [1, elapsed, elapsed]
+        else:
+            stat[0] += 1
+            stat[1] += elapsed
+            if elapsed > stat[2]:
+                stat[2] = elapsed
+
+    def get_stats(self):
+        """Get per-event counters and handler timings.
+
+        :returns: A dict keyed by route name with ``count``,
+            ``total_ms``, ``avg_us`` and ``max_us``.
+        """
+        return {
+            event: {
+                "count": count,
+                "total_ms": total / 1e6,
+                "avg_us": total / count / 1e3,
+                "max_us": peak / 1e3
+            }
+            for event, (count, total, peak) in self.stats.items()
+        }
+
+    def reset_stats(self):
+        self.stats = {}
+        self.errors = 0
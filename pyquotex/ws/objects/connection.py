@@ -0,0 +1,29 @@
+"""Module for Quotex connection state object."""
+from pyquotex.ws.objects.base import Base
+
+
+class ConnectionState(Base):
+    """Class for the state of a single Quotex connection.
+
+    Each :class:`QuotexAPI <pyquotex.api.QuotexAPI>` owns one instance, so
+    several clients can run in the same interpreter and event loop without
+    sharing the session token or the connection flags.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__name = "connection"
+        self.ssid = None
+        self.check_websocket_if_connect = None
+        self.started_listen_instruments = True
+        self.check_rejected_connection = False
+        self.check_accepted_connection = False
+        self.check_websocket_if_error = False
+        self.websocket_error_reason = None
+        self.balance_id = None
+
+    def reset(self):
+        """Reset the websocket flags before a new connection attempt."""
+        self.check_websocket_if_connect = None
+        self.check_websocket_if_error = False
+        self.websocket_error_reason = None
@@ -10,6 +10,32 @@ class TimeSync(Base):
         self.__name = "timeSync"
         self.__server_timestamp = time.time()
         self.__expiration_time_minutes = 1
+        self.__offset = None
+
+    def synchronize(self, timestamp):
+        """Learn the server clock offset from a server timestamp just received.
+
+        Samples are smoothed, so a single slow message barely moves the clock.
+
+        :param timestamp: A server timestamp in seconds, e.g. of a tick.
+        """
+        sample = timestamp - time.time()
+        if self.__offset is None:
+            self.__offset = sample
+        else:
+            self.__offset += (sample - self.__offset) * 0.1
+
+    @property
+    def offset(self):
+        """Get the server clock minus the local clock in seconds, ``0`` before any sample."""
+        return self.__offset or 0.0
+
+    def now(self):
+        """Get the current server timestamp estimated from the local clock.
+
+        :returns: The server timestamp in seconds.
+        """
+        return time.time() + self.offset
 
     @property
     def server_timestamp(self):
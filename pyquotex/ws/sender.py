@@ -0,0 +1,332 @@
+"""Module for Quotex websocket outbound send queue."""
+import time
+import queue
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_WAKE = object()
+
+# Seconds a frame may wait for the connection before it is dropped.
+MAX_FRAME_AGE = 10
+
+# Orders are only worth sending close to when they were placed.
+ORDER_FRAME_TTL = 2
+
+
+def _deadline(ttl):
+    return time.monotonic() + ttl if ttl is not None else None
+
+
+class SendQueue(object):
+    """Outbound websocket queue drained by a single writer thread.
+
+    Senders only append to a :class:`queue.SimpleQueue` and return; they
+    never wait for the socket or for inbound frame processing. The writer
+    thread is the only caller of the underlying ``send`` and holds frames
+    while the connection is down, up to their deadline. Frames queued
+    before a disconnect belong to the old session and are dropped; after
+    a reconnect the authorization frame from :meth:`authorize` is written
+    ahead of everything else.
+    """
+
+    def __init__(self, send, max_age=MAX_FRAME_AGE):
+        """
+        :param send: Callable that writes one frame to the websocket.
+        :param max_age: Seconds a frame may wait for the connection,
+            ``None`` keeps frames until they are sent.
+        """
+        self.send = send
+        self.max_age = max_age
+        self.connected = threading.Event()
+        self.thread = None
+        self.auth_frame = None
+        self.__queue = queue.SimpleQueue()
+        self.__epoch = 0
+        self.__reauthorize = False
+        self.__stopping = False
+        self.__dropped = 0
+        self.__enqueued = 0
+        self.__enqueue_ns = 0
+        self.__sent = 0
+        self.__wire_ns = 0
+        self.__wire_max_ns = 0
+        self.__errors = 0
+
+    def start(self):
+        """Start the writer thread if it is not running."""
+        if self.thread and self.thread.is_alive():
+            return
+        self.connected.clear()
+        self.__stopping = False
+        self.thread = threading.Thread(
+            target=self._run,
+            name="quotex-send-queue",
+            daemon=True
+        )
+        self.thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the writer thread, dropping the frames not sent yet.
+
+        :param timeout: Seconds to wait for the writer thread to exit.
+        """
+        if not self.thread or not self.thread.is_alive():
+            return
+        self.__stopping = True
+        self.__queue.put(_STOP)
+        self.connected.set()
+        self.thread.join(timeout)
+
+    def mark_connected(self):
+        """Release the writer once the connection is open.
+
+        On a reconnect the authorization frame is written first.
+        """
+        self.__reauthorize = self.auth_frame is not None
+        self.connected.set()
+        self.__queue.put(_WAKE)
+
+    def mark_disconnected(self):
+        """Hold the writer and drop the frames of the closed session."""
+        self.connected.clear()
+        self.__epoch += 1
+
+    def authorize(self, data):
+        """Send the authorization frame and keep it for reconnects.
+
+        :param str data: The ``authorization`` frame.
+        """
+        self.auth_frame = data
+        if self.connected.is_set():
+            self.put(data)
+
+    def put(self, data, ttl=None):
+        """Enqueue a frame for sending.
+
+        :param str data: The websocket frame.
+        :param ttl: (optional) Seconds the frame may wait for the
+            connection, defaults to ``max_age``.
+        """
+        start = time.perf_counter_ns()
+        ttl = self.max_age if ttl is None else ttl
+        self.__queue.put((data, start, _deadline(ttl), self.__epoch))
+        self.__enqueued += 1
+        self.__enqueue_ns += time.perf_counter_ns() - start
+
+    def _run(self):
+        while True:
+            item = self.__queue.get()
+            if item is _STOP:
+                break
+            self.connected.wait()
+            if self.__stopping:
+                if item is not _WAKE:
+                    self.__dropped += 1
+                continue
+            if self.__reauthorize:
+                self.__reauthorize = False
+                self._write(self.auth_frame, time.perf_counter_ns())
+            if item is _WAKE:
+                continue
+            data, queued_at, deadline, epoch = item
+            if epoch != self.__epoch or (deadline is not None and time.monotonic() > deadline):
+                self.__dropped += 1
+                logger.debug(f"Dropped stale websocket frame {data!r}.")
+                continue
+            self._write(data, queued_at)
+
+    def _write(self, data, queued_at):
+        try:
+            self.send(data)
+        except Exception as e:
+            self.__errors += 1
+            logger.error(f"Could not send websocket frame {data!r}: {e}")
+            return
+        elapsed = time.perf_counter_ns() - queued_at
+        self.__sent += 1
+        self.__wire_ns += elapsed
+        if elapsed > self.__wire_max_ns:
+            self.__wire_max_ns = elapsed
+        logger.debug(data)
+
+    def get_stats(self):
+        """Get enqueue latency and time-to-wire of outbound frames.
+
+        :returns: A dict with ``enqueued``, ``sent``, ``pending``,
+            ``dropped`` stale frames, ``errors``, ``enqueue_avg_us``,
+            ``wire_avg_us`` and ``wire_max_us``.
+        """
+        return {
+            "enqueued": self.__enqueued,
+            "sent": self.__sent,
+            "pending": self.__queue.qsize(),
+            "dropped": self.__dropped,
+            "errors": self.__errors,
+            "enqueue_avg_us": self.__enqueue_ns / self.__enqueued / 1e3 if self.__enqueued else 0,
+            "wire_avg_us": self.__wire_ns / self.__sent / 1e3 if self.__sent else 0,
+            "wire_max_us": self.__wire_max_ns / 1e3
+        }
+
+
+class AsyncSendQueue(object):
+    """Outbound websocket queue drained by a writer task.
+
+    Counterpart of :class:`SendQueue` for the asyncio transport. Frames
+    are appended to an :class:`asyncio.Queue` and written by one task
+    that awaits the connection's ``send``, so the transport's own flow
+    control applies instead of a thread handoff. Deadlines, stale
+    sessions and reauthorization are handled as in :class:`SendQueue`.
+    """
+
+    def __init__(self, send, max_age=MAX_FRAME_AGE):
+        """
+        :param send: Coroutine function that writes one frame to the websocket.
+        :param max_age: Seconds a frame may wait for the connection,
+            ``None`` keeps frames until they are sent.
+        """
+        self.send = send
+        self.max_age = max_age
+        self.connected = asyncio.Event()
+        self.task = None
+        self.loop = None
+        self.auth_frame = None
+        self.__queue = asyncio.Queue()
+        # Frames put before start(), from any thread; the asyncio queue is
+        # only touched on the loop.
+        self.__pending = []
+        self.__pending_lock = threading.Lock()
+        self.__epoch = 0
+        self.__reauthorize = False
+        self.__dropped = 0
+        self.__enqueued = 0
+        self.__enqueue_ns = 0
+        self.__sent = 0
+        self.__wire_ns = 0
+        self.__wire_max_ns = 0
+        self.__errors = 0
+
+    def start(self):
+        """Start the writer task on the running loop if it is not running."""
+        if self.task and not self.task.done():
+            return
+        with self.__pending_lock:
+            self.loop = asyncio.get_running_loop()
+            for item in self.__pending:
+                self.__queue.put_nowait(item)
+            self.__pending.clear()
+        self.connected.clear()
+        self.task = self.loop.create_task(self._run(), name="quotex-send-queue")
+
+    def stop(self, timeout=5):
+        """Cancel the writer task and drop the frames not sent yet.
+
+        :param timeout: Unused, kept for :class:`SendQueue` compatibility.
+        """
+        if self.task and not self.task.done():
+            self.task.cancel()
+        with self.__pending_lock:
+            self.__dropped += len(self.__pending)
+            self.__pending.clear()
+        while not self.__queue.empty():
+            self.__queue.get_nowait()
+            self.__dropped += 1
+
+    def mark_connected(self):
+        """Release the writer once the connection is open.
+
+        On a reconnect the authorization frame is written first.
+        """
+        self.__reauthorize = self.auth_frame is not None
+        self.connected.set()
+        self.__queue.put_nowait(_WAKE)
+
+    def mark_disconnected(self):
+        """Hold the writer and drop the frames of the closed session."""
+        self.connected.clear()
+        self.__epoch += 1
+
+    def authorize(self, data):
+        """Send the authorization frame and keep it for reconnects.
+
+        :param str data: The ``authorization`` frame.
+        """
+        self.auth_frame = data
+        if self.connected.is_set():
+            self.put(data)
+
+    def put(self, data, ttl=None):
+        """Enqueue a frame for sending.
+
+        Safe to call from threads other than the event loop.
+
+        :param str data: The websocket frame.
+        :param ttl: (optional) Seconds the frame may wait for the
+            connection, defaults to ``max_age``.
+        """
+        start = time.perf_counter_ns()
+        ttl = self.max_age if ttl is None else ttl
+        item = (data, start, _deadline(ttl), self.__epoch)
+        try:
+            on_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self.__queue.put_nowait(item)
+        else:
+            with self.__pending_lock:
+                if self.loop is None:
+                    self.__pending.append(item)
+                else:
+                    self.loop.call_soon_threadsafe(self.__queue.put_nowait, item)
+        self.__enqueued += 1
+        self.__enqueue_ns += time.perf_counter_ns() - start
+
+    async def _run(self):
+        while True:
+            item = await self.__queue.get()
+            await self.connected.wait()
+            if self.__reauthorize:
+                self.__reauthorize = False
+                await self._write(self.auth_frame, time.perf_counter_ns())
+            if item is _WAKE:
+                continue
+            data, queued_at, deadline, epoch = item
+            if epoch != self.__epoch or (deadline is not None and time.monotonic() > deadline):
+                self.__dropped += 1
+                logger.debug(f"Dropped stale websocket frame {data!r}.")
+                continue
+            await self._write(data, queued_at)
+
+    async def _write(self, data, queued_at):
+        try:
+            await self.send(data)
+        except Exception as e:
+            self.__errors += 1
+            logger.error(f"Could not send websocket frame {data!r}: {e}")
+            return
+        elapsed = time.perf_counter_ns() - queued_at
+        self.__sent += 1
+        self.__wire_ns += elapsed
+        if elapsed > self.__wire_max_ns:
+            self.__wire_max_ns = elapsed
+        logger.debug(data)
+
+    def get_stats(self):
+        """Get enqueue latency and time-to-wire of outbound frames.
+
+        :returns: A dict with the same keys as :meth:`SendQueue.get_stats`.
+        """
+        return {
+            "enqueued": self.__enqueued,
+            "sent": self.__sent,
+            "pending": self.__queue.qsize() + len(self.__pending),
+            "dropped": self.__dropped,
+            "errors": self.__errors,
+            "enqueue_avg_us": self.__enqueue_ns / self.__enqueued / 1e3 if self.__enqueued else 0,
+            "wire_avg_us": self.__wire_ns / self.__sent / 1e3 if self.__sent else 0,
+            "wire_max_us": self.__wire_max_ns / 1e3
+        }
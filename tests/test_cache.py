@@ -0,0 +1,71 @@
+import asyncio
+
+from pyquotex.stable_api import Quotex
+from pyquotex.utils.cache import IndicatorCache
+
+PERIOD = 60
+
+
+def make_client(tmp_path, clock):
+    client = Quotex(root_path=str(tmp_path))
+    fetches = []
+
+    async def get_candles(asset, end_from_time, offset, period, progressive=False, timeout=20):
+        fetches.append(end_from_time)
+        end = int(end_from_time // period * period)
+        return [
+            {"time": t, "open": 1.0 + t % 7 / 100, "close": 1.0 + t % 5 / 100,
+             "high": 1.1, "low": 0.9, "ticks": 10}
+            for t in range(end - 300 * period, end, period)
+        ]
+
+    client.get_candles = get_candles
+    client.get_server_timestamp = lambda: clock[0]
+    return client, fetches
+
+
+def test_results_roll_over_with_the_server_bar(tmp_path):
+    # The server clock runs well ahead of the local one.
+    clock = [2_000_000_045.0]
+    client, fetches = make_client(tmp_path, clock)
+
+    async def main():
+        first = await client.calculate_indicators("EURUSD", PERIOD, ["RSI", "SMA"])
+        clock[0] += 30
+        second = await client.calculate_indicators("EURUSD", PERIOD, ["RSI", "SMA"])
+        assert fetches == [2_000_000_045.0]
+        assert second == first
+
+        clock[0] += 30
+        await client.calculate_indicators("EURUSD", PERIOD, ["RSI"])
+        assert fetches == [2_000_000_045.0, 2_000_000_105.0]
+
+    asyncio.run(main())
+
+
+def test_new_spec_fetches_only_missing_indicators(tmp_path):
+    clock = [2_000_000_045.0]
+    client, fetches = make_client(tmp_path, clock)
+
+    async def main():
+        await client.calculate_indicators("EURUSD", PERIOD, ["RSI"])
+        stats = client.indicator_cache.hits
+        results = await client.calculate_indicators("EURUSD", PERIOD, ["RSI", "EMA"])
+        assert len(fetches) == 2
+        assert client.indicator_cache.hits == stats + 1
+        assert set(results) == {"RSI", "EMA"}
+
+    asyncio.run(main())
+
+
+def test_invalidate_drops_the_asset_and_timeframe():
+    cache = IndicatorCache()
+    key = cache.make_key("EURUSD", PERIOD, "rsi", {}, 3600, 1000)
+    other = cache.make_key("GBPUSD", PERIOD, "rsi", {}, 3600, 1000)
+    cache.put(key, {"rsi": [1.0]})
+    cache.put(other, {"rsi": [2.0]})
+
+    cache.invalidate("EURUSD", PERIOD)
+
+    assert cache.get(key) is None
+    assert cache.get(other) == {"rsi": [2.0]}
@@ -0,0 +1,83 @@
+import numpy as np
+
+from pyquotex.utils.optimizer import Optimizer, walk_forward_splits
+from pyquotex.utils.store import CandleStore
+
+PERIOD = 60
+START = 1_000_020
+DAY = 1440 * PERIOD
+
+
+class Follow(object):
+    """Calls the direction of the last candle."""
+
+    def __init__(self, sign=1):
+        self.sign = sign
+
+    def signals(self, data):
+        return self.sign * np.sign(data["close"] - data["open"]).astype(int)
+
+
+def make_store(tmp_path, days):
+    rng = np.random.default_rng(7)
+    size = days * 1440
+    opens = 1 + rng.random(size)
+    # Candles alternate colour, so Follow(-1) wins and Follow(1) loses.
+    closes = opens + np.where(np.arange(size) % 2, 0.01, -0.01)
+    candles = [
+        {"time": START + i * PERIOD, "open": o, "close": c, "high": max(o, c), "low": min(o, c)}
+        for i, (o, c) in enumerate(zip(opens, closes))
+    ]
+    store = CandleStore(str(tmp_path))
+    store.append("EURUSD", PERIOD, candles)
+    return store
+
+
+def test_walk_forward_splits():
+    assert walk_forward_splits(0, 10, 4, 2) == [((0, 4), (4, 6)), ((2, 6), (6, 8)), ((4, 8), (8, 10))]
+    assert walk_forward_splits(0, 5, 4, 2) == []
+
+
+def test_range_shorter_than_a_fold_has_no_folds(tmp_path):
+    store = make_store(tmp_path, 1)
+    optimizer = Optimizer(Follow, store, workers=0, expiry=1)
+
+    report = optimizer.optimize([{"sign": 1}, {"sign": -1}], ["EURUSD"], START, START + DAY,
+                                train=2 * DAY, test=DAY)
+
+    assert set(report) == {"results"}
+    assert all(row["test"] is None for row in report["results"])
+    assert report["results"][1]["train"]["win_rate"] > report["results"][0]["train"]["win_rate"]
+
+
+def test_walk_forward_picks_per_fold(tmp_path):
+    store = make_store(tmp_path, 3)
+    optimizer = Optimizer(Follow, store, workers=0, expiry=1)
+
+    report = optimizer.optimize([{"sign": 1}, {"sign": -1}], ["EURUSD"], START, START + 3 * DAY,
+                                train=DAY, test=DAY)
+
+    assert len(report["folds"]) == 2
+    assert all(fold["params"] == {"sign": -1} for fold in report["folds"])
+    assert report["walk_forward"]["signals"] == sum(f["test_metrics"]["signals"] for f in report["folds"])
+
+
+def test_folds_without_enough_signals_are_skipped(tmp_path):
+    store = make_store(tmp_path, 3)
+    optimizer = Optimizer(Follow, store, workers=0, expiry=1)
+
+    report = optimizer.optimize([{"sign": 1}], ["EURUSD"], START, START + 3 * DAY,
+                                train=DAY, test=DAY, min_signals=10 ** 6)
+
+    assert report["folds"] == []
+    assert report["walk_forward"]["signals"] == 0
+
+
+def test_worker_processes_match_inline(tmp_path):
+    store = make_store(tmp_path, 1)
+    parameter_sets = [{"sign": 1}, {"sign": -1}]
+    inline = Optimizer(Follow, store, workers=0, expiry=1)
+    pooled = Optimizer(Follow, store, workers=2, expiry=1)
+
+    expected = inline.optimize(parameter_sets, ["EURUSD"], START, START + DAY)
+    assert pooled.optimize(parameter_sets, ["EURUSD"], START, START + DAY) == expected
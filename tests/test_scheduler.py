@@ -0,0 +1,87 @@
+import asyncio
+
+from pyquotex import stable_api
+from pyquotex.stable_api import Quotex
+from pyquotex.utils.scheduler import BarScheduler
+
+
+class Clock(object):
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_fires_again_after_restart():
+    async def main():
+        clock = Clock(1000.5)
+        scheduler = BarScheduler(clock=clock, grace=0)
+        fired = []
+        scheduler.register("EURUSD", 5, lambda event: fired.append(event["time"]))
+        scheduler.start()
+        clock.now = 1005.5
+        scheduler.wakeup.set()
+        await asyncio.sleep(0.01)
+        assert fired == [1000]
+
+        scheduler.stop()
+        assert scheduler.task is None
+        clock.now = 1010.5
+        await asyncio.sleep(0.01)
+        assert fired == [1000]
+
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        assert fired == [1000, 1005]
+        scheduler.stop()
+
+    asyncio.run(main())
+
+
+def test_stop_cancels_running_jobs():
+    async def main():
+        scheduler = BarScheduler(clock=Clock(1000.0), grace=0)
+        started = asyncio.Event()
+
+        async def job(event):
+            started.set()
+            await asyncio.sleep(60)
+
+        scheduler.register("EURUSD", 5, job)
+        scheduler.start()
+        scheduler.handle_close("EURUSD", 5, {"time": 1000})
+        await started.wait()
+        task = next(iter(scheduler.tasks))
+        scheduler.stop()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+    asyncio.run(main())
+
+
+def test_connect_keeps_the_scheduler_running(tmp_path, monkeypatch):
+    async def connect(self, is_demo):
+        return True, "Websocket connected successfully!!!"
+
+    async def check_connect(self):
+        return True
+
+    monkeypatch.setattr(stable_api.QuotexAPI, "connect", connect)
+    monkeypatch.setattr(Quotex, "check_connect", check_connect)
+
+    async def main():
+        client = Quotex(email="user@example.com", password="secret", root_path=str(tmp_path))
+        client.session_data = {"token": "ssid"}
+        task = client.scheduler.start()
+        await client.connect()
+        await client.connect()
+        assert not task.done()
+        assert client.scheduler.task is task
+        await client.close()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert client.scheduler.task is None
+
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+import asyncio
+
+from pyquotex.stable_api import Quotex
+from pyquotex.utils.store import CandleStore
+
+PERIOD = 60
+
+
+def make_candles(start, end):
+    return [
+        {"time": t, "open": 1.0, "close": 1.1, "high": 1.2, "low": 0.9, "ticks": 10}
+        for t in range(start, end, PERIOD)
+    ]
+
+
+def make_client(tmp_path, now):
+    client = Quotex(root_path=str(tmp_path), candle_store=CandleStore(str(tmp_path / "candles")))
+    calls = {"fetch": [], "load": []}
+
+    async def fetch_candles(asset, end_from_time, offset, period, timeout=20):
+        calls["fetch"].append((end_from_time - offset, end_from_time))
+        # history/list/v2 only knows recent candles, including the open one.
+        return make_candles(max(end_from_time - offset, now - 200 * period), now + period)
+
+    async def load_candles(asset, end_from_time, offset, period, timeout=20):
+        calls["load"].append((end_from_time - offset, end_from_time))
+        return make_candles(end_from_time - offset, end_from_time)
+
+    client.fetch_candles = fetch_candles
+    client.load_candles = load_candles
+    client.start_candles_stream = lambda asset, period: None
+    client.get_server_timestamp = lambda: now + 30
+    return client, calls
+
+
+def test_fills_head_holes_and_live_tail(tmp_path):
+    now = 1_000_000 // PERIOD * PERIOD
+    client, calls = make_client(tmp_path, now)
+    store = client.candle_store
+    start = now - 1000 * PERIOD
+    store.append("EURUSD", PERIOD, make_candles(now - 800 * PERIOD, now - 600 * PERIOD))
+    store.append("EURUSD", PERIOD, make_candles(now - 500 * PERIOD, now - 50 * PERIOD))
+
+    candles = asyncio.run(client.get_stored_candles("EURUSD", now + 30, now + 30 - start, PERIOD))
+
+    times = [candle["time"] for candle in candles]
+    assert times == list(range(start, now, PERIOD))
+    # The open bar is never stored.
+    assert store.bounds("EURUSD", PERIOD)[1] == now - PERIOD
+    # Head and hole come from history/load, only the live tail from the recent list.
+    assert calls["fetch"] == [(now - 50 * PERIOD, now)]
+    loaded = {t for s, e in calls["load"] for t in range(s, e, PERIOD)}
+    assert set(range(start, now - 800 * PERIOD, PERIOD)) <= loaded
+    assert set(range(now - 600 * PERIOD, now - 500 * PERIOD, PERIOD)) <= loaded
+    assert not loaded & set(range(now - 500 * PERIOD, now - 50 * PERIOD, PERIOD))
+
+def test_complete_range_sends_no_request(tmp_path):
+    now = 1_000_000 // PERIOD * PERIOD
+    client, calls = make_client(tmp_path, now)
+    client.candle_store.append("EURUSD", PERIOD, make_candles(now - 100 * PERIOD, now))
+
+    candles = asyncio.run(client.get_stored_candles("EURUSD", now + 30, 100 * PERIOD + 30, PERIOD))
+
+    assert len(candles) == 100
+    assert calls == {"fetch": [], "load": []}
+
+
+def test_closed_limit_uses_server_time(tmp_path):
+    now = 1_000_000 // PERIOD * PERIOD
+    client, calls = make_client(tmp_path, now)
+
+    # The request ends a minute ahead of the server clock.
+    asyncio.run(client.get_stored_candles("EURUSD", now + 90, 10 * PERIOD + 90, PERIOD))
+
+    assert client.candle_store.bounds("EURUSD", PERIOD)[1] == now - PERIOD
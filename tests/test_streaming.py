@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pyquotex.utils.indicators import INDICATORS, candles_to_arrays
+from pyquotex.utils.streaming import STREAMING_INDICATORS, create_streaming_indicator
+
+
+def make_candles(size=300, seed=3):
+    rng = np.random.default_rng(seed)
+    closes = 1.1 + np.cumsum(rng.normal(0, 0.001, size))
+    opens = np.concatenate([[closes[0]], closes[:-1]])
+    spread = rng.random(size) * 0.002
+    return [
+        {"time": 1_000_000 + i * 60, "open": o, "close": c,
+         "high": max(o, c) + s, "low": min(o, c) - s}
+        for i, (o, c, s) in enumerate(zip(opens, closes, spread))
+    ]
+
+
+def batch_last(name, candles):
+    kernel = INDICATORS[name][0]
+    raw = kernel(candles_to_arrays(candles))
+    return {key: float(values[-1]) for key, values in raw.items()}
+
+
+def stream_last(value, name):
+    if isinstance(value, dict):
+        return value
+    return {name.lower(): value}
+
+
+@pytest.mark.parametrize("name", sorted(STREAMING_INDICATORS))
+def test_streaming_matches_batch(name):
+    candles = make_candles()
+    stream = create_streaming_indicator(name)
+
+    streamed = stream_last(stream.seed(candles), name)
+
+    expected = batch_last(name, candles)
+    assert set(expected) <= set(streamed)
+    for key, value in expected.items():
+        assert streamed[key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+
+
+@pytest.mark.parametrize("name", sorted(STREAMING_INDICATORS))
+def test_preview_matches_update_without_committing(name):
+    candles = make_candles()
+    stream = create_streaming_indicator(name)
+    stream.seed(candles[:-1])
+
+    preview = stream.preview(candles[-1])
+    again = stream.preview(candles[-1])
+    updated = stream.update(candles[-1])
+
+    assert again == preview
+    assert updated == preview
+
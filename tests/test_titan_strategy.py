@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pyquotex.utils.aggregator import resample_candles
+from pyquotex.utils.indicators import candles_to_arrays
+from titan_x_bot import TitanXStrategy
+
+DIRECTIONS = {"CALL": 1, "PUT": -1, "NO_TRADE": 0}
+
+
+def make_candles(size=400, seed=11):
+    rng = np.random.default_rng(seed)
+    closes = 1.1 + np.cumsum(rng.normal(0, 0.004, size))
+    opens = closes + rng.normal(0, 0.003, size)
+    candles = []
+    # Starts mid 5M bar, so the first 5M bar is incomplete.
+    for i, (o, c) in enumerate(zip(opens, closes)):
+        top, bottom = max(o, c), min(o, c)
+        candles.append({
+            "time": 1_000_020 + i * 60,
+            "open": float(o),
+            "close": float(c),
+            "high": float(top + abs(rng.normal(0, 0.002))),
+            "low": float(bottom - abs(rng.normal(0, 0.002))),
+            "ticks": 10
+        })
+    return candles
+
+
+@pytest.mark.parametrize("with_5m", [True, False])
+def test_signals_match_analyze(with_5m):
+    candles = make_candles()
+    strategy = TitanXStrategy()
+
+    directions, confidence = strategy.signals(candles_to_arrays(candles), with_5m=with_5m)
+
+    traded = 0
+    for i in range(len(candles)):
+        history = candles[:i + 1]
+        candles_5m = resample_candles(history, 300, source_period=60) if with_5m else None
+        direction, expected, _ = strategy.analyze(history, candles_5m)
+        assert directions[i] == DIRECTIONS[direction], i
+        assert confidence[i] == pytest.approx(expected), i
+        traded += direction != "NO_TRADE"
+    assert traded > 10
+
+
+def test_signals_use_applied_parameters():
+    candles = make_candles()
+    strategy = TitanXStrategy()
+    strategy.apply_parameters({"wick_limit": 0.5, "body_strength_threshold": 0.9})
+
+    directions, _ = strategy.signals(candles_to_arrays(candles), with_5m=False)
+
+    for i in range(19, len(candles)):
+        direction, _, _ = strategy.analyze(candles[:i + 1])
+        assert directions[i] == DIRECTIONS[direction], i
@@ -4,8 +4,17 @@ import os
 import requests
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pyquotex.stable_api import Quotex
 from pyquotex.config import credentials as pq_credentials
+from pyquotex.utils.backfill import find_gaps
+from pyquotex.utils.store import CandleStore
+from pyquotex.utils.aggregator import resample_candles
+from pyquotex.utils.executor import create_executor
+from pyquotex.utils.backtest import backtest
+from pyquotex.utils.optimizer import Optimizer, parameter_grid, random_parameters
+from pyquotex.utils.indicators import candles_to_arrays
 
 # Load environment variables from .env file
 try:
@@ -205,14 +214,21 @@ class CandleAnalyzer:
 
 
 class TitanXStrategy:
-    def __init__(self):
-        self.wick_limit = 4.0
-        self.body_strength_threshold = 0.3
+    def __init__(self, wick_limit: float = 4.0, body_strength_threshold: float = 0.3):
+        self.wick_limit = wick_limit
+        self.body_strength_threshold = body_strength_threshold
         self.win_rate_history = []
+        self.optimized = False
+    
+    def apply_parameters(self, params: Dict):
+        """Use tuned thresholds; the step-wise adaptation stops overriding them"""
+        self.wick_limit = params["wick_limit"]
+        self.body_strength_threshold = params["body_strength_threshold"]
+        self.optimized = True
     
     def adapt_thresholds(self):
         """Adaptive thresholds based on recent performance"""
-        if len(self.win_rate_history) < 10:
+        if self.optimized or len(self.win_rate_history) < 10:
             return
         
         recent_win_rate = sum(self.win_rate_history[-10:]) / 10
@@ -321,6 +337,138 @@ class TitanXStrategy:
             confidence = min(confidence * 1.15, 1.0)  # Overbought boost
         
         return direction, confidence, "STRATEGY TITAN-X"
+    
+    def signals(self, data: Dict[str, np.ndarray], with_5m: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate analyze() at every candle of a series in one vectorized pass
+        data: candle arrays (time, open, high, low, close) oldest → newest
+        with_5m: build the 5M trend from the 1M candles, as scan_pair does
+        Returns: (directions, confidences), direction 1 = CALL, -1 = PUT, 0 = NO_TRADE
+        """
+        opens, closes = data['open'], data['close']
+        highs, lows = data['high'], data['low']
+        n = len(closes)
+        directions = np.zeros(n, dtype=np.int8)
+        confidence = np.zeros(n)
+        if n < 20:
+            return directions, confidence
+        
+        def window(values, size):
+            # Row i holds the `size` values ending at candle i (aligned from size - 1)
+            padded = np.concatenate((np.full(size - 1, np.nan), values))
+            return sliding_window_view(padded, size)
+        
+        body = np.abs(closes - opens)
+        total_range = highs - lows
+        wicks = (highs - np.maximum(opens, closes)) + (np.minimum(opens, closes) - lows)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            wick_ratio = np.where(body == 0, np.inf, wicks / body)
+            body_strength = np.where(total_range == 0, 0.0, body / total_range)
+        bullish = closes > opens
+        bearish = closes < opens
+        
+        # Consolidation: 10-candle range below 0.5%
+        window_high = window(highs, 10).max(axis=1)
+        window_low = window(lows, 10).min(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            consolidating = (window_high - window_low) / window_low * 100 < 0.5
+        
+        # Simple-average RSI over the last 14 changes
+        changes = np.diff(closes, prepend=np.nan)
+        avg_gain = window(np.where(changes > 0, changes, 0.0), 14).sum(axis=1) / 14
+        avg_loss = window(np.where(changes > 0, 0.0, np.abs(changes)), 14).sum(axis=1) / 14
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        
+        # Range strength: current range vs the 10-candle average
+        avg_range = window(total_range, 10).sum(axis=1) / 10
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_strength = np.where(avg_range == 0, 1.0, total_range / avg_range)
+        
+        # Patterns, with the same precedence as detect_pattern
+        prev_open = np.concatenate(([np.nan], opens[:-1]))
+        prev_close = np.concatenate(([np.nan], closes[:-1]))
+        prev_bullish = prev_close > prev_open
+        prev_bearish = prev_close < prev_open
+        lower_wick = np.minimum(opens, closes) - lows
+        upper_wick = highs - np.maximum(opens, closes)
+        hammer = (lower_wick > body * 2) & (upper_wick < body * 0.3)
+        shooting_star = ~hammer & (upper_wick > body * 2) & (lower_wick < body * 0.3)
+        reversal = hammer | shooting_star
+        bullish_engulfing = ~reversal & bullish & prev_bearish & (opens < prev_close) & (closes > prev_open)
+        bearish_engulfing = (~reversal & ~bullish_engulfing & bearish & prev_bullish &
+                             (opens > prev_close) & (closes < prev_open))
+        pattern_call = hammer | bullish_engulfing
+        pattern_put = shooting_star | bearish_engulfing
+        
+        # Rules 1-3: filters
+        tradable = ~((wick_ratio > self.wick_limit) | consolidating | (rsi > 75) | (rsi < 25))
+        tradable[:19] = False
+        
+        # Rule 4: strong body with RSI confirmation
+        strong = body_strength > self.body_strength_threshold
+        call = strong & bullish & (rsi < 70)
+        put = strong & ~call & bearish & (rsi > 30)
+        directions[call] = 1
+        directions[put] = -1
+        confidence[call | put] = body_strength[call | put] * 0.7
+        
+        # Rule 5: pattern recognition boost
+        boost = pattern_call & (directions >= 0)
+        directions[boost] = 1
+        confidence[boost] = np.maximum(confidence[boost], 0.75)
+        boost = pattern_put & (directions <= 0)
+        directions[boost] = -1
+        confidence[boost] = np.maximum(confidence[boost], 0.75)
+        
+        # Rule 6: continuation with range expansion
+        open_slot = (directions == 0) | (confidence < 0.7)
+        continuation_call = bullish & prev_bullish & (volume_strength > 1.2)
+        continuation_put = ~continuation_call & bearish & prev_bearish & (volume_strength > 1.2)
+        for mask, value in ((continuation_call & open_slot, 1), (continuation_put & open_slot, -1)):
+            directions[mask] = value
+            confidence[mask] = np.maximum(confidence[mask], 0.7)
+        
+        # Rule 7: multi-timeframe confirmation
+        if with_5m:
+            trend_5m = self.trend_5m(data)
+            against = directions * trend_5m == -1
+            along = directions * trend_5m == 1
+            confidence[against] *= 0.7
+            confidence[along] = np.minimum(confidence[along] * 1.2, 1.0)
+        
+        # Rule 8: RSI boosts
+        boost = ((rsi < 35) & (directions == 1)) | ((rsi > 65) & (directions == -1))
+        confidence[boost] = np.minimum(confidence[boost] * 1.15, 1.0)
+        
+        directions[~tradable] = 0
+        confidence[~tradable] = 0.0
+        return directions, confidence
+    
+    @staticmethod
+    def trend_5m(data: Dict[str, np.ndarray], period: int = 300, source_period: int = 60) -> np.ndarray:
+        """
+        5M SMA10/SMA20 trend as seen at every 1M candle: the closed 5M bars plus
+        the bar in progress, like resample_candles on the candles so far
+        Returns 1 = BULLISH, -1 = BEARISH, 0 = NEUTRAL
+        """
+        closes = data['close']
+        buckets = (data['time'] // period).astype(np.int64)
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        bucket_index = np.searchsorted(starts, np.arange(len(closes)), side='right') - 1
+        # Close of every completed 5M bar is the close of its last 1M candle
+        ends = np.append(starts[1:], len(closes)) - 1
+        sums = np.concatenate(([0.0], np.cumsum(closes[ends])))
+        # A first bar missing 1M candles is dropped, as resample_candles does
+        dropped = 1 if len(starts) and (ends[0] - starts[0] + 1) < period // source_period else 0
+        bars = bucket_index + 1 - dropped
+        k = bucket_index
+        safe = lambda size: np.maximum(k - (size - 1), 0)
+        sma_short = (sums[k] - sums[safe(10)] + closes) / 10
+        sma_long = (sums[k] - sums[safe(20)] + closes) / 20
+        trend = np.sign(sma_short - sma_long).astype(np.int8)
+        trend[bars < 20] = 0
+        return trend
 
 
 class SignalFormatter:
@@ -511,9 +659,20 @@ class TelegramNotifier:
             print(f"⚠️ Telegram send failed: {e}")
 
 
+def run_backtest(strategy: TitanXStrategy, data: Dict[str, np.ndarray], min_confidence: float = 0.4,
+                 with_5m: bool = True, **options) -> Dict:
+    """Vectorized backtest: signals for the whole series, scored by pyquotex.utils.backtest"""
+    directions, confidence = strategy.signals(data, with_5m)
+    directions = np.where(confidence > min_confidence, directions, 0)
+    return backtest(data, directions, **options)
+
+
 class PyQuotexBot:
-    def __init__(self):
+    def __init__(self, scan_concurrency: int = 10):
         self.strategy = TitanXStrategy()
+        self.scan_semaphore = asyncio.Semaphore(scan_concurrency)  # Pairs fetched/analyzed at once
+        self.result_tasks = set()  # Detached signal/result tracking tasks
+        self.tracked_pairs = set()  # Pairs with a trade still being tracked
         self.pairs = list(PAIR_ACTUAL_NAME.keys())
         self.client = None
         self.wins = 0
@@ -537,7 +696,16 @@ class PyQuotexBot:
         if not email or not password:
             raise RuntimeError("Set PYQUOTEX_EMAIL and PYQUOTEX_PASSWORD")
         
-        self.client = Quotex(email=email, password=password, lang="pt")
+        self.client = Quotex(
+            email=email,
+            password=password,
+            lang="pt",
+            candle_store=CandleStore("candles"),
+            executor=create_executor(
+                os.getenv("PYQUOTEX_ANALYTICS_EXECUTOR"),
+                os.getenv("PYQUOTEX_ANALYTICS_WORKERS")
+            )
+        )
         ok, reason = await self.client.connect()
         if not ok:
             raise RuntimeError(f"Connection failed: {reason}")
@@ -574,21 +742,24 @@ class PyQuotexBot:
             return []
     
 
-    async def scan_pair(self, pair: str) -> Optional[Tuple[str, str, str, str]]:
+    async def scan_pair(self, pair: str) -> Optional[Tuple[str, str, str, str, int]]:
         """Scan a single pair for signals with multi-timeframe analysis"""
         try:
-            # Fetch 1M candles
-            candles_1m = await self.get_candles(pair, 199, 60)
+            # Fetch 1M candles; 5M candles are built from them
+            candles_1m = await self.get_candles(pair, 250, 60)
             
             if not candles_1m or len(candles_1m) < 20:
                 print(f"⚠️ {pair}: No candles")
                 return None
             
-            # Fetch 5M candles for multi-timeframe analysis
-            candles_5m = await self.get_candles(pair, 50, 300)
+            # Multi-timeframe analysis without a second history request
+            candles_5m = resample_candles(candles_1m, 300, source_period=60)[-50:]
+            candles_1m = candles_1m[-199:]
             
             # Analyze with STRATEGY TITAN-X (multi-timeframe)
-            direction, confidence, strategy_name = self.strategy.analyze(candles_1m, candles_5m)
+            direction, confidence, strategy_name = await self.client.run_analytics(
+                self.strategy.analyze, candles_1m, candles_5m
+            )
             
             if direction != "NO_TRADE" and confidence > 0.3:
                 last_candle = candles_1m[-1]
@@ -598,14 +769,11 @@ class PyQuotexBot:
                 # Format for Telegram (with HTML)
                 signal_telegram = SignalFormatter.format_signal(pair, direction, last_candle, strategy_name, for_telegram=True)
                 
-                # Extract entry time from signal
-                now = datetime.now()
-                next_minute = now.replace(second=0, microsecond=0)
-                from datetime import timedelta
-                next_minute = next_minute + timedelta(minutes=1)
-                entry_time = next_minute.strftime("%H:%M")
+                # Entry is the next 1M candle
+                entry_ts = (int(self.client.get_server_timestamp()) // 60 + 1) * 60
+                entry_time = datetime.fromtimestamp(entry_ts).strftime("%H:%M")
                 
-                return (signal, signal_telegram, direction, entry_time)
+                return (signal, signal_telegram, direction, entry_time, entry_ts)
             
             return None
             
@@ -709,240 +877,316 @@ class PyQuotexBot:
         
         print(summary)
     
-    async def backtest(self, pair: str, days: int = 7):
-        """Backtest strategy on historical data"""
+    async def backtest(self, pair: str, days: int = 7, expiry: int = 1, payout: Optional[float] = None, mtg: int = 1):
+        """
+        Backtest strategy on historical data
+        expiry: trade duration in 1M candles
+        payout: profit per unit on a win (0.85 = 85%), defaults to the pair payout
+        mtg: martingale follow-ups after a loss, as check_result does
+        """
         print(f"\n📊 BACKTESTING {pair} - Last {days} days")
         print("="*50)
         
         # Fetch historical data
         period = 60
-        candles_needed = days * 24 * 60  # Total 1M candles
-        offset = candles_needed * period
         
         try:
             end_time = time.time()
+            offset = days * 86400
+            # Served from the local candle store; only missing ranges are backfilled.
             candles = await self.client.get_candles(pair, end_time, offset, period)
+            gaps = find_gaps(candles, period, end_time - offset, end_time)
+            if gaps:
+                print(f"⚠️ {len(gaps)} gaps in history")
             
             if not candles or len(candles) < 200:
                 print("❌ Not enough data for backtesting")
                 return
             
-            # Convert candles
-            formatted_candles = []
-            for c in candles:
-                formatted_candles.append({
-                    'open': float(c.get('open', 0)),
-                    'high': float(c.get('max', c.get('high', 0))),
-                    'low': float(c.get('min', c.get('low', 0))),
-                    'close': float(c.get('close', 0)),
-                    'time': c.get('time', 0)
-                })
-            
-            bt_wins = 0
-            bt_losses = 0
-            signals_found = 0
-            
-            # Simulate trading
-            for i in range(199, len(formatted_candles) - 2):
-                window = formatted_candles[i-199:i+1]
-                direction, confidence, _ = self.strategy.analyze(window, None)
-                
-                if direction != "NO_TRADE" and confidence > 0.4:
-                    signals_found += 1
-                    next_candle = formatted_candles[i+1]
-                    
-                    # Check result
-                    if direction == "CALL":
-                        if next_candle['close'] > next_candle['open']:
-                            bt_wins += 1
-                        else:
-                            bt_losses += 1
-                    elif direction == "PUT":
-                        if next_candle['close'] < next_candle['open']:
-                            bt_wins += 1
-                        else:
-                            bt_losses += 1
+            # Payout of the pair in percent, from the instruments list
+            if payout is None:
+                try:
+                    payout = float(self.client.get_payout_by_asset(pair, str(expiry))) / 100
+                except Exception:
+                    payout = 0.8
             
-            total = bt_wins + bt_losses
-            win_rate = (bt_wins / total * 100) if total > 0 else 0
+            # Features, rules and outcomes for the whole series at once,
+            # off the event loop when an executor is configured
+            data = candles_to_arrays(candles)
+            result = await self.client.run_analytics(
+                run_backtest,
+                self.strategy,
+                data,
+                expiry=expiry,
+                payout=payout,
+                mtg=mtg,
+                ties="loss"
+            )
             
-            print(f"📊 Signals Found: {signals_found}")
-            print(f"✅ Wins: {bt_wins}")
-            print(f"❌ Losses: {bt_losses}")
-            print(f"🎯 Win Rate: {win_rate:.1f}%")
+            print(f"📊 Signals Found: {result['signals']}")
+            print(f"✅ Wins: {result['wins']}")
+            for level, level_wins in enumerate(result['mtg_wins'][1:], 1):
+                print(f"   MTG {level} wins: {level_wins}")
+            print(f"❌ Losses: {result['losses']}")
+            print(f"🎯 Win Rate: {result['win_rate'] * 100:.1f}%")
+            print(f"💰 Profit: {result['profit']:+.2f} units (payout {payout * 100:.0f}%, expiry {expiry}m, MTG {mtg})")
             print("="*50 + "\n")
             
         except Exception as e:
             print(f"❌ Backtest error: {e}\n")
     
-    async def check_result(self, pair: str, direction: str, entry_time: str) -> str:
-        """Check if prediction was correct after 1 minute, with MTG logic"""
+    async def optimize(self, days: int = 14, train_days: int = 5, test_days: int = 1, samples: int = 0,
+                       expiry: int = 1, payout: float = 0.8, mtg: int = 1, apply: bool = True):
+        """
+        Tune wick_limit and body_strength_threshold on stored history of all pairs
+        Grid sweep (or `samples` random sets), walk-forward train/test on a process pool
+        apply: use the parameters picked on the most recent train window
+        """
+        print(f"\n🔧 OPTIMIZING {len(self.pairs)} pairs - Last {days} days")
+        print("="*50)
+        
+        end_time = int(time.time() // 60 * 60)
+        start_time = end_time - days * 86400
+        # Sync the local candle store once; workers read it from disk
+        await self.client.get_candles_many(self.pairs, 60, days * 86400, end_time)
+        
+        space = {
+            "wick_limit": [2.0, 2.5, 3.0, 3.5, 4.0, 4.5],
+            "body_strength_threshold": [0.3, 0.35, 0.4, 0.45, 0.5, 0.6],
+        }
+        if samples:
+            space = {name: (min(values), max(values)) for name, values in space.items()}
+            parameter_sets = random_parameters(space, samples)
+        else:
+            parameter_sets = parameter_grid(space)
+        
+        optimizer = Optimizer(
+            TitanXStrategy,
+            self.client.candle_store,
+            min_confidence=0.4,
+            expiry=expiry,
+            payout=payout,
+            mtg=mtg,
+            ties="loss"
+        )
+        started = time.perf_counter()
+        report = await asyncio.to_thread(
+            optimizer.optimize,
+            parameter_sets,
+            self.pairs,
+            start_time,
+            end_time,
+            train=train_days * 86400,
+            test=test_days * 86400
+        )
+        elapsed = time.perf_counter() - started
+        
+        # Without walk-forward folds (range shorter than train + test) only train metrics exist
+        walk_forward = bool(report.get("folds"))
+        column = "test" if walk_forward else "train"
+        ranked = sorted(report["results"], key=lambda r: r[column]["expectancy"], reverse=True)
+        print(f"{column.upper()} metrics")
+        print(f"{'wick':>6}{'body':>7}{'signals':>9}{'win %':>8}{'expect.':>9}")
+        for row in ranked[:10]:
+            params, result = row["params"], row[column]
+            print(f"{params['wick_limit']:>6.2f}{params['body_strength_threshold']:>7.2f}"
+                  f"{result['signals']:>9}{result['win_rate'] * 100:>8.1f}{result['expectancy']:>+9.3f}")
+        if walk_forward:
+            oos = report["walk_forward"]
+            print(f"🧪 Walk-forward: {len(report['folds'])} folds, {oos['signals']} signals, "
+                  f"{oos['win_rate'] * 100:.1f}% win, {oos['expectancy']:+.3f} per trade")
+        else:
+            print(f"⚠️ No walk-forward fold: {days} days do not cover {train_days}+{test_days} days "
+                  f"with enough signals; metrics above are in-sample")
+        print(f"⏱️ {len(parameter_sets)} parameter sets in {elapsed:.1f}s")
+        
+        if apply and walk_forward:
+            best = report["folds"][-1]["params"]
+            self.strategy.apply_parameters(best)
+            print(f"✅ Applied wick_limit={best['wick_limit']:.2f} "
+                  f"body_strength_threshold={best['body_strength_threshold']:.2f}")
+        print("="*50 + "\n")
+        return report
+    
+    async def wait_for_candle(self, pair: str, candle_ts: int, period: int = 60) -> Optional[Dict]:
+        """
+        Closed candle starting at candle_ts, taken from the tick stream as soon
+        as it closes; falls back to the history API if no close arrives in time
+        """
+        for bar in reversed(self.client.get_realtime_bars(pair, period)):
+            if bar['time'] == candle_ts:
+                return bar
+        deadline = candle_ts + period + 15
+        while (remaining := deadline - time.time()) > 0:
+            try:
+                bar = await self.client.wait_candle_close(pair, period, timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if bar['time'] == candle_ts:
+                return bar
+            if bar['time'] > candle_ts:
+                break
+        for candle in reversed(await self.get_candles(pair, 3, period)):
+            if candle['time'] == candle_ts:
+                return candle
+        return None
+    
+    async def check_result(self, pair: str, direction: str, entry_ts: int) -> str:
+        """Check if prediction was correct on the entry candle close, with MTG logic"""
         try:
-            # Wait for the candle to close (wait until next minute + 5 seconds buffer)
-            now = datetime.now()
-            entry_dt = datetime.strptime(entry_time, "%H:%M").replace(year=now.year, month=now.month, day=now.day)
-            wait_until = entry_dt.replace(second=5, microsecond=0)
-            from datetime import timedelta
-            wait_until = wait_until + timedelta(minutes=1)
-            
-            wait_seconds = (wait_until - now).total_seconds()
-            if wait_seconds > 0:
-                print(f"⏳ Waiting {int(wait_seconds)} seconds for candle to close...")
-                await asyncio.sleep(wait_seconds)
-            
-            # Fetch the result candle
-            candles = await self.get_candles(pair, 2)
-            if not candles or len(candles) < 1:
-                return "UNKNOWN"
+            self.client.subscribe_realtime_candles(pair)
             
-            result_candle = candles[-1]
-            
-            # Check if prediction was correct
-            first_result = None
-            if direction == "CALL":
-                if result_candle['close'] > result_candle['open']:
-                    first_result = "WIN"
-                else:
-                    first_result = "LOSS"
-            elif direction == "PUT":
-                if result_candle['close'] < result_candle['open']:
-                    first_result = "WIN"
-                else:
-                    first_result = "LOSS"
-            
-            # If first candle is WIN, return immediately
-            if first_result == "WIN":
-                return "WIN"
-            
-            # If first candle is LOSS, check next candle for MTG
-            if first_result == "LOSS":
-                print("⚠️ First candle LOSS, checking MTG...")
-                
-                # Wait for next candle to close
-                await asyncio.sleep(65)  # Wait 65 seconds for next candle
+            for attempt, candle_ts in enumerate((entry_ts, entry_ts + 60)):
+                candle = await self.wait_for_candle(pair, candle_ts)
+                if candle is None:
+                    return "UNKNOWN" if attempt == 0 else "LOSS"
                 
-                # Fetch candles again
-                candles = await self.get_candles(pair, 2)
-                if not candles or len(candles) < 1:
-                    return "LOSS"
-                
-                mtg_candle = candles[-1]
-                
-                # Check MTG candle
                 if direction == "CALL":
-                    if mtg_candle['close'] > mtg_candle['open']:
-                        print("✅ MTG WIN!")
-                        return "MTG WIN"
-                    else:
-                        print("❌ MTG LOSS")
-                        return "LOSS"
-                elif direction == "PUT":
-                    if mtg_candle['close'] < mtg_candle['open']:
+                    won = candle['close'] > candle['open']
+                else:
+                    won = candle['close'] < candle['open']
+                
+                if won:
+                    if attempt:
                         print("✅ MTG WIN!")
                         return "MTG WIN"
-                    else:
-                        print("❌ MTG LOSS")
-                        return "LOSS"
+                    return "WIN"
+                
+                if attempt == 0:
+                    # If first candle is LOSS, check next candle for MTG
+                    print(f"⚠️ {pair}: first candle LOSS, checking MTG...")
             
-            return "UNKNOWN"
+            print("❌ MTG LOSS")
+            return "LOSS"
             
         except Exception as e:
             print(f"❌ Error checking result: {e}")
             return "UNKNOWN"
     
     async def scan_all_pairs(self):
-        """Scan all pairs for signals"""
+        """Scan all pairs concurrently; signals are tracked by detached tasks"""
         print("🔍 Scanning pairs with STRATEGY TITAN-X...")
+        started = time.perf_counter()
         
-        for i, pair in enumerate(self.pairs, 1):
-            print(f"   [{i}/{len(self.pairs)}] Scanning {pair}...", end="\r")
-            signal_data = await self.scan_pair(pair)
+        async def scan(pair):
+            async with self.scan_semaphore:
+                return pair, await self.scan_pair(pair)
+        
+        # Pairs with a trade still running are skipped until it resolves
+        pairs = [pair for pair in self.pairs if pair not in self.tracked_pairs]
+        results = await asyncio.gather(*(scan(pair) for pair in pairs))
+        
+        signals = 0
+        for pair, signal_data in results:
             if signal_data:
-                signal, signal_telegram, direction, entry_time = signal_data
-                print(signal)
+                signals += 1
+                self.start_tracking(pair, signal_data)
+        
+        elapsed = time.perf_counter() - started
+        print(f"\n✅ Scan complete - checked {len(pairs)} pairs in {elapsed:.2f}s, "
+              f"{signals} signals, {len(self.result_tasks)} trades tracked\n")
+    
+    async def on_candle_close(self, event: Dict):
+        """Scan one pair when its 1M candle closes (scheduled by run_continuous)"""
+        pair = event['asset']
+        if pair in self.tracked_pairs:
+            return
+        async with self.scan_semaphore:
+            signal_data = await self.scan_pair(pair)
+        if signal_data and pair not in self.tracked_pairs:
+            self.start_tracking(pair, signal_data)
+    
+    def start_tracking(self, pair: str, signal_data: Tuple[str, str, str, str, int]):
+        """Track a signal in a detached task so scanning never waits on it"""
+        self.tracked_pairs.add(pair)
+        task = asyncio.create_task(self.track_signal(pair, signal_data))
+        self.result_tasks.add(task)
+        task.add_done_callback(self.result_tasks.discard)
+    
+    async def track_signal(self, pair: str, signal_data: Tuple[str, str, str, str, int]):
+        """Publish a signal and record its result once the entry (and MTG) candle closes"""
+        signal, signal_telegram, direction, entry_time, entry_ts = signal_data
+        try:
+            print(signal)
+            print("\n" + "="*50 + "\n")
+            
+            # Send signal to Telegram with premium emojis
+            await self.telegram.send_message(signal_telegram)
+            
+            # Check result
+            result = await self.check_result(pair, direction, entry_ts)
+            
+            if result == "WIN" or result == "MTG WIN":
+                self.wins += 1
+                if pair not in self.pair_stats:
+                    self.pair_stats[pair] = {"wins": 0, "losses": 0}
+                self.pair_stats[pair]["wins"] += 1
+                self.strategy.win_rate_history.append(1)
+            elif result == "LOSS":
+                self.losses += 1
+                if pair not in self.pair_stats:
+                    self.pair_stats[pair] = {"wins": 0, "losses": 0}
+                self.pair_stats[pair]["losses"] += 1
+                self.strategy.win_rate_history.append(0)
+            
+            # Update pair performance
+            self.update_pair_performance(pair, result)
+            
+            # Save trade to history
+            self.trade_history.append({
+                'time': entry_time,
+                'pair': pair,
+                'direction': direction,
+                'result': result
+            })
+            
+            # Adapt thresholds based on performance
+            self.strategy.adapt_thresholds()
+            
+            # Show result
+            if result != "UNKNOWN":
+                pair_wins = self.pair_stats[pair]["wins"]
+                pair_losses = self.pair_stats[pair]["losses"]
+                result_msg = SignalFormatter.format_result(pair, entry_time, result, self.wins, self.losses, pair_wins, pair_losses)
+                print(result_msg)
                 print("\n" + "="*50 + "\n")
                 
-                # Send signal to Telegram with premium emojis
-                await self.telegram.send_message(signal_telegram)
-                
-                # Check result
-                result = await self.check_result(pair, direction, entry_time)
-                
-                if result == "WIN" or result == "MTG WIN":
-                    self.wins += 1
-                    if pair not in self.pair_stats:
-                        self.pair_stats[pair] = {"wins": 0, "losses": 0}
-                    self.pair_stats[pair]["wins"] += 1
-                    self.strategy.win_rate_history.append(1)
-                elif result == "LOSS":
-                    self.losses += 1
-                    if pair not in self.pair_stats:
-                        self.pair_stats[pair] = {"wins": 0, "losses": 0}
-                    self.pair_stats[pair]["losses"] += 1
-                    self.strategy.win_rate_history.append(0)
-                
-                # Update pair performance
-                self.update_pair_performance(pair, result)
-                
-                # Save trade to history
-                self.trade_history.append({
-                    'time': entry_time,
-                    'pair': pair,
-                    'direction': direction,
-                    'result': result
-                })
-                
-                # Adapt thresholds based on performance
-                self.strategy.adapt_thresholds()
-                
-                # Show result
-                if result != "UNKNOWN":
-                    pair_wins = self.pair_stats[pair]["wins"]
-                    pair_losses = self.pair_stats[pair]["losses"]
-                    result_msg = SignalFormatter.format_result(pair, entry_time, result, self.wins, self.losses, pair_wins, pair_losses)
-                    print(result_msg)
-                    print("\n" + "="*50 + "\n")
-                    
-                    # Send result to Telegram
-                    await self.telegram.send_message(result_msg)
-                
-                # Don't return, continue scanning for more signals
-            
-            # Small delay between pairs
-            await asyncio.sleep(0.3)
-        
-        print(f"\n✅ Scan complete - checked {len(self.pairs)} pairs\n")
+                # Send result to Telegram
+                await self.telegram.send_message(result_msg)
+        except Exception as e:
+            print(f"❌ Error tracking {pair}: {e}")
+        finally:
+            self.tracked_pairs.discard(pair)
     
-    async def run_continuous(self, interval: int = 5):
-        """Run bot continuously"""
+    async def run_continuous(self, timeframe: int = 60, offset: float = 0):
+        """
+        Run bot continuously: every pair is scanned once per candle, when the
+        candle closes on the server clock (or offset seconds before the close)
+        """
         print("🚀 STRATEGY TITAN-X Bot Started!")
         print(f"📊 Monitoring {len(self.pairs)} pairs")
-        print(f"⏰ Scan interval: {interval} seconds\n")
+        print(f"⏰ Scanning at every {timeframe}s candle close" + (f" - {offset}s" if offset else "") + "\n")
         
-        scan_count = 0
+        jobs = [
+            self.client.schedule_strategy(pair, timeframe, self.on_candle_close, offset=offset)
+            for pair in self.pairs
+        ]
+        # Show pair ranking every 20 candles
+        jobs.append(self.client.schedule_strategy(None, timeframe * 20, lambda event: self.show_pair_ranking()))
         
-        while True:
-            try:
-                await self.scan_all_pairs()
-                scan_count += 1
-                
-                # Show pair ranking every 20 scans
-                if scan_count % 20 == 0:
-                    self.show_pair_ranking()
-                
-                # Small delay before next scan
-                await asyncio.sleep(interval)
-                
-            except KeyboardInterrupt:
-                print("\n🛑 Bot stopped by user")
-                self.show_session_summary()
-                self.show_pair_ranking()
-                if self.client:
-                    await self.client.close()
-                break
-            except Exception as e:
-                print(f"❌ Error in main loop: {e}")
-                await asyncio.sleep(5)
+        try:
+            await self.client.scheduler.start()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\n🛑 Bot stopped by user")
+            self.show_session_summary()
+            self.show_pair_ranking()
+        finally:
+            for job in jobs:
+                self.client.unschedule_strategy(job)
+            for task in list(self.result_tasks):
+                task.cancel()
+            if self.client:
+                await self.client.close()
 
 
 async def main():
@@ -959,8 +1203,11 @@ async def main():
     # Uncomment to run backtest on a pair
     # await bot.backtest("EURUSD_otc", days=7)
     
-    # Run continuous mode (5 second interval)
-    await bot.run_continuous(5)
+    # Uncomment to tune the strategy thresholds on all pairs
+    # await bot.optimize(days=14)
+    
+    # Run continuous mode (scan at every 1M candle close)
+    await bot.run_continuous(60)
 
 
 if __name__ == "__main__":